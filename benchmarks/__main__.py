@@ -0,0 +1,109 @@
+"""
+Запуск набора замеров производительности
+
+Примеры:
+    python -m benchmarks
+    python -m benchmarks --count 1000 10000 --kind random dense --case sub split
+    python -m benchmarks --save benchmarks/results/local.json
+    python -m benchmarks --compare benchmarks/results/baseline.json
+
+Время каждого замера — минимальное из --repeat запусков. При сравнении с сохраненными
+результатами замеры, ставшие медленнее более чем в --threshold раз, отмечаются как
+регрессия, а программа завершается с кодом 1.
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+
+from benchmarks.generators import GENERATORS
+from benchmarks.suite import CASES
+
+
+def measure(func, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def run(cases, kinds, counts, repeat: int, seed: int) -> dict:
+    results = {}
+    for count in counts:
+        for kind in kinds:
+            period1 = GENERATORS[kind](count, seed=seed)
+            period2 = GENERATORS[kind](count, seed=seed + 1)
+
+            for name in cases:
+                bench = CASES[name]
+                if count > bench.max_count:
+                    continue
+
+                key = '{}/{}/{}'.format(name, kind, count)
+                results[key] = measure(bench.setup(period1, period2), repeat)
+                print('{:<40} {:>12.6f} s'.format(key, results[key]), flush=True)
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    print()
+    print('{:<40} {:>12} {:>12} {:>8}'.format('case', 'baseline', 'current', 'ratio'))
+
+    regression = False
+    for key, current in results.items():
+        if key not in baseline:
+            continue
+
+        ratio = current / baseline[key] if baseline[key] else float('inf')
+        mark = ''
+        if ratio > threshold:
+            mark = ' REGRESSION'
+            regression = True
+
+        print('{:<40} {:>12.6f} {:>12.6f} {:>8.2f}{}'.format(key, baseline[key], current, ratio, mark))
+
+    return regression
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('--case', nargs='+', default=list(CASES), choices=list(CASES))
+    parser.add_argument('--kind', nargs='+', default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument('--count', nargs='+', type=int, default=[1000, 10000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', help='сохранить результаты в JSON файл')
+    parser.add_argument('--compare', help='сравнить с результатами из JSON файла')
+    parser.add_argument('--threshold', type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    results = run(args.case, args.kind, args.count, args.repeat, args.seed)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'seed': args.seed,
+                'repeat': args.repeat,
+                'results': results,
+            }, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        if compare(results, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,26 @@
+"""
+Замер производительности DatePeriod.circle_sub
+
+Запуск:
+    python -m benchmarks.circle_sub [количество периодов]
+"""
+import sys
+import time
+
+from benchmarks.generators import random_calendar
+from periods.date.periods import DatePeriod
+
+
+def main(count: int = 100000):
+    period1 = random_calendar(count, seed=1, max_len=30)
+    period2 = random_calendar(count, seed=2, max_len=3)
+
+    start = time.perf_counter()
+    res = DatePeriod.circle_sub(period1, period2)
+    elapsed = time.perf_counter() - start
+
+    print('circle_sub {} x {}: {:.3f} s, {} periods'.format(count, count, elapsed, len(res)))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
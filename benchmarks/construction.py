@@ -0,0 +1,45 @@
+"""
+Замер скорости создания и занимаемой памяти для экземпляров DatePeriod
+
+Запуск:
+    python -m benchmarks.construction [количество периодов]
+"""
+import datetime
+import sys
+import time
+import tracemalloc
+
+from periods.date.periods import DatePeriod, FrozenDatePeriod
+
+BEGIN = datetime.date(1990, 1, 1)
+
+
+def measure(name: str, factory, bounds):
+    start = time.perf_counter()
+    res = [factory(b, e) for b, e in bounds]
+    elapsed = time.perf_counter() - start
+    del res
+
+    tracemalloc.start()
+    res = [factory(b, e) for b, e in bounds]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print('{:<20} {:>8.3f} s {:>12.0f} periods/s {:>8.1f} MB'.format(
+        name, elapsed, len(res) / elapsed, memory / 1024 / 1024))
+
+
+def main(count: int = 1000000):
+    bounds = [(BEGIN + datetime.timedelta(days=i % 10000), BEGIN + datetime.timedelta(days=i % 10000 + 30))
+              for i in range(count)]
+
+    ordinals = [(b.toordinal(), e.toordinal()) for b, e in bounds]
+
+    print('{} periods (memory includes the list, dates are shared)'.format(count))
+    measure('DatePeriod', DatePeriod, bounds)
+    measure('DatePeriod._new', DatePeriod._new, ordinals)
+    measure('FrozenDatePeriod', FrozenDatePeriod, bounds)
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,76 @@
+"""
+Генераторы синтетических календарей для замеров производительности
+
+Все генераторы детерминированы (зависят только от count и seed) и возвращают
+список DatePeriod, начинающийся с BEGIN.
+"""
+import datetime
+import random
+from typing import Callable, Dict, List
+
+from periods.date.periods import DatePeriod
+
+BEGIN = datetime.date(1990, 1, 1)
+
+# Ограничение разброса дат, чтобы даже при 1e6 периодов не выйти за date.max
+MAX_SPAN = 2000000
+
+
+def _make(begin: int, end: int, data=None) -> DatePeriod:
+    return DatePeriod(BEGIN + datetime.timedelta(days=begin), BEGIN + datetime.timedelta(days=end), data)
+
+
+def random_calendar(count: int, seed: int = 0, max_len: int = 60) -> List[DatePeriod]:
+    """Периоды случайной длины, равномерно разбросанные на отрезке ~10 * count дней"""
+    rnd = random.Random(seed)
+    span = min(count * 10, MAX_SPAN)
+    res = []
+    for i in range(count):
+        begin = rnd.randint(0, span)
+        res.append(_make(begin, begin + rnd.randint(0, max_len), i))
+    return res
+
+
+def dense_calendar(count: int, seed: int = 0) -> List[DatePeriod]:
+    """Длинные периоды на коротком отрезке: почти каждый период пересекается с десятками других"""
+    rnd = random.Random(seed)
+    span = min(count, MAX_SPAN)
+    res = []
+    for i in range(count):
+        begin = rnd.randint(0, span)
+        res.append(_make(begin, begin + rnd.randint(30, 365), i))
+    return res
+
+
+def disjoint_calendar(count: int, seed: int = 0) -> List[DatePeriod]:
+    """Непересекающиеся периоды, идущие друг за другом с промежутками"""
+    rnd = random.Random(seed)
+    step = max(2, min(20, MAX_SPAN // max(count, 1)))
+    half = step // 2
+    res = []
+    for i in range(count):
+        begin = i * step + rnd.randrange(half)
+        res.append(_make(begin, begin + rnd.randrange(half), i))
+    rnd.shuffle(res)
+    return res
+
+
+def nested_calendar(count: int, seed: int = 0, depth: int = 10) -> List[DatePeriod]:
+    """Группы вложенных друг в друга периодов (глубина вложенности depth)"""
+    rnd = random.Random(seed)
+    width = 2 * depth
+    res = []
+    for i in range(count):
+        group, level = divmod(i, depth)
+        begin = group * (width + 2) + level
+        res.append(_make(begin, begin + width - level * 2, i))
+    rnd.shuffle(res)
+    return res
+
+
+GENERATORS: Dict[str, Callable[..., List[DatePeriod]]] = {
+    'random': random_calendar,
+    'dense': dense_calendar,
+    'disjoint': disjoint_calendar,
+    'nested': nested_calendar,
+}
@@ -0,0 +1,40 @@
+"""
+Замер производительности DatePeriod.split и DatePeriod.__sub__
+
+Запуск:
+    python -m benchmarks.split [количество периодов]
+"""
+import datetime
+import gc
+import sys
+import time
+
+from benchmarks.generators import dense_calendar
+from periods.date.periods import DatePeriod
+
+
+def measure(name: str, func, period1, period2):
+    # Как и в timeit, сборщик мусора отключается, чтобы не замерять его работу
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        res = [func(p1, p2) for p1, p2 in zip(period1, period2)]
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+
+    print('{} {}: {:.3f} s, {} periods'.format(name, len(period1), elapsed, sum(len(x) for x in res)))
+
+
+def main(count: int = 1000000):
+    period1 = dense_calendar(count, seed=1)
+    # Каждый период второго набора сдвинут на половину длины первого, чтобы периоды пересекались
+    period2 = [DatePeriod(p.begin + datetime.timedelta(days=len(p) // 2 + 1),
+                          p.end + datetime.timedelta(days=len(p) // 2 + 1)) for p in period1]
+
+    measure('split', DatePeriod.split, period1, period2)
+    measure('sub', DatePeriod.__sub__, period1, period2)
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,212 @@
+"""
+Набор замеров производительности
+
+Каждый замер регистрируется декоратором case. Функция замера получает два
+календаря одного вида (см. benchmarks.generators) и возвращает функцию без
+аргументов, время выполнения которой и измеряется. Подготовка данных в замер
+не входит.
+"""
+from typing import Callable, Dict, List, NamedTuple
+
+from periods.date.arrays import PeriodArray
+from periods.date.buckets import BucketIndex
+from periods.date.index import IntervalIndex
+from periods.date.periods import DatePeriod
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable[[List[DatePeriod], List[DatePeriod]], Callable[[], object]]
+    max_count: int
+
+
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str, max_count: int = 1000000):
+    """
+    Регистрация замера.
+
+    max_count ограничивает размер календаря для операций, сложность которых
+    не позволяет выполнить их на больших объемах за разумное время.
+    """
+    def decorator(func):
+        CASES[name] = Case(name, func, max_count)
+        return func
+
+    return decorator
+
+
+# ---------------------------------------------Создание------------------------------------
+
+@case('init')
+def bench_init(period1, period2):
+    bounds = [(p.begin, p.end) for p in period1]
+    return lambda: [DatePeriod(b, e) for b, e in bounds]
+
+
+# ---------------------------------------------Операторы------------------------------------
+
+@case('contains')
+def bench_contains(period1, period2):
+    return lambda: [p2 in p1 for p1, p2 in zip(period1, period2)]
+
+
+@case('lt')
+def bench_lt(period1, period2):
+    return lambda: [p1 < p2 for p1, p2 in zip(period1, period2)]
+
+
+@case('le')
+def bench_le(period1, period2):
+    return lambda: [p1 <= p2 for p1, p2 in zip(period1, period2)]
+
+
+@case('gt')
+def bench_gt(period1, period2):
+    return lambda: [p1 > p2 for p1, p2 in zip(period1, period2)]
+
+
+@case('ge')
+def bench_ge(period1, period2):
+    return lambda: [p1 >= p2 for p1, p2 in zip(period1, period2)]
+
+
+@case('eq')
+def bench_eq(period1, period2):
+    return lambda: [p1 == p2 for p1, p2 in zip(period1, period2)]
+
+
+@case('len')
+def bench_len(period1, period2):
+    return lambda: [len(p1) for p1 in period1]
+
+
+@case('hash')
+def bench_hash(period1, period2):
+    return lambda: [hash(p1) for p1 in period1]
+
+
+@case('iter', max_count=100000)
+def bench_iter(period1, period2):
+    return lambda: [d for p1 in period1 for d in p1]
+
+
+@case('add')
+def bench_add(period1, period2):
+    return lambda: [p1 + p2 for p1, p2 in zip(period1, period2)]
+
+
+@case('sub')
+def bench_sub(period1, period2):
+    return lambda: [p1 - p2 for p1, p2 in zip(period1, period2)]
+
+
+# ---------------------------------------------Методы------------------------------------
+
+@case('split')
+def bench_split(period1, period2):
+    return lambda: [p1.split(p2) for p1, p2 in zip(period1, period2)]
+
+
+@case('is_crossing')
+def bench_is_crossing(period1, period2):
+    return lambda: [p1.is_crossing(p2) for p1, p2 in zip(period1, period2)]
+
+
+@case('crossing')
+def bench_crossing(period1, period2):
+    return lambda: [p1.crossing(p2) for p1, p2 in zip(period1, period2)]
+
+
+# ---------------------------------------------Циклические операции------------------------------------
+
+@case('merge')
+def bench_merge(period1, period2):
+    return lambda: list(DatePeriod.merge(period1))
+
+
+@case('circle_sub')
+def bench_circle_sub(period1, period2):
+    return lambda: DatePeriod.circle_sub(period1, period2)
+
+
+@case('circle_crossing', max_count=10000)
+def bench_circle_crossing(period1, period2):
+    return lambda: DatePeriod.circle_crossing(period1, period2)
+
+
+@case('crossing_pairs', max_count=10000)
+def bench_crossing_pairs(period1, period2):
+    return lambda: DatePeriod.crossing_pairs(period1, period2)
+
+
+@case('circle_add', max_count=1000)
+def bench_circle_add(period1, period2):
+    return lambda: DatePeriod.circle_add(period1, period2)
+
+
+# ---------------------------------------------Потоковые циклические операции------------------------------------
+
+
+def _sorted_pair(period1, period2):
+    return sorted(period1, key=lambda x: x.begin), sorted(period2, key=lambda x: x.begin)
+
+
+@case('iter_circle_sub')
+def bench_iter_circle_sub(period1, period2):
+    period1, period2 = _sorted_pair(period1, period2)
+    return lambda: list(DatePeriod.iter_circle_sub(period1, period2))
+
+
+@case('iter_circle_crossing')
+def bench_iter_circle_crossing(period1, period2):
+    period1, period2 = _sorted_pair(period1, period2)
+    return lambda: list(DatePeriod.iter_circle_crossing(period1, period2))
+
+
+@case('iter_circle_add')
+def bench_iter_circle_add(period1, period2):
+    period1, period2 = _sorted_pair(period1, period2)
+    return lambda: list(DatePeriod.iter_circle_add(period1, period2))
+
+
+# ---------------------------------------------Сортировка------------------------------------
+
+@case('sort_lambda')
+def bench_sort_lambda(period1, period2):
+    return lambda: sorted(period1, key=lambda x: (x.begin, x.end))
+
+
+@case('sort_key')
+def bench_sort_key(period1, period2):
+    return lambda: sorted(period1, key=DatePeriod.sort_key)
+
+
+@case('sort_period_array')
+def bench_sort_period_array(period1, period2):
+    array = PeriodArray.from_periods(period1)
+    return lambda: array.argsort()
+
+
+# ---------------------------------------------Поиск периодов по дате------------------------------------
+
+@case('interval_index_containing')
+def bench_interval_index_containing(period1, period2):
+    index = IntervalIndex(period1, seed=1)
+    days = [p.begin for p in period2]
+    return lambda: [index.containing(day) for day in days]
+
+
+@case('bucket_index_containing')
+def bench_bucket_index_containing(period1, period2):
+    index = BucketIndex(period1)
+    days = [p.begin for p in period2]
+    return lambda: [index.containing(day) for day in days]
+
+
+@case('bucket_index_lookup_many')
+def bench_bucket_index_lookup_many(period1, period2):
+    index = BucketIndex(period1)
+    days = [p.begin for p in period2]
+    return lambda: index.lookup_many(days)
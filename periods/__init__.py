@@ -1 +1,2 @@
 from .date import *
+from .datetime import *
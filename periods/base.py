@@ -1,3 +1,4 @@
+import enum
 from abc import ABC, abstractmethod
 from typing import TypeVar, Any, Union
 
@@ -5,7 +6,32 @@ PERIOD_TYPE = TypeVar('PERIOD_TYPE')
 ITEM_TYPE = Union[PERIOD_TYPE, 'Period']
 
 
+class Relation(enum.IntEnum):
+    """
+    Взаимное расположение двух периодов (отношения интервалов Аллена).
+
+    Отношение описывает положение периода self относительно периода other.
+    Границы периодов входят в период, поэтому MEETS / MET_BY означают,
+    что периоды не пересекаются, но идут друг за другом без промежутка.
+    """
+    BEFORE = 0          # self закончился раньше начала other, между ними есть промежуток
+    MEETS = 1           # self закончился непосредственно перед началом other
+    OVERLAPS = 2        # self начался раньше other и закончился внутри other
+    FINISHED_BY = 3     # self начался раньше other, окончания совпадают
+    CONTAINS = 4        # other полностью внутри self, границы не совпадают
+    STARTS = 5          # начала совпадают, self закончился раньше other
+    EQUALS = 6          # периоды идентичны
+    STARTED_BY = 7      # начала совпадают, self закончился позже other
+    DURING = 8          # self полностью внутри other, границы не совпадают
+    FINISHES = 9        # self начался позже other, окончания совпадают
+    OVERLAPPED_BY = 10  # self начался внутри other и закончился позже other
+    MET_BY = 11         # self начался непосредственно после окончания other
+    AFTER = 12          # self начался позже окончания other, между ними есть промежуток
+
+
 class Period(ABC):
+    __slots__ = ()
+
     begin: PERIOD_TYPE
     end: PERIOD_TYPE
 
@@ -63,3 +89,12 @@ class Period(ABC):
     @abstractmethod
     def __hash__(self):
         pass
+
+    def relation(self, other: 'Period') -> Relation:
+        """
+        Взаимное расположение данного периода (self) относительно переданного периода (other).
+
+        Не является абстрактным методом, чтобы существующие подклассы Period
+        без relation по-прежнему можно было создавать.
+        """
+        raise NotImplementedError
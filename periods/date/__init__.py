@@ -1 +1,13 @@
-from .periods import DatePeriod
+from .periods import DatePeriod, FrozenDatePeriod, InvalidRowsError, sort_periods
+from .index import IntervalIndex
+from .buckets import BucketIndex
+from .arrays import PeriodArray
+from .sets import PeriodSet, MutablePeriodSet, PeriodSetChange
+from .binary import PeriodBuffer
+from .store import PeriodStore
+from .ranges import DateRange
+from .coverages import Coverage, coverage
+from .slots import free_slots
+from .profiling import Profiler, profile
+from .batch import batch_circle_sub, batch_circle_crossing, batch_circle_add
+from .aio import async_circle_sub, async_circle_crossing, async_circle_add
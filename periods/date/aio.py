@@ -0,0 +1,131 @@
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Callable, List, Optional
+
+from periods.date.periods import DatePeriod, CLASS_ITEM_TYPE
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_OFFLOAD_THRESHOLD = 100000
+
+
+def _check_chunk_size(chunk_size: int):
+    if not isinstance(chunk_size, int):
+        raise TypeError
+
+    if chunk_size < 1:
+        raise ValueError('Wrong chunk size')
+
+
+async def _offload(func: Callable[..., List[CLASS_ITEM_TYPE]], period1: List[CLASS_ITEM_TYPE],
+                   period2: List[CLASS_ITEM_TYPE], executor: Optional[Executor]) -> List[CLASS_ITEM_TYPE]:
+    """Выполнение операции в executor (None — пул потоков цикла событий по умолчанию)"""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, period1, period2))
+
+
+def _should_offload(period1: List[CLASS_ITEM_TYPE], period2: List[CLASS_ITEM_TYPE],
+                    offload_threshold: Optional[int]) -> bool:
+    return offload_threshold is not None and len(period1) + len(period2) > offload_threshold
+
+
+async def async_circle_sub(period1: List[CLASS_ITEM_TYPE], period2: List[CLASS_ITEM_TYPE],
+                           chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           offload_threshold: Optional[int] = DEFAULT_OFFLOAD_THRESHOLD,
+                           executor: Optional[Executor] = None) -> List[CLASS_ITEM_TYPE]:
+    """
+    Асинхронное циклическое вычитание периодов для вызова из корутин.
+
+    Результат совпадает с DatePeriod.circle_sub(period1, period2). Если суммарное количество
+    периодов больше offload_threshold, то операция целиком выполняется в executor
+    (по умолчанию — executor цикла событий), иначе — в цикле событий частями
+    по chunk_size периодов, между которыми управление возвращается циклу событий.
+    offload_threshold=None отключает выполнение в executor.
+
+    Операции выполняются на чистом Python и не освобождают GIL, поэтому в executor
+    по умолчанию (пул потоков) они по-прежнему конкурируют с циклом событий за GIL.
+    Чтобы действительно разгрузить цикл событий, нужно передать ProcessPoolExecutor:
+    тогда периоды и атрибуты data передаются в процесс через pickle, а результат
+    состоит из копий периодов.
+
+    Пока операция не завершена, period1 и period2 нельзя изменять.
+    """
+    _check_chunk_size(chunk_size)
+
+    if not period1 or not period2:
+        return DatePeriod.circle_sub(period1, period2)
+
+    if _should_offload(period1, period2, offload_threshold):
+        return await _offload(DatePeriod.circle_sub, period1, period2, executor)
+
+    begins, ends = DatePeriod._union_bounds(period2)
+    await asyncio.sleep(0)
+
+    res = []
+    for position in range(0, len(period1), chunk_size):
+        res.extend(DatePeriod._sub_bounds(period1[position:position + chunk_size], begins, ends))
+        await asyncio.sleep(0)
+
+    return res
+
+
+async def async_circle_crossing(period1: List[CLASS_ITEM_TYPE], period2: List[CLASS_ITEM_TYPE],
+                                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                offload_threshold: Optional[int] = DEFAULT_OFFLOAD_THRESHOLD,
+                                executor: Optional[Executor] = None) -> List[CLASS_ITEM_TYPE]:
+    """
+    Асинхронное циклическое пересечение периодов, результат совпадает с DatePeriod.circle_crossing.
+
+    Параметры такие же, как у async_circle_sub.
+    """
+    _check_chunk_size(chunk_size)
+
+    if not period1 or not period2:
+        return DatePeriod.circle_crossing(period1, period2)
+
+    if _should_offload(period1, period2, offload_threshold):
+        return await _offload(DatePeriod.circle_crossing, period1, period2, executor)
+
+    found = []
+    for _ in DatePeriod._crossing_sweep(period1, period2, found, chunk_size):
+        await asyncio.sleep(0)
+
+    # Периоды создаются частями примерно по chunk_size пересечений
+    res = []
+    start = count = 0
+    for i, items in enumerate(found, 1):
+        count += len(items) + 1
+        if count >= chunk_size or i == len(found):
+            res.extend(DatePeriod._crossing_results(period1[start:i], period2, found[start:i]))
+            start, count = i, 0
+            await asyncio.sleep(0)
+
+    return res
+
+
+async def async_circle_add(period1: List[CLASS_ITEM_TYPE], period2: List[CLASS_ITEM_TYPE],
+                           chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           offload_threshold: Optional[int] = DEFAULT_OFFLOAD_THRESHOLD,
+                           executor: Optional[Executor] = None) -> List[CLASS_ITEM_TYPE]:
+    """
+    Асинхронное циклическое сложение периодов, результат совпадает с DatePeriod.circle_add.
+
+    Параметры такие же, как у async_circle_sub. circle_add перебирает все пары периодов,
+    поэтому period1 обрабатывается частями по max(1, chunk_size // len(period2)) периодов.
+    """
+    _check_chunk_size(chunk_size)
+
+    if not period1 or not period2:
+        return DatePeriod.circle_add(period1, period2)
+
+    if _should_offload(period1, period2, offload_threshold):
+        return await _offload(DatePeriod.circle_add, period1, period2, executor)
+
+    step = max(1, chunk_size // len(period2))
+
+    res = []
+    for position in range(0, len(period1), step):
+        res.extend(DatePeriod.circle_add(period1[position:position + step], period2))
+        await asyncio.sleep(0)
+
+    return res
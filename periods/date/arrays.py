@@ -0,0 +1,192 @@
+import array
+import datetime
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Union
+
+from periods.date.periods import DatePeriod, FULL_ITEM_TYPE, CLASS_ITEM_TYPE, _SORT_KEY_SHIFT, \
+    _MAX_ORDINAL
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MASK_TYPE = Union[List[bool], 'numpy.ndarray']
+
+
+class PeriodArray:
+    """
+    Колоночное хранилище периодов дат.
+
+    Начала и окончания периодов хранятся как порядковые номера дней (date.toordinal())
+    в массивах int32: numpy.ndarray, если установлен numpy, иначе array.array('i').
+    Атрибут data каждого периода хранится в параллельном списке.
+    Номера дней должны быть в диапазоне 1..date.max.toordinal(), иначе вызывается ValueError.
+
+    Операции is_crossing, crossing и contains выполняются сразу над всем массивом
+    и повторяют семантику одноименных методов DatePeriod.
+    """
+
+    __slots__ = ('begins', 'ends', 'data', '_numpy')
+
+    def __init__(self, begins: Iterable[int], ends: Iterable[int], data: Optional[Sequence[Any]] = None,
+                 use_numpy: Optional[bool] = None):
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ImportError('numpy is not installed')
+
+        self._numpy = use_numpy
+
+        if use_numpy:
+            self.begins = numpy.asarray(begins, dtype=numpy.int32)
+            self.ends = numpy.asarray(ends, dtype=numpy.int32)
+        else:
+            self.begins = array.array('i', begins)
+            self.ends = array.array('i', ends)
+
+        if len(self.begins) != len(self.ends):
+            raise ValueError('Wrong length')
+
+        if data is None:
+            self.data = [None] * len(self.begins)
+        else:
+            self.data = list(data)
+            if len(self.data) != len(self.begins):
+                raise ValueError('Wrong length')
+
+        if use_numpy:
+            wrong = bool((self.begins > self.ends).any())
+        else:
+            wrong = any(b > e for b, e in zip(self.begins, self.ends))
+
+        if wrong:
+            raise ValueError('Wrong dates')
+
+        # При begin <= end достаточно проверить минимальное начало и максимальное окончание
+        if len(self.begins):
+            if use_numpy:
+                first, last = int(self.begins.min()), int(self.ends.max())
+            else:
+                first, last = min(self.begins), max(self.ends)
+
+            if first < 1 or last > _MAX_ORDINAL:
+                raise ValueError('Wrong ordinal')
+
+    @classmethod
+    def from_periods(cls, periods: Iterable[CLASS_ITEM_TYPE], use_numpy: Optional[bool] = None) -> 'PeriodArray':
+        """Создание массива из набора экземпляров DatePeriod"""
+        begins = []
+        ends = []
+        data = []
+
+        for p in periods:
+            if not isinstance(p, DatePeriod):
+                raise TypeError
+
+            begins.append(p._begin)
+            ends.append(p._end)
+            data.append(p.data)
+
+        return cls(begins, ends, data, use_numpy=use_numpy)
+
+    def to_periods(self) -> List[CLASS_ITEM_TYPE]:
+        """Преобразование массива в список экземпляров DatePeriod"""
+        return [DatePeriod._new(b, e, d)
+                for b, e, d in zip(self.begins.tolist(), self.ends.tolist(), self.data)]
+
+    def __len__(self):
+        return len(self.begins)
+
+    def __iter__(self) -> Iterator[CLASS_ITEM_TYPE]:
+        for b, e, d in zip(self.begins.tolist(), self.ends.tolist(), self.data):
+            yield DatePeriod._new(b, e, d)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[CLASS_ITEM_TYPE, 'PeriodArray']:
+        if isinstance(item, slice):
+            return PeriodArray(self.begins[item], self.ends[item], self.data[item], use_numpy=self._numpy)
+
+        return DatePeriod._new(int(self.begins[item]), int(self.ends[item]), self.data[item])
+
+    def argsort(self) -> Union[List[int], 'numpy.ndarray']:
+        """
+        Индексы периодов массива в порядке сортировки по (begin, end). Сортировка устойчивая.
+
+        С numpy используется numpy.lexsort по колонкам, без numpy — сортировка
+        целочисленных ключей, собранных из begin и end.
+        """
+        if self._numpy:
+            return numpy.lexsort((self.ends, self.begins))
+
+        keys = [(b << _SORT_KEY_SHIFT) | e for b, e in zip(self.begins, self.ends)]
+        return sorted(range(len(keys)), key=keys.__getitem__)
+
+    def sorted(self) -> 'PeriodArray':
+        """Новый массив, отсортированный по (begin, end)"""
+        indexes = self.argsort()
+
+        if self._numpy:
+            return PeriodArray(self.begins[indexes], self.ends[indexes],
+                               [self.data[i] for i in indexes.tolist()], use_numpy=True)
+
+        return PeriodArray([self.begins[i] for i in indexes], [self.ends[i] for i in indexes],
+                           [self.data[i] for i in indexes], use_numpy=False)
+
+    @staticmethod
+    def _bounds(item: FULL_ITEM_TYPE):
+        if isinstance(item, DatePeriod):
+            return item._begin, item._end
+        elif isinstance(item, datetime.datetime):
+            raise TypeError
+        elif isinstance(item, datetime.date):
+            ordinal = item.toordinal()
+            return ordinal, ordinal
+        else:
+            raise TypeError
+
+    def contains(self, item: FULL_ITEM_TYPE) -> MASK_TYPE:
+        """Маска периодов, в которые входит переданная дата/период (аналог item in period)"""
+        begin, end = self._bounds(item)
+
+        if self._numpy:
+            return (self.begins <= begin) & (self.ends >= end)
+
+        return [b <= begin and end <= e for b, e in zip(self.begins, self.ends)]
+
+    def __contains__(self, item: FULL_ITEM_TYPE) -> bool:
+        """Проверка того, что переданная дата/период входит хотя бы в один период массива"""
+        mask = self.contains(item)
+        return bool(mask.any()) if self._numpy else any(mask)
+
+    def is_crossing(self, period: CLASS_ITEM_TYPE) -> MASK_TYPE:
+        """Маска периодов, которые пересекаются с переданным периодом"""
+        if not isinstance(period, DatePeriod):
+            raise TypeError
+
+        begin, end = self._bounds(period)
+
+        if self._numpy:
+            return (self.begins <= end) & (self.ends >= begin)
+
+        return [b <= end and begin <= e for b, e in zip(self.begins, self.ends)]
+
+    def crossing(self, period: CLASS_ITEM_TYPE) -> 'PeriodArray':
+        """
+        Пересечения периодов массива с переданным периодом.
+
+        В результат попадают только пересекающиеся периоды, атрибут data сохраняется.
+        """
+        if not isinstance(period, DatePeriod):
+            raise TypeError
+
+        begin, end = self._bounds(period)
+
+        if self._numpy:
+            indexes = numpy.flatnonzero((self.begins <= end) & (self.ends >= begin))
+            return PeriodArray(numpy.maximum(self.begins[indexes], begin),
+                               numpy.minimum(self.ends[indexes], end),
+                               [self.data[i] for i in indexes.tolist()], use_numpy=True)
+
+        indexes = [i for i, (b, e) in enumerate(zip(self.begins, self.ends)) if b <= end and begin <= e]
+        return PeriodArray([max(self.begins[i], begin) for i in indexes],
+                           [min(self.ends[i], end) for i in indexes],
+                           [self.data[i] for i in indexes], use_numpy=False)
@@ -0,0 +1,151 @@
+import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice, repeat
+from typing import Any, Dict, Hashable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from periods.date.periods import DatePeriod, CLASS_ITEM_TYPE
+
+TASKS_TYPE = Mapping[Hashable, Tuple[Sequence[CLASS_ITEM_TYPE], Sequence[CLASS_ITEM_TYPE]]]
+RESULTS_TYPE = Dict[Hashable, List[CLASS_ITEM_TYPE]]
+
+# Упакованный список периодов: (класс, классы или None, начала, окончания, data, protect_data или None)
+PACKED_TYPE = Tuple[type, Optional[List[type]], array.array, array.array, List[Any], Optional[List[bool]]]
+
+
+def _pack(periods: Sequence[CLASS_ITEM_TYPE]) -> PACKED_TYPE:
+    """
+    Компактное представление списка периодов для передачи между процессами.
+
+    Границы передаются массивами порядковых номеров дней, а не отдельными объектами date.
+    Класс передается для каждого периода, но список классов создается, только если
+    в списке встречаются периоды разных классов.
+    """
+    cls = DatePeriod
+    classes = None
+    begins = array.array('i')
+    ends = array.array('i')
+    data = []
+    protect = None
+
+    for i, p in enumerate(periods):
+        if not isinstance(p, DatePeriod):
+            raise TypeError
+
+        if i == 0:
+            cls = type(p)
+        elif classes is None and type(p) is not cls:
+            classes = [cls] * i
+        if classes is not None:
+            classes.append(type(p))
+
+        begins.append(p._begin)
+        ends.append(p._end)
+        data.append(p.data)
+
+        if p.protect_data and protect is None:
+            protect = [False] * i
+        if protect is not None:
+            protect.append(p.protect_data)
+
+    return cls, classes, begins, ends, data, protect
+
+
+def _unpack(packed: PACKED_TYPE) -> List[CLASS_ITEM_TYPE]:
+    cls, classes, begins, ends, data, protect = packed
+    if classes is None and protect is None:
+        return [cls._new(b, e, d) for b, e, d in zip(begins, ends, data)]
+
+    if classes is None:
+        classes = repeat(cls)
+    if protect is None:
+        protect = repeat(False)
+
+    return [c._new(b, e, d, pd) for c, b, e, d, pd in zip(classes, begins, ends, data, protect)]
+
+
+def _run_chunk(operation: str, chunk: List[Tuple[Hashable, PACKED_TYPE, PACKED_TYPE]]
+               ) -> List[Tuple[Hashable, PACKED_TYPE]]:
+    """Выполнение операции над пачкой задач в процессе пула"""
+    method = getattr(DatePeriod, operation)
+    return [(key, _pack(method(_unpack(packed1), _unpack(packed2)))) for key, packed1, packed2 in chunk]
+
+
+def _chunks(tasks: TASKS_TYPE, chunk_size: int) -> Iterator[list]:
+    items = iter(tasks.items())
+    while True:
+        chunk = [(key, _pack(period1), _pack(period2)) for key, (period1, period2) in islice(items, chunk_size)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def _run_serial(operation: str, tasks: TASKS_TYPE) -> RESULTS_TYPE:
+    method = getattr(DatePeriod, operation)
+    return {key: method(period1, period2) for key, (period1, period2) in tasks.items()}
+
+
+def _run_batch(operation: str, tasks: TASKS_TYPE, max_workers: Optional[int], chunk_size: int,
+               executor: Optional[Executor]) -> RESULTS_TYPE:
+    if not isinstance(chunk_size, int):
+        raise TypeError
+
+    if chunk_size < 1:
+        raise ValueError('Wrong chunk size')
+
+    if executor is None:
+        if max_workers == 1 or len(tasks) <= chunk_size:
+            return _run_serial(operation, tasks)
+
+        try:
+            pool = ProcessPoolExecutor(max_workers)
+        except (ImportError, NotImplementedError, OSError):
+            # Платформа не поддерживает пул процессов
+            return _run_serial(operation, tasks)
+    else:
+        pool = executor
+
+    try:
+        res = {}
+        for chunk in pool.map(_run_chunk, repeat(operation), _chunks(tasks, chunk_size)):
+            for key, packed in chunk:
+                res[key] = _unpack(packed)
+        return res
+    finally:
+        if executor is None:
+            pool.shutdown()
+
+
+def batch_circle_sub(tasks: TASKS_TYPE, max_workers: Optional[int] = None, chunk_size: int = 1000,
+                     executor: Optional[Executor] = None) -> RESULTS_TYPE:
+    """
+    Пакетное циклическое вычетание периодов.
+
+    tasks — словарь key -> (period1, period2). Для каждого ключа вычисляется
+    DatePeriod.circle_sub(period1, period2), результат возвращается словарем с теми же ключами
+    в том же порядке.
+
+    Задачи делятся на пачки по chunk_size и выполняются в пуле процессов (ProcessPoolExecutor
+    с max_workers процессами или переданный executor). Периоды передаются между процессами
+    в компактном виде: массивами порядковых номеров дней и списком data, поэтому
+    атрибуты data и ключи должны поддерживать pickle.
+
+    Если max_workers = 1, задач не больше одной пачки или пул процессов недоступен на платформе,
+    то задачи выполняются последовательно в текущем процессе.
+
+    При выполнении в пуле результат состоит из новых экземпляров периодов: класс, границы, data
+    и protect_data каждого периода совпадают с последовательным выполнением, но это другие объекты,
+    т.е. сравнивать результаты нужно через ==, а не is.
+    """
+    return _run_batch('circle_sub', tasks, max_workers, chunk_size, executor)
+
+
+def batch_circle_crossing(tasks: TASKS_TYPE, max_workers: Optional[int] = None, chunk_size: int = 1000,
+                          executor: Optional[Executor] = None) -> RESULTS_TYPE:
+    """Пакетное циклическое пересечение периодов. Параметры совпадают с batch_circle_sub"""
+    return _run_batch('circle_crossing', tasks, max_workers, chunk_size, executor)
+
+
+def batch_circle_add(tasks: TASKS_TYPE, max_workers: Optional[int] = None, chunk_size: int = 1000,
+                     executor: Optional[Executor] = None) -> RESULTS_TYPE:
+    """Пакетное циклическое сложение периодов. Параметры совпадают с batch_circle_sub"""
+    return _run_batch('circle_add', tasks, max_workers, chunk_size, executor)
@@ -0,0 +1,186 @@
+import array
+import struct
+import sys
+from collections.abc import Sequence
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
+
+from periods.date.periods import DatePeriod, CLASS_ITEM_TYPE
+
+# Заголовок: сигнатура, версия формата, флаги, количество периодов (little-endian)
+_HEADER = struct.Struct('<4sHHI')
+_MAGIC = b'PRDS'
+_VERSION = 1
+# Флаг наличия таблицы смещений и блока data
+_HAS_DATA = 1
+
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+def _to_le(values: array.array) -> bytes:
+    if not _LITTLE_ENDIAN:
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le(view: memoryview, typecode: str) -> Union[memoryview, array.array]:
+    """Представление участка буфера как массива чисел. На little-endian платформах без копирования"""
+    if _LITTLE_ENDIAN:
+        return view.cast(typecode)
+
+    values = array.array(typecode, view.tobytes())
+    values.byteswap()
+    return values
+
+
+class PeriodBuffer(Sequence):
+    """
+    Двоичное представление набора периодов дат.
+
+    Формат (все числа little-endian):
+        заголовок: сигнатура b'PRDS', версия (uint16), флаги (uint16), количество периодов n (uint32)
+        n начал периодов (int32, date.toordinal())
+        n окончаний периодов (int32, date.toordinal())
+        если есть data: таблица из n + 1 смещений (uint32) и блок байтов data
+
+    from_buffer не разбирает периоды по одному: начала и окончания читаются из буфера
+    (bytes, bytearray, mmap и т.п.) через memoryview без копирования, а экземпляры DatePeriod
+    создаются только при обращении к элементу. Пока PeriodBuffer используется, переданный
+    буфер (например, mmap) нельзя закрывать. Ссылки на буфер освобождаются методом release
+    или при выходе из блока with, после чего PeriodBuffer становится пустым и буфер можно закрыть.
+    """
+
+    __slots__ = ('begins', 'ends', '_offsets', '_blob', '_decoder', '_view')
+
+    def __init__(self, begins: Union[memoryview, array.array], ends: Union[memoryview, array.array],
+                 offsets: Optional[Union[memoryview, array.array]] = None, blob: Optional[memoryview] = None,
+                 data_decoder: Optional[Callable[[bytes], Any]] = None):
+        self.begins = begins
+        self.ends = ends
+        self._offsets = offsets
+        self._blob = blob
+        self._decoder = data_decoder
+        self._view = None
+
+    @staticmethod
+    def to_bytes(periods: Iterable[CLASS_ITEM_TYPE], data_encoder: Optional[Callable[[Any], bytes]] = None) -> bytes:
+        """
+        Сериализация периодов.
+
+        Если передан data_encoder, то атрибут data каждого периода сохраняется
+        как data_encoder(data), иначе data не сохраняется.
+        """
+        begins = array.array('i')
+        ends = array.array('i')
+        chunks = []
+
+        for p in periods:
+            if not isinstance(p, DatePeriod):
+                raise TypeError
+
+            begins.append(p._begin)
+            ends.append(p._end)
+            if data_encoder is not None:
+                chunks.append(data_encoder(p.data))
+
+        parts = [_HEADER.pack(_MAGIC, _VERSION, 0 if data_encoder is None else _HAS_DATA, len(begins)),
+                 _to_le(begins), _to_le(ends)]
+
+        if data_encoder is not None:
+            offsets = array.array('I', [0])
+            for chunk in chunks:
+                offsets.append(offsets[-1] + len(chunk))
+            parts.append(_to_le(offsets))
+            parts.extend(chunks)
+
+        return b''.join(parts)
+
+    @classmethod
+    def from_buffer(cls, buffer: Any, data_decoder: Optional[Callable[[bytes], Any]] = None) -> 'PeriodBuffer':
+        """
+        Загрузка периодов из объекта с поддержкой buffer protocol (bytes, bytearray, memoryview, mmap).
+
+        Если в буфере есть data, то атрибут data периода вычисляется при обращении
+        как data_decoder(bytes), а без data_decoder — возвращаются сами байты.
+        При неверном формате вызывается ValueError.
+        """
+        view = memoryview(buffer).cast('B')
+        if len(view) < _HEADER.size:
+            raise ValueError('Wrong format')
+
+        magic, version, flags, count = _HEADER.unpack_from(view)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('Wrong format')
+
+        position = _HEADER.size
+        size = position + count * 8
+        if flags & _HAS_DATA:
+            size += (count + 1) * 4
+        if len(view) < size:
+            raise ValueError('Wrong format')
+
+        begins = _from_le(view[position:position + count * 4], 'i')
+        position += count * 4
+        ends = _from_le(view[position:position + count * 4], 'i')
+        position += count * 4
+
+        offsets = blob = None
+        if flags & _HAS_DATA:
+            offsets = _from_le(view[position:position + (count + 1) * 4], 'I')
+            position += (count + 1) * 4
+            blob = view[position:]
+            if len(blob) < offsets[count]:
+                raise ValueError('Wrong format')
+
+        res = cls(begins, ends, offsets, blob, data_decoder)
+        res._view = view
+        return res
+
+    def release(self):
+        """Освобождение всех memoryview переданного буфера. Повторный вызов ничего не делает"""
+        for view in (self.begins, self.ends, self._offsets, self._blob, self._view):
+            if isinstance(view, memoryview):
+                view.release()
+
+        self.begins = array.array('i')
+        self.ends = array.array('i')
+        self._offsets = self._blob = self._view = None
+
+    def __enter__(self) -> 'PeriodBuffer':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    def __len__(self):
+        return len(self.begins)
+
+    def _data(self, index: int) -> Any:
+        if self._offsets is None:
+            return None
+
+        value = self._blob[self._offsets[index]:self._offsets[index + 1]].tobytes()
+        return value if self._decoder is None else self._decoder(value)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[CLASS_ITEM_TYPE, List[CLASS_ITEM_TYPE]]:
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError('index out of range')
+
+        return DatePeriod._new(self.begins[item], self.ends[item], self._data(item))
+
+    def __iter__(self) -> Iterator[CLASS_ITEM_TYPE]:
+        if self._offsets is None:
+            for b, e in zip(self.begins, self.ends):
+                yield DatePeriod._new(b, e)
+        else:
+            for i, (b, e) in enumerate(zip(self.begins, self.ends)):
+                yield DatePeriod._new(b, e, self._data(i))
+
+    def to_periods(self) -> List[CLASS_ITEM_TYPE]:
+        """Преобразование в список экземпляров DatePeriod"""
+        return list(self)
@@ -0,0 +1,206 @@
+import bisect
+import datetime
+import itertools
+from typing import Iterable, Iterator, List, Optional, Union
+
+from periods.date.periods import DatePeriod, PERIOD_TYPE, CLASS_ITEM_TYPE
+
+BUCKET_SIZE_TYPE = Union[str, int]
+
+
+class _Bucket:
+    __slots__ = ('keys', 'periods')
+
+    def __init__(self):
+        # Ключи (begin, end, seq) периодов, отсортированные по возрастанию, и параллельный список периодов
+        self.keys = []
+        self.periods = []
+
+    def insert(self, key: tuple, period: CLASS_ITEM_TYPE):
+        i = bisect.bisect_left(self.keys, key)
+        self.keys.insert(i, key)
+        self.periods.insert(i, period)
+
+    def delete(self, key: tuple):
+        i = bisect.bisect_left(self.keys, key)
+        del self.keys[i]
+        del self.periods[i]
+
+    def containing(self, ordinal: int) -> List[CLASS_ITEM_TYPE]:
+        # Периоды, начавшиеся не позже ordinal, идут в начале списка
+        count = bisect.bisect_left(self.keys, (ordinal + 1,))
+        keys = self.keys
+        return [self.periods[i] for i in range(count) if keys[i][1] >= ordinal]
+
+
+class BucketIndex:
+    """
+    Индекс для поиска периодов DatePeriod, в которые входит дата.
+
+    Ось времени делится на корзины: по месяцам (bucket_size='month'), по годам
+    (bucket_size='year') или по bucket_size дней. Каждый период записывается во все
+    корзины, которых он касается. Поиск по дате выбирает корзину за O(1) и просматривает
+    только ее периоды, отсортированные по (begin, end).
+
+    Подходит для большого количества запросов к редко изменяющемуся набору коротких периодов.
+    Длинный период занимает место в каждой своей корзине, для таких наборов лучше
+    подходит IntervalIndex.
+
+    Результаты запросов возвращаются отсортированными по (begin, end).
+    """
+
+    def __init__(self, periods: Optional[Iterable[CLASS_ITEM_TYPE]] = None,
+                 bucket_size: BUCKET_SIZE_TYPE = 'month'):
+        if bucket_size == 'month':
+            self._bucket = self._month_bucket
+        elif bucket_size == 'year':
+            self._bucket = self._year_bucket
+        elif isinstance(bucket_size, int) and not isinstance(bucket_size, bool):
+            if bucket_size < 1:
+                raise ValueError('Wrong bucket size')
+            self._bucket = self._day_bucket
+        else:
+            raise ValueError('Wrong bucket size')
+
+        self.bucket_size = bucket_size
+        self._buckets = {}
+        self._keys = {}
+        self._counter = itertools.count()
+
+        if periods is not None:
+            self.update(periods)
+
+    @staticmethod
+    def _month_bucket(ordinal: int) -> int:
+        value = datetime.date.fromordinal(ordinal)
+        return value.year * 12 + value.month - 1
+
+    @staticmethod
+    def _year_bucket(ordinal: int) -> int:
+        return datetime.date.fromordinal(ordinal).year
+
+    def _day_bucket(self, ordinal: int) -> int:
+        return ordinal // self.bucket_size
+
+    def _bucket_range(self, period: CLASS_ITEM_TYPE) -> range:
+        return range(self._bucket(period._begin), self._bucket(period._end) + 1)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[CLASS_ITEM_TYPE]:
+        """Периоды индекса, отсортированные по (begin, end)"""
+        for key in sorted(self._keys):
+            yield self._keys[key]
+
+    def add(self, period: CLASS_ITEM_TYPE):
+        """Добавление периода в индекс"""
+        if not isinstance(period, DatePeriod):
+            raise TypeError
+
+        key = (period._begin, period._end, next(self._counter))
+        self._keys[key] = period
+
+        for number in self._bucket_range(period):
+            bucket = self._buckets.get(number)
+            if bucket is None:
+                bucket = self._buckets[number] = _Bucket()
+            bucket.insert(key, period)
+
+    def update(self, periods: Iterable[CLASS_ITEM_TYPE]):
+        """Добавление нескольких периодов в индекс"""
+        for period in periods:
+            self.add(period)
+
+    def _find(self, period: CLASS_ITEM_TYPE) -> Optional[tuple]:
+        """
+        Поиск ключа переданного периода.
+
+        Предпочтение отдается ключу именно этого объекта,
+        иначе возвращается первый ключ периода с такими же границами.
+        """
+        bucket = self._buckets.get(self._bucket(period._begin))
+        if bucket is None:
+            return None
+
+        found = None
+        i = bisect.bisect_left(bucket.keys, (period._begin, period._end))
+        while i < len(bucket.keys) and bucket.keys[i][:2] == (period._begin, period._end):
+            if bucket.periods[i] is period:
+                return bucket.keys[i]
+            if found is None:
+                found = bucket.keys[i]
+            i += 1
+
+        return found
+
+    def remove(self, period: CLASS_ITEM_TYPE):
+        """Удаление периода из индекса. Если период не найден, то вызывается ValueError"""
+        if not isinstance(period, DatePeriod):
+            raise TypeError
+
+        key = self._find(period)
+        if key is None:
+            raise ValueError('Period not found')
+
+        del self._keys[key]
+        for number in self._bucket_range(period):
+            bucket = self._buckets[number]
+            bucket.delete(key)
+            if not bucket.keys:
+                del self._buckets[number]
+
+    def discard(self, period: CLASS_ITEM_TYPE):
+        """Удаление периода из индекса, если он там есть"""
+        try:
+            self.remove(period)
+        except ValueError:
+            pass
+
+    @staticmethod
+    def _ordinal(item: PERIOD_TYPE) -> int:
+        # Как и в DatePeriod.__contains__, datetime не приводится к дате
+        if isinstance(item, datetime.datetime) or not isinstance(item, datetime.date):
+            raise TypeError
+
+        return item.toordinal()
+
+    def containing(self, item: PERIOD_TYPE) -> List[CLASS_ITEM_TYPE]:
+        """Периоды, в которые входит переданная дата"""
+        ordinal = self._ordinal(item)
+
+        bucket = self._buckets.get(self._bucket(ordinal))
+        if bucket is None:
+            return []
+
+        return bucket.containing(ordinal)
+
+    def lookup_many(self, items: Iterable[PERIOD_TYPE]) -> List[List[CLASS_ITEM_TYPE]]:
+        """
+        Периоды, в которые входит каждая из переданных дат.
+
+        Результат — список в порядке переданных дат. Даты группируются по корзинам,
+        поэтому каждая корзина и каждая повторяющаяся дата обрабатываются один раз.
+        """
+        ordinals = [self._ordinal(item) for item in items]
+
+        groups = {}
+        for ordinal in set(ordinals):
+            groups.setdefault(self._bucket(ordinal), []).append(ordinal)
+
+        found = {}
+        for number, group in groups.items():
+            bucket = self._buckets.get(number)
+            for ordinal in group:
+                found[ordinal] = [] if bucket is None else bucket.containing(ordinal)
+
+        # Повторяющиеся даты получают копии списка, чтобы результаты не зависели друг от друга
+        res = []
+        taken = set()
+        for ordinal in ordinals:
+            if ordinal in taken:
+                res.append(list(found[ordinal]))
+            else:
+                taken.add(ordinal)
+                res.append(found[ordinal])
+        return res
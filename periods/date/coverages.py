@@ -0,0 +1,106 @@
+import array
+import datetime
+import itertools
+from typing import Iterable, List
+
+from periods.date.periods import DatePeriod, PERIOD_TYPE, CLASS_ITEM_TYPE
+
+
+class Coverage:
+    """
+    Количество периодов, в которые входит каждый день окна.
+
+    counts — массив array('i'), i-й элемент которого — количество периодов,
+    в которые входит день window.begin + i. Создается функцией coverage.
+    """
+
+    __slots__ = ('window', 'counts')
+
+    def __init__(self, window: CLASS_ITEM_TYPE, counts: array.array):
+        self.window = window
+        self.counts = counts
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __getitem__(self, item: PERIOD_TYPE) -> int:
+        """Количество периодов, в которые входит дата. Для даты вне окна вызывается KeyError"""
+        # Как и в DatePeriod.__contains__, datetime не приводится к дате
+        if isinstance(item, datetime.datetime) or not isinstance(item, datetime.date):
+            raise TypeError
+
+        index = item.toordinal() - self.window._begin
+        if not 0 <= index < len(self.counts):
+            raise KeyError(item)
+
+        return self.counts[index]
+
+    def runs(self) -> List[CLASS_ITEM_TYPE]:
+        """
+        Сжатое представление counts: идущие подряд дни с одинаковым количеством
+        периодов объединяются в DatePeriod, атрибут data которого — это количество.
+        Периоды покрывают все окно и отсортированы по begin.
+        """
+        res = []
+        begin = self.window._begin
+        for count, group in itertools.groupby(self.counts):
+            length = sum(1 for _ in group)
+            res.append(DatePeriod._new(begin, begin + length - 1, count))
+            begin += length
+        return res
+
+    def max_concurrency(self) -> int:
+        """Максимальное количество периодов, действующих в один день окна"""
+        return max(self.counts)
+
+    def periods_at_depth(self, depth: int) -> List[CLASS_ITEM_TYPE]:
+        """
+        Периоды окна, в каждый день которых действует не меньше depth периодов.
+
+        Возвращаются максимальные по включению периоды, отсортированные по begin,
+        атрибут data — максимальное количество периодов в их днях.
+        """
+        res = []
+        for period in self.runs():
+            if period.data < depth:
+                continue
+
+            last = res[-1] if res else None
+            if last is not None and last._end + 1 == period._begin:
+                last._end = period._end
+                if period.data > last.data:
+                    last.data = period.data
+            else:
+                res.append(period)
+
+        return res
+
+
+def coverage(periods: Iterable[CLASS_ITEM_TYPE], window: CLASS_ITEM_TYPE) -> Coverage:
+    """
+    Подсчет количества периодов, действующих в каждый день окна window.
+
+    Для каждого периода отмечаются только его начало и день после окончания
+    (разностный массив), после чего количества получаются накопленной суммой.
+    Сложность O(n + d), где n — количество периодов, d — количество дней окна,
+    вместо O(суммарной длины периодов) при переборе их дней.
+    Части периодов вне окна не учитываются.
+    """
+    if not isinstance(window, DatePeriod):
+        raise TypeError
+
+    window_begin, window_end = window._begin, window._end
+    diff = array.array('i', [0]) * (window_end - window_begin + 2)
+
+    for p in periods:
+        if not isinstance(p, DatePeriod):
+            raise TypeError
+
+        begin = p._begin if p._begin > window_begin else window_begin
+        end = p._end if p._end < window_end else window_end
+        if begin <= end:
+            diff[begin - window_begin] += 1
+            diff[end - window_begin + 1] -= 1
+
+    diff.pop()
+    return Coverage(window, array.array('i', itertools.accumulate(diff)))
@@ -0,0 +1,258 @@
+import datetime
+import itertools
+import random
+from typing import Iterable, Iterator, List, Optional
+
+from periods.date.periods import DatePeriod, PERIOD_TYPE, CLASS_ITEM_TYPE
+
+
+class _Node:
+    __slots__ = ('key', 'begin', 'end', 'max_end', 'period', 'priority', 'left', 'right')
+
+    def __init__(self, key: tuple, period: CLASS_ITEM_TYPE, priority: float):
+        self.key = key
+        self.begin = key[0]
+        self.end = key[1]
+        self.max_end = key[1]
+        self.period = period
+        self.priority = priority
+        self.left = None
+        self.right = None
+
+    def update(self):
+        max_end = self.end
+        if self.left is not None and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right is not None and self.right.max_end > max_end:
+            max_end = self.right.max_end
+        self.max_end = max_end
+
+
+class IntervalIndex:
+    """
+    Индекс для быстрого поиска периодов DatePeriod по пересечению и вхождению.
+
+    Реализован как декартово дерево (treap), упорядоченное по (begin, end),
+    в каждом узле которого хранится максимальное окончание периода в поддереве.
+    Добавление и удаление периода выполняются за O(log n), запросы overlapping
+    и containing — за O(log n + k), где k — количество найденных периодов.
+
+    Границы периодов хранятся как порядковые номера дней (date.toordinal()),
+    поэтому все сравнения внутри дерева целочисленные.
+    Результаты запросов возвращаются отсортированными по (begin, end).
+    """
+
+    def __init__(self, periods: Optional[Iterable[CLASS_ITEM_TYPE]] = None, seed: Optional[int] = None):
+        self._random = random.Random(seed)
+        self._counter = itertools.count()
+        self._root = None
+        self._len = 0
+
+        if periods is not None:
+            self._build(periods)
+
+    def _make_node(self, period: CLASS_ITEM_TYPE) -> _Node:
+        if not isinstance(period, DatePeriod):
+            raise TypeError
+
+        key = (period._begin, period._end, next(self._counter))
+        return _Node(key, period, self._random.random())
+
+    def _build(self, periods: Iterable[CLASS_ITEM_TYPE]):
+        """Построение дерева из набора периодов за O(n log n) (сортировка + стек)"""
+        nodes = sorted((self._make_node(p) for p in periods), key=lambda x: x.key)
+
+        stack = []
+        for node in nodes:
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+                last.update()
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+
+        self._root = stack[0] if stack else None
+        while stack:
+            stack.pop().update()
+
+        self._len = len(nodes)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self) -> Iterator[CLASS_ITEM_TYPE]:
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.period
+            node = node.right
+
+    @classmethod
+    def _split(cls, node: Optional[_Node], key: tuple):
+        """Разделение дерева на узлы с ключом < key и >= key"""
+        if node is None:
+            return None, None
+
+        if node.key < key:
+            left, right = cls._split(node.right, key)
+            node.right = left
+            node.update()
+            return node, right
+        else:
+            left, right = cls._split(node.left, key)
+            node.left = right
+            node.update()
+            return left, node
+
+    @classmethod
+    def _merge(cls, left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+        if left is None:
+            return right
+        if right is None:
+            return left
+
+        if left.priority > right.priority:
+            left.right = cls._merge(left.right, right)
+            left.update()
+            return left
+        else:
+            right.left = cls._merge(left, right.left)
+            right.update()
+            return right
+
+    def add(self, period: CLASS_ITEM_TYPE):
+        """Добавление периода в индекс"""
+        node = self._make_node(period)
+        left, right = self._split(self._root, node.key)
+        self._root = self._merge(self._merge(left, node), right)
+        self._len += 1
+
+    def update(self, periods: Iterable[CLASS_ITEM_TYPE]):
+        """Добавление нескольких периодов в индекс"""
+        for period in periods:
+            self.add(period)
+
+    def _find(self, period: CLASS_ITEM_TYPE) -> Optional[_Node]:
+        """
+        Поиск узла с переданным периодом.
+
+        Предпочтение отдается узлу, хранящему именно этот объект,
+        иначе возвращается первый узел с такими же границами.
+        """
+        begin, end = period._begin, period._end
+
+        found = None
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+
+            if (node.begin, node.end) < (begin, end):
+                stack.append(node.right)
+            elif (node.begin, node.end) > (begin, end):
+                stack.append(node.left)
+            else:
+                if node.period is period:
+                    return node
+                if found is None or node.key < found.key:
+                    found = node
+                stack.append(node.left)
+                stack.append(node.right)
+
+        return found
+
+    def remove(self, period: CLASS_ITEM_TYPE):
+        """Удаление периода из индекса. Если период не найден, то вызывается ValueError"""
+        if not isinstance(period, DatePeriod):
+            raise TypeError
+
+        node = self._find(period)
+        if node is None:
+            raise ValueError('Period not found')
+
+        left, rest = self._split(self._root, node.key)
+        _, right = self._split(rest, node.key + (0,))
+        self._root = self._merge(left, right)
+        self._len -= 1
+
+    def discard(self, period: CLASS_ITEM_TYPE):
+        """Удаление периода из индекса, если он там есть"""
+        try:
+            self.remove(period)
+        except ValueError:
+            pass
+
+    def _overlapping(self, begin: int, end: int) -> List[CLASS_ITEM_TYPE]:
+        res = []
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            # Спуск влево, пока в поддереве могут быть периоды, оканчивающиеся не раньше begin
+            while node is not None and node.max_end >= begin:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                break
+
+            node = stack.pop()
+            if node.begin > end:
+                break
+
+            if node.end >= begin:
+                res.append(node.period)
+            node = node.right
+
+        return res
+
+    def overlapping(self, period: CLASS_ITEM_TYPE) -> List[CLASS_ITEM_TYPE]:
+        """Периоды, которые пересекаются с переданным периодом"""
+        if not isinstance(period, DatePeriod):
+            raise TypeError
+
+        return self._overlapping(period._begin, period._end)
+
+    def containing(self, item: PERIOD_TYPE) -> List[CLASS_ITEM_TYPE]:
+        """Периоды, в которые входит переданная дата. Для datetime, как и в DatePeriod, вызывается TypeError"""
+        if isinstance(item, datetime.datetime) or not isinstance(item, datetime.date):
+            raise TypeError
+
+        ordinal = item.toordinal()
+        return self._overlapping(ordinal, ordinal)
+
+    def contained_in(self, period: CLASS_ITEM_TYPE) -> List[CLASS_ITEM_TYPE]:
+        """Периоды, которые полностью входят в переданный период"""
+        if not isinstance(period, DatePeriod):
+            raise TypeError
+
+        begin, end = period._begin, period._end
+
+        res = []
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            # Левое поддерево пропускается, если начало узла раньше начала периода
+            while node is not None:
+                if node.begin < begin:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                break
+
+            node = stack.pop()
+            if node.begin > end:
+                break
+
+            if node.end <= end:
+                res.append(node.period)
+            node = node.right
+
+        return res
@@ -1,34 +1,175 @@
-import copy
+import bisect
 import datetime
-from typing import Union, Any, List, Optional
+import heapq
+import re
+from collections import deque
+from itertools import islice
+from typing import Union, Any, Callable, Iterable, Iterator, List, Optional, Tuple
 
-from periods.base import Period
+from periods.base import Period, Relation
+from periods.date.ranges import DateRange
+from periods.granular import tick_relation, BEFORE, MEETS, OVERLAPS, FINISHED_BY, CONTAINS, STARTS, EQUALS, \
+    STARTED_BY, DURING, FINISHES, OVERLAPPED_BY, MET_BY, AFTER, NOT_CROSSING, CONTAINS_OTHER, INSIDE_OTHER
 
 PERIOD_TYPE = Union[datetime.date, datetime.datetime]
 CLASS_ITEM_TYPE = 'DatePeriod'
 FULL_ITEM_TYPE = Union[PERIOD_TYPE, CLASS_ITEM_TYPE]
 
+DATA_POLICY_TYPE = Union[str, Callable[[Any, Any], Any]]
+
+# Сдвиг начала периода в ключе сортировки, date.max.toordinal() = 3652059 < 2 ** 22
+_SORT_KEY_SHIFT = 22
+
+
+def _identity(data: Any) -> Any:
+    return data
+
+
+def _keep_first(acc: Any, data: Any) -> Any:
+    return acc
+
+
+def _keep_last(acc: Any, data: Any) -> Any:
+    return data
+
+
+def _to_list(data: Any) -> List[Any]:
+    return [data, ]
+
+
+def _append(acc: List[Any], data: Any) -> List[Any]:
+    acc.append(data)
+    return acc
+
+
+_MAX_ORDINAL = datetime.date.max.toordinal()
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+# Дата 'YYYY-MM-DD' и необязательное время после нее 'THH[:MM[:SS[.ffffff]]]' (вместо 'T' допускается пробел)
+_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}\Z', re.ASCII)
+_ISO_TIME = re.compile(r'[T ]([01]\d|2[0-3])(:[0-5]\d(:[0-5]\d(\.\d{1,6})?)?)?\Z', re.ASCII)
+
+
+def _parse_iso_date(value: str) -> int:
+    """Порядковый номер дня (date.toordinal()) для строки 'YYYY-MM-DD' без создания объекта date"""
+    if not _ISO_DATE.match(value):
+        raise ValueError('Wrong format')
+
+    year, month, day = int(value[0:4]), int(value[5:7]), int(value[8:10])
+    leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+    if year < 1 or not 1 <= month <= 12 or not 1 <= day <= (29 if month == 2 and leap else _DAYS_IN_MONTH[month]):
+        raise ValueError('Wrong format')
+
+    year -= 1
+    return year * 365 + year // 4 - year // 100 + year // 400 + _DAYS_BEFORE_MONTH[month] + \
+        (month > 2 and leap) + day
+
+
+if hasattr(datetime.date, 'fromisoformat'):
+    # В python 3.7+ разбор строки выполняется на C и быстрее ручного разбора.
+    # fromisoformat в новых версиях принимает и другие форматы (например, '2020-W01-1'),
+    # поэтому формат 'YYYY-MM-DD' проверяется заранее, как и в ручном разборе
+    def _iso_date_ordinal(value: str) -> int:
+        if not _ISO_DATE.match(value):
+            raise ValueError('Wrong format')
+        return datetime.date.fromisoformat(value).toordinal()
+else:
+    _iso_date_ordinal = _parse_iso_date
+
+
+def _iso_ordinal(value: str) -> int:
+    """
+    Порядковый номер дня для строки 'YYYY-MM-DD' или даты и времени 'YYYY-MM-DDTHH[:MM[:SS[.ffffff]]]'.
+
+    Время проверяется и отбрасывается, строки с часовым поясом не принимаются.
+    """
+    if len(value) > 10:
+        if not _ISO_TIME.match(value, 10):
+            raise ValueError('Wrong format')
+        value = value[:10]
+    return _iso_date_ordinal(value)
+
+
+def _date_ordinal(value: PERIOD_TYPE) -> int:
+    if not isinstance(value, datetime.date):
+        raise TypeError
+    return value.toordinal()
+
+
+def _check_ordinal(value: int) -> int:
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError
+    if not 1 <= value <= _MAX_ORDINAL:
+        raise ValueError('Wrong ordinal')
+    return value
+
+
+class InvalidRowsError(ValueError):
+    """
+    Ошибка массового создания периодов.
+
+    Атрибут errors — список всех неверных строк в виде пар (номер строки, описание ошибки).
+    """
+
+    def __init__(self, errors: List[Tuple[int, str]]):
+        self.errors = errors
+        rows = ', '.join(str(i) for i, _ in errors[:10])
+        if len(errors) > 10:
+            rows += ', ...'
+        super().__init__('Wrong rows ({}): {}'.format(len(errors), rows))
+
 
 class DatePeriod(Period):
     """
     Класс для работы с периодами дат
-    """
 
-    protect_data = False
+    Границы периода хранятся как порядковые номера дней (_begin, _end = date.toordinal()),
+    поэтому сравнения и арифметика периодов выполняются над целыми числами.
+    Объекты date для атрибутов begin и end создаются при обращении к ним.
+    """
 
-    __delta = datetime.timedelta(days=1)
+    __slots__ = ('_begin', '_end', 'data', 'protect_data')
 
     def __init__(self, begin: PERIOD_TYPE, end: PERIOD_TYPE,
                  data: Any = None, protect_data: bool = False):
 
         self._check_periods(begin, end)
 
-        self.begin = self._normalize_period(begin)
-        self.end = self._normalize_period(end)
+        # toordinal у datetime возвращает номер дня без учета времени
+        self._begin = begin.toordinal()
+        self._end = end.toordinal()
 
         self.data = data
         self.protect_data = protect_data
 
+    @classmethod
+    def _new(cls, begin: int, end: int, data: Any = None, protect_data: bool = False) -> CLASS_ITEM_TYPE:
+        """Создание периода из уже проверенных порядковых номеров дней"""
+        self = cls.__new__(cls)
+        self._begin = begin
+        self._end = end
+        self.data = data
+        self.protect_data = protect_data
+        return self
+
+    @property
+    def begin(self) -> datetime.date:
+        return datetime.date.fromordinal(self._begin)
+
+    @begin.setter
+    def begin(self, value: PERIOD_TYPE):
+        self._begin = self._normalize_period(value).toordinal()
+
+    @property
+    def end(self) -> datetime.date:
+        return datetime.date.fromordinal(self._end)
+
+    @end.setter
+    def end(self, value: PERIOD_TYPE):
+        self._end = self._normalize_period(value).toordinal()
+
     @staticmethod
     def _normalize_period(period: PERIOD_TYPE):
         if isinstance(period, datetime.datetime):
@@ -44,36 +185,153 @@ class DatePeriod(Period):
         if begin > end:
             raise ValueError('Wrong dates')
 
+    @classmethod
+    def _from_rows(cls, rows: Iterable[Any], to_ordinal: Callable[[Any], int],
+                   protect_data: bool) -> List[CLASS_ITEM_TYPE]:
+        """
+        Создание периодов из строк (begin, end) или (begin, end, data) за один проход.
+
+        Проверяются все строки, после чего при наличии ошибок вызывается InvalidRowsError
+        со списком всех неверных строк.
+        """
+        res = []
+        errors = []
+
+        for i, row in enumerate(rows):
+            try:
+                if len(row) == 2:
+                    begin, end = row
+                    data = None
+                else:
+                    begin, end, data = row
+
+                begin = to_ordinal(begin)
+                end = to_ordinal(end)
+            except (TypeError, ValueError):
+                errors.append((i, 'Wrong format'))
+                continue
+
+            if begin > end:
+                errors.append((i, 'Wrong dates'))
+            elif not errors:
+                res.append(cls._new(begin, end, data, protect_data))
+
+        if errors:
+            raise InvalidRowsError(errors)
+
+        return res
+
+    @classmethod
+    def from_records(cls, records: Iterable[Tuple[Any, ...]], protect_data: bool = False) -> List[CLASS_ITEM_TYPE]:
+        """
+        Создание списка периодов из записей (begin, end) или (begin, end, data), где begin и end — date/datetime.
+
+        При ошибках вызывается InvalidRowsError со списком всех неверных записей.
+        """
+        return cls._from_rows(records, _date_ordinal, protect_data)
+
+    @classmethod
+    def from_iso_strings(cls, records: Iterable[Tuple[Any, ...]],
+                         protect_data: bool = False) -> List[CLASS_ITEM_TYPE]:
+        """
+        Создание списка периодов из записей (begin, end) или (begin, end, data), где begin и end — строки
+        'YYYY-MM-DD' (или 'YYYY-MM-DDTHH:MM:SS', время отбрасывается).
+
+        При ошибках вызывается InvalidRowsError со списком всех неверных записей.
+        """
+        return cls._from_rows(records, _iso_ordinal, protect_data)
+
+    @classmethod
+    def from_ordinals(cls, begins: Iterable[int], ends: Iterable[int], data: Optional[Iterable[Any]] = None,
+                      protect_data: bool = False) -> List[CLASS_ITEM_TYPE]:
+        """
+        Создание списка периодов из порядковых номеров дней (date.toordinal()) начал и окончаний.
+
+        Последовательности begins, ends и data (если передана) должны быть одной длины, иначе ValueError.
+        При ошибках вызывается InvalidRowsError со списком всех неверных строк.
+        """
+        begins = list(begins)
+        ends = list(ends)
+        data = [None] * len(begins) if data is None else list(data)
+
+        if not len(begins) == len(ends) == len(data):
+            raise ValueError('Wrong length')
+
+        # Быстрая проверка всех строк сразу; неверные строки собираются построчной проверкой
+        if all(type(b) is int and type(e) is int and 1 <= b <= e <= _MAX_ORDINAL for b, e in zip(begins, ends)):
+            new = cls._new
+            return [new(b, e, d, protect_data) for b, e, d in zip(begins, ends, data)]
+
+        return cls._from_rows(zip(begins, ends, data), _check_ordinal, protect_data)
+
     def __hash__(self):
-        return hash((self.begin, self.end))
+        return hash((self._begin, self._end))
+
+    def sort_key(self) -> int:
+        """
+        Целочисленный ключ для сортировки периодов по (begin, end).
+
+        Операторы сравнения периодов не задают порядок, поэтому для sorted и sort
+        нужно передавать key=DatePeriod.sort_key.
+        """
+        return (self._begin << _SORT_KEY_SHIFT) | self._end
 
     def __str__(self) -> str:
         return '{} - {}'.format(self.begin.strftime('%d.%m.%Y'), self.end.strftime('%d.%m.%Y'))
 
-    def __iter__(self) -> PERIOD_TYPE:
-        for x in [self.begin + datetime.timedelta(days=d) for d in
-                  range((self.end - self.begin).days + 1)]:
-            yield x
+    def __iter__(self) -> Iterator[datetime.date]:
+        """Ленивый итератор по дням периода, даты создаются по мере обхода"""
+        return map(datetime.date.fromordinal, range(self._begin, self._end + 1))
+
+    def days(self, step: int = 1) -> DateRange:
+        """Ленивое представление дат периода с шагом step дней"""
+        return DateRange.days(self.begin, self.end, step)
+
+    def weeks(self, step: int = 1) -> DateRange:
+        """Ленивое представление дат периода с шагом step недель"""
+        return DateRange.days(self.begin, self.end, step * 7)
+
+    def months(self, step: int = 1) -> DateRange:
+        """Ленивое представление дат периода с шагом step месяцев"""
+        return DateRange.months(self.begin, self.end, step)
 
     def __contains__(self, item: FULL_ITEM_TYPE) -> bool:
         """Проверка вхождения даты/периода в данный период"""
-        if isinstance(item, type(self.begin)):
-            return self.begin <= item <= self.end
+        if isinstance(item, datetime.date):
+            if isinstance(item, datetime.datetime):
+                raise TypeError
+            return self._begin <= item.toordinal() <= self._end
         elif isinstance(item, DatePeriod):
-            return self.begin <= item.begin <= self.end and \
-                   self.begin <= item.end <= self.end
+            return self._begin <= item._begin <= self._end and \
+                   self._begin <= item._end <= self._end
         else:
             raise TypeError
 
+    def relation(self, other: CLASS_ITEM_TYPE) -> Relation:
+        """Взаимное расположение данного периода (self) относительно переданного периода (other)"""
+        if not isinstance(other, DatePeriod):
+            raise TypeError
+
+        return self._relation(other)
+
+    def _relation(self, other: CLASS_ITEM_TYPE) -> Relation:
+        """
+        Классификация взаимного расположения периодов.
+
+        Вычисляется один раз за операцию, после чего операторы и методы
+        выбирают результат по полученному отношению, не сравнивая границы повторно.
+        """
+        return tick_relation(self._begin, self._end, other._begin, other._end)
+
     def __lt__(self, other: FULL_ITEM_TYPE) -> bool:
         """Проверка того, что данный период закончился раньше сравниваемой даты/периода и они НЕ ПЕРЕСЕКАЮТСЯ"""
-        if isinstance(other, type(self.begin)):
-            return self.end < other
+        if isinstance(other, datetime.date):
+            if isinstance(other, datetime.datetime):
+                raise TypeError
+            return self._end < other.toordinal()
         elif isinstance(other, DatePeriod):
-            if self.__contains__(other) or self.is_crossing(other):
-                return False
-
-            return self.end < other.begin
+            # Отношения BEFORE и MEETS
+            return self._end < other._begin
         else:
             raise TypeError
 
@@ -82,41 +340,35 @@ class DatePeriod(Period):
         if not isinstance(other, DatePeriod):
             raise TypeError
 
-        if not self.is_crossing(other):
-            return False
-
-        if (self == other) or (self in other) or (other in self):
-            return False
-
-        return self.end <= other.end
+        return self._relation(other) is OVERLAPS
 
     def __eq__(self, other: FULL_ITEM_TYPE) -> bool:
         """Проверка того, что данный период идентичен второму периоду"""
-        if isinstance(other, type(self.begin)):
+        if isinstance(other, datetime.date):
             return False
         elif isinstance(other, DatePeriod):
-            return self.begin == other.begin and self.end == other.end
+            return self._begin == other._begin and self._end == other._end
         else:
             raise TypeError
 
     def __ne__(self, other: FULL_ITEM_TYPE) -> bool:
         """Проверка того, что данный период не является идентичным второму периоду"""
-        if isinstance(other, type(self.begin)):
+        if isinstance(other, datetime.date):
             return True
         elif isinstance(other, DatePeriod):
-            return self.begin != other.begin or self.end != other.end
+            return self._begin != other._begin or self._end != other._end
         else:
             raise TypeError
 
     def __gt__(self, other: FULL_ITEM_TYPE) -> bool:
         """Проверка того, что данный период закончился позже сравниваемой даты/периода и они НЕ ПЕРЕСЕКАЮТСЯ"""
-        if isinstance(other, type(self.begin)):
-            return other < self.begin
+        if isinstance(other, datetime.date):
+            if isinstance(other, datetime.datetime):
+                raise TypeError
+            return other.toordinal() < self._begin
         elif isinstance(other, DatePeriod):
-            if self in other or self.is_crossing(other):
-                return False
-
-            return other.end < self.begin
+            # Отношения AFTER и MET_BY
+            return other._end < self._begin
         else:
             raise TypeError
 
@@ -125,48 +377,42 @@ class DatePeriod(Period):
         if not isinstance(other, DatePeriod):
             raise TypeError
 
-        if not self.is_crossing(other):
-            return False
-
-        if (other in self) or (self in other):
-            return False
-
-        return self.end > other.end
+        return self._relation(other) is OVERLAPPED_BY
 
     def __len__(self):
         """Количество дней в периоде"""
-        return (self.end - self.begin).days + 1
+        return self._end - self._begin + 1
 
     def __add__(self, other: CLASS_ITEM_TYPE) -> List[CLASS_ITEM_TYPE]:
         """Производит операцию добавления периода"""
         if not isinstance(other, DatePeriod):
             raise TypeError
 
-        if self not in other and not self.is_crossing(other):
+        relation = self._relation(other)
+
+        if relation in NOT_CROSSING:
             return [self, other]
 
-        if other in self:
+        if relation in CONTAINS_OTHER:
             return [
                 self,
             ]
-        elif self in other:
+        elif relation in INSIDE_OTHER:
             if self.protect_data:
-                other_copy = copy.copy(other)
-                other_copy.data = self.data
                 return [
-                    other_copy,
+                    other._new(other._begin, other._end, self.data, other.protect_data),
                 ]
             else:
                 return [
                     other,
                 ]
-        elif self <= other:
+        elif relation is OVERLAPS:
             return [
-                DatePeriod(self.begin, other.end, self.data),
+                self._new(self._begin, other._end, self.data),
             ]
-        elif self >= other:
+        elif relation is OVERLAPPED_BY:
             return [
-                DatePeriod(other.begin, self.end, self.data),
+                self._new(other._begin, self._end, self.data),
             ]
         else:
             raise ValueError
@@ -176,34 +422,33 @@ class DatePeriod(Period):
         if not isinstance(other, DatePeriod):
             raise TypeError
 
-        if self not in other and not self.is_crossing(other):
-            return [self, ]
+        relation = self._relation(other)
 
-        cross = self.crossing(other)
+        if relation in NOT_CROSSING:
+            return [self, ]
 
-        if (self == other) or (self in other):
+        if relation in INSIDE_OTHER:
             return []
-        elif other in self:
-            if self.begin == other.begin:
-                return [
-                    DatePeriod(cross.end + self.__delta, self.end, self.data)
-                ]
-            elif self.end == other.end:
-                return [
-                    DatePeriod(self.begin, cross.begin - self.__delta, self.data)
-                ]
-            else:
-                return [
-                    DatePeriod(self.begin, cross.begin - self.__delta, self.data),
-                    DatePeriod(cross.end + self.__delta, self.end, self.data)
-                ]
-        elif self <= other:
+        elif relation is STARTED_BY:
+            return [
+                self._new(other._end + 1, self._end, self.data)
+            ]
+        elif relation is FINISHED_BY:
+            return [
+                self._new(self._begin, other._begin - 1, self.data)
+            ]
+        elif relation is CONTAINS:
+            return [
+                self._new(self._begin, other._begin - 1, self.data),
+                self._new(other._end + 1, self._end, self.data)
+            ]
+        elif relation is OVERLAPS:
             return [
-                DatePeriod(self.begin, cross.begin - self.__delta, self.data),
+                self._new(self._begin, other._begin - 1, self.data),
             ]
-        elif self >= other:
+        elif relation is OVERLAPPED_BY:
             return [
-                DatePeriod(cross.end + self.__delta, self.end, self.data)
+                self._new(other._end + 1, self._end, self.data)
             ]
         else:
             raise ValueError
@@ -213,44 +458,40 @@ class DatePeriod(Period):
         if not isinstance(other, DatePeriod):
             raise TypeError
 
-        if self not in other and not self.is_crossing(other):
-            return [self, ]
+        relation = self._relation(other)
 
-        if self == other:
+        if relation in NOT_CROSSING or relation is EQUALS:
             return [self, ]
 
-        cross = self.crossing(other)
-
-        if self <= other:
+        if relation is OVERLAPS:
             return [
-                DatePeriod(self.begin, cross.begin - self.__delta, self.data),
-                cross,
-                DatePeriod(cross.end + self.__delta, other.end, self.data)
+                self._new(self._begin, other._begin - 1, self.data),
+                self._new(other._begin, self._end, self.data),
+                self._new(self._end + 1, other._end, self.data)
             ]
-        elif self >= other:
+        elif relation is OVERLAPPED_BY:
             return [
-                DatePeriod(other.begin, cross.begin - self.__delta, self.data),
-                cross,
-                DatePeriod(cross.end + self.__delta, self.end, self.data)
+                self._new(other._begin, self._begin - 1, self.data),
+                self._new(self._begin, other._end, self.data),
+                self._new(other._end + 1, self._end, self.data)
             ]
-        elif other in self:
-            if self.begin == other.begin:
-                return [
-                    DatePeriod(other.begin, other.end, self.data),
-                    DatePeriod(other.end + self.__delta, self.end, self.data)
-                ]
-            elif self.end == other.end:
-                return [
-                    DatePeriod(self.begin, other.begin - self.__delta, self.data),
-                    DatePeriod(other.begin, other.end, self.data)
-                ]
-            else:
-                return [
-                    DatePeriod(self.begin, cross.begin - self.__delta, self.data),
-                    cross,
-                    DatePeriod(cross.end + self.__delta, self.end, self.data)
-                ]
-        elif self in other:
+        elif relation is STARTED_BY:
+            return [
+                self._new(other._begin, other._end, self.data),
+                self._new(other._end + 1, self._end, self.data)
+            ]
+        elif relation is FINISHED_BY:
+            return [
+                self._new(self._begin, other._begin - 1, self.data),
+                self._new(other._begin, other._end, self.data)
+            ]
+        elif relation is CONTAINS:
+            return [
+                self._new(self._begin, other._begin - 1, self.data),
+                self._new(other._begin, other._end, self.data),
+                self._new(other._end + 1, self._end, self.data)
+            ]
+        elif relation in INSIDE_OTHER:
             return [self, ]
         else:
             raise ValueError
@@ -260,20 +501,17 @@ class DatePeriod(Period):
         if not isinstance(period, DatePeriod):
             raise TypeError
 
-        return self.begin <= period.begin <= self.end or \
-               self.begin <= period.end <= self.end or \
-               period.begin <= self.begin <= period.end or \
-               period.begin <= self.end <= period.end
+        return self._begin <= period._end and period._begin <= self._end
 
     def crossing(self, other: CLASS_ITEM_TYPE) -> Optional[CLASS_ITEM_TYPE]:
         """Получение пересечения текущего периода (self) с переданным периодом (other)."""
         if not isinstance(other, DatePeriod):
             raise TypeError
 
-        if self.is_crossing(other):
-            begin_date = max(self.begin, other.begin)
-            end_date = min(self.end, other.end)
-            return DatePeriod(begin_date, end_date, self.data)
+        if self._begin <= other._end and other._begin <= self._end:
+            begin = self._begin if self._begin > other._begin else other._begin
+            end = self._end if self._end < other._end else other._end
+            return self._new(begin, end, self.data)
 
         return
 
@@ -288,9 +526,102 @@ class DatePeriod(Period):
 
         return result
 
+    @staticmethod
+    def _data_reducer(data_policy: DATA_POLICY_TYPE) -> Tuple[Callable[[Any], Any], Callable[[Any, Any], Any]]:
+        """Получение пары функций (начальное значение, свертка) для объединения атрибутов data"""
+        if callable(data_policy):
+            return _identity, data_policy
+        elif data_policy == 'first':
+            return _identity, _keep_first
+        elif data_policy == 'last':
+            return _identity, _keep_last
+        elif data_policy == 'list':
+            return _to_list, _append
+        else:
+            raise ValueError('Wrong data policy')
+
+    @classmethod
+    def merge(cls, periods: Iterable[CLASS_ITEM_TYPE], adjacent: bool = True,
+              data_policy: DATA_POLICY_TYPE = 'first') -> Iterator[CLASS_ITEM_TYPE]:
+        """
+        Склеивание пересекающихся (и смежных, если adjacent) периодов.
+
+        Периоды сортируются один раз, после чего склеиваются за один проход.
+        Результат возвращается генератором в порядке возрастания дат.
+
+        data_policy определяет атрибут data склеенного периода:
+            'first' — data самого раннего периода (как при сложении периодов)
+            'last' — data последнего из склеенных периодов
+            'list' — список data всех склеенных периодов
+            функция f(acc, data) — свертка data всех склеенных периодов
+        """
+        init, reduce = cls._data_reducer(data_policy)
+
+        items = list(periods)
+        for p in items:
+            if not isinstance(p, DatePeriod):
+                raise TypeError
+        items.sort(key=DatePeriod.sort_key)
+
+        return cls._merge_sorted(items, 1 if adjacent else 0, init, reduce)
+
+    @classmethod
+    def _merge_sorted(cls, items: List[CLASS_ITEM_TYPE], gap: int,
+                      init: Callable[[Any], Any], reduce: Callable[[Any, Any], Any]) -> Iterator[CLASS_ITEM_TYPE]:
+        if not items:
+            return
+
+        first = items[0]
+        begin, end, data = first._begin, first._end, init(first.data)
+
+        for p in islice(items, 1, None):
+            if p._begin - end <= gap:
+                if p._end > end:
+                    end = p._end
+                data = reduce(data, p.data)
+            else:
+                yield cls._new(begin, end, data)
+                begin, end, data = p._begin, p._end, init(p.data)
+
+        yield cls._new(begin, end, data)
+
+    @staticmethod
+    def _union_bounds(periods: List[CLASS_ITEM_TYPE]) -> Tuple[List[int], List[int]]:
+        """
+        Объединение периодов в отсортированный набор непересекающихся интервалов.
+
+        Пересекающиеся и смежные периоды склеиваются. Возвращаются два параллельных
+        списка: порядковые номера начал и окончаний полученных интервалов.
+        """
+        begins = []
+        ends = []
+
+        mask = (1 << _SORT_KEY_SHIFT) - 1
+        for key in sorted(map(DatePeriod.sort_key, periods)):
+            begin, end = key >> _SORT_KEY_SHIFT, key & mask
+            if ends and begin - ends[-1] <= 1:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                begins.append(begin)
+                ends.append(end)
+
+        return begins, ends
+
     @classmethod
     def circle_sub(cls, period1: List[CLASS_ITEM_TYPE], period2: List[CLASS_ITEM_TYPE]) -> List[CLASS_ITEM_TYPE]:
-        """Циклическое вычетание периодов"""
+        """
+        Циклическое вычетание периодов.
+
+        Вычитаемые периоды (period2) один раз сортируются и склеиваются в набор
+        непересекающихся интервалов, после чего каждый период из period1 проходится
+        слева направо по этому набору (поиск начальной позиции — бинарный).
+        Сложность O((n + m) * log(m) + k), где k — количество полученных кусков.
+
+        Порядок результата совпадает с порядком period1, куски каждого периода
+        идут по возрастанию дат, атрибут data берется из исходного периода.
+        Периоды, которые ни с чем не пересекаются, возвращаются без копирования.
+        """
         res = []
 
         if not period1:
@@ -299,23 +630,138 @@ class DatePeriod(Period):
         if not period2:
             return period1
 
+        begins, ends = cls._union_bounds(period2)
+        return cls._sub_bounds(period1, begins, ends)
+
+    @classmethod
+    def _sub_bounds(cls, period1: List[CLASS_ITEM_TYPE], begins: List[int], ends: List[int]) -> List[CLASS_ITEM_TYPE]:
+        """Вычитание из периодов period1 непересекающихся интервалов, заданных границами begins и ends"""
+        res = []
+        count = len(ends)
+
         for p1 in period1:
-            out = False
-            for p2 in period2:
-                if p1.is_crossing(p2):
-                    res.extend(p1 - p2)
-                    res = cls.circle_sub(res, period2)
-                    out = True
+            p1_begin, p1_end = p1._begin, p1._end
+            i = bisect.bisect_left(ends, p1_begin)
+
+            if i == count or begins[i] > p1_end:
+                res.append(p1)
+                continue
+
+            cursor = p1_begin
+            while i < count and begins[i] <= p1_end:
+                if begins[i] > cursor:
+                    res.append(cls._new(cursor, begins[i] - 1, p1.data))
+
+                if ends[i] >= p1_end:
+                    cursor = None
                     break
-            else:
-                if not out:
-                    res.append(p1)
+
+                cursor = ends[i] + 1
+                i += 1
+
+            if cursor is not None:
+                res.append(cls._new(cursor, p1_end, p1.data))
+
         return res
 
+    @staticmethod
+    def _crossing_index(period1: List[CLASS_ITEM_TYPE], period2: List[CLASS_ITEM_TYPE]) -> List[List[int]]:
+        """
+        Соединение двух наборов периодов по пересечению.
+
+        Возвращается список, i-й элемент которого — отсортированные индексы периодов
+        period2, пересекающихся с period1[i].
+        """
+        found = []
+        for _ in DatePeriod._crossing_sweep(period1, period2, found):
+            pass
+        return found
+
+    @staticmethod
+    def _crossing_sweep(period1: List[CLASS_ITEM_TYPE], period2: List[CLASS_ITEM_TYPE], found: List[List[int]],
+                        step: int = 0) -> Iterator[None]:
+        """
+        Соединение двух наборов периодов по пересечению с заполнением found (см. _crossing_index).
+
+        Оба набора один раз сортируются по begin и проходятся вместе (заметание прямой).
+        Начинающийся период сравнивается только с начавшимися ранее периодами другого
+        набора: закончившиеся удаляются из них насовсем, с остальными он пересекается.
+        Сложность O((n + m) * log(n + m) + k), где k — количество пересекающихся пар.
+
+        Если step > 0, то генератор приостанавливается (yield) примерно после каждых step
+        обработанных периодов и найденных пар, что позволяет выполнять проход по частям.
+        """
+        begins1, ends1, begins2, ends2 = [], [], [], []
+        for periods, begins, ends in ((period1, begins1, ends1), (period2, begins2, ends2)):
+            for p in periods:
+                if not isinstance(p, DatePeriod):
+                    raise TypeError
+                begins.append(p._begin)
+                ends.append(p._end)
+
+                if step and not len(begins) % step:
+                    yield
+
+        n, m = len(begins1), len(begins2)
+        order1 = sorted(range(n), key=begins1.__getitem__)
+        order2 = sorted(range(m), key=begins2.__getitem__)
+
+        found.extend([] for _ in range(n))
+        active1, active2 = [], []
+        x = y = 0
+        steps = 0
+
+        # Проход заканчивается, когда начинающимся периодам одного набора не с чем пересекаться
+        while (x < n and (y < m or active2)) or (y < m and active1):
+            if x < n and (y == m or begins1[order1[x]] <= begins2[order2[y]]):
+                i = order1[x]
+                begin = begins1[i]
+                active2 = [j for j in active2 if ends2[j] >= begin]
+                found[i].extend(active2)
+                active1.append(i)
+                x += 1
+                work = len(active2) + 1
+            else:
+                j = order2[y]
+                begin = begins2[j]
+                active1 = [i for i in active1 if ends1[i] >= begin]
+                for i in active1:
+                    found[i].append(j)
+                active2.append(j)
+                y += 1
+                work = len(active1) + 1
+
+            if step:
+                steps += work
+                if steps >= step:
+                    steps = 0
+                    yield
+
+        for i, items in enumerate(found, 1):
+            items.sort()
+
+            if step and not i % step:
+                yield
+
+    @classmethod
+    def crossing_pairs(cls, period1: List[CLASS_ITEM_TYPE], period2: List[CLASS_ITEM_TYPE]) -> List[Tuple[int, int]]:
+        """
+        Индексы пересекающихся периодов без создания новых периодов.
+
+        Возвращаются пары (i, j), для которых period1[i] пересекается с period2[j],
+        в том же порядке, в котором circle_crossing возвращает пересечения.
+        """
+        return [(i, j) for i, items in enumerate(cls._crossing_index(period1, period2)) for j in items]
+
     @classmethod
     def circle_crossing(cls, period1: List[CLASS_ITEM_TYPE], period2: List[CLASS_ITEM_TYPE]) -> List[CLASS_ITEM_TYPE]:
-        """Циклическое пересечение периодов"""
+        """
+        Циклическое пересечение периодов.
 
+        Пересекающиеся пары находятся за O((n + m) * log(n + m) + k), где k — количество
+        пар (см. crossing_pairs). Результат — p1.crossing(p2) для каждой пары: по порядку
+        period1, а для одного периода — по порядку period2.
+        """
         res = []
 
         if not period1:
@@ -324,10 +770,19 @@ class DatePeriod(Period):
         if not period2:
             return period1
 
-        for p1 in period1:
-            for p2 in period2:
-                if p1.is_crossing(p2):
-                    res.extend([p1.crossing(p2)])
+        return cls._crossing_results(period1, period2, cls._crossing_index(period1, period2))
+
+    @staticmethod
+    def _crossing_results(period1: List[CLASS_ITEM_TYPE], period2: List[CLASS_ITEM_TYPE],
+                          found: List[List[int]]) -> List[CLASS_ITEM_TYPE]:
+        """Пересечения p1.crossing(p2) по индексам found, полученным из _crossing_index"""
+        res = []
+        for p1, items in zip(period1, found):
+            p1_begin, p1_end = p1._begin, p1._end
+            for j in items:
+                p2 = period2[j]
+                res.append(p1._new(p1_begin if p1_begin > p2._begin else p2._begin,
+                                   p1_end if p1_end < p2._end else p2._end, p1.data))
         return res
 
     @classmethod
@@ -345,3 +800,183 @@ class DatePeriod(Period):
             for p2 in period2:
                 res.extend(p1 + p2)
         return res
+
+    @staticmethod
+    def _iter_sorted(periods: Iterable[CLASS_ITEM_TYPE]) -> Iterator[CLASS_ITEM_TYPE]:
+        """Проход по периодам с проверкой на лету, что они отсортированы по begin"""
+        prev = None
+        for p in periods:
+            if not isinstance(p, DatePeriod):
+                raise TypeError
+
+            if prev is not None and p._begin < prev:
+                raise ValueError('Periods are not sorted')
+
+            prev = p._begin
+            yield p
+
+    @classmethod
+    def iter_circle_sub(cls, period1: Iterable[CLASS_ITEM_TYPE],
+                        period2: Iterable[CLASS_ITEM_TYPE]) -> Iterator[CLASS_ITEM_TYPE]:
+        """
+        Потоковое циклическое вычетание периодов.
+
+        period1 и period2 должны быть отсортированы по begin (иначе вызывается ValueError),
+        могут быть любыми итерируемыми объектами и читаются по одному разу.
+        Результат совпадает с circle_sub и возвращается генератором. В памяти хранятся
+        только склеенные вычитаемые периоды, которые еще могут пересечься с текущим.
+        """
+        period2 = cls._iter_sorted(period2)
+        pending = next(period2, None)
+        # Склеенные вычитаемые интервалы [begin, end], отсортированные по begin
+        active = deque()
+
+        for p1 in cls._iter_sorted(period1):
+            p1_begin, p1_end = p1._begin, p1._end
+
+            while pending is not None and pending._begin <= p1_end:
+                if active and pending._begin - active[-1][1] <= 1:
+                    if pending._end > active[-1][1]:
+                        active[-1][1] = pending._end
+                else:
+                    active.append([pending._begin, pending._end])
+                pending = next(period2, None)
+
+            while active and active[0][1] < p1_begin:
+                active.popleft()
+
+            if not active or active[0][0] > p1_end:
+                yield p1
+                continue
+
+            cursor = p1_begin
+            for begin, end in active:
+                if begin > p1_end:
+                    break
+
+                if begin > cursor:
+                    yield cls._new(cursor, begin - 1, p1.data)
+
+                if end >= p1_end:
+                    cursor = None
+                    break
+
+                cursor = end + 1
+
+            if cursor is not None:
+                yield cls._new(cursor, p1_end, p1.data)
+
+    @classmethod
+    def iter_circle_crossing(cls, period1: Iterable[CLASS_ITEM_TYPE],
+                             period2: Iterable[CLASS_ITEM_TYPE]) -> Iterator[CLASS_ITEM_TYPE]:
+        """
+        Потоковое циклическое пересечение периодов.
+
+        period1 и period2 должны быть отсортированы по begin (иначе вызывается ValueError).
+        Результат совпадает с circle_crossing и возвращается генератором. В памяти хранятся
+        только периоды period2, которые еще могут пересечься с текущим периодом period1.
+        """
+        period2 = cls._iter_sorted(period2)
+        pending = next(period2, None)
+
+        if pending is None:
+            yield from cls._iter_sorted(period1)
+            return
+
+        window = []
+
+        for p1 in cls._iter_sorted(period1):
+            while pending is not None and pending._begin <= p1._end:
+                window.append(pending)
+                pending = next(period2, None)
+
+            window = [p2 for p2 in window if p2._end >= p1._begin]
+
+            for p2 in window:
+                if p2._begin <= p1._end:
+                    yield p1.crossing(p2)
+
+    @classmethod
+    def iter_circle_add(cls, period1: Iterable[CLASS_ITEM_TYPE],
+                        period2: Iterable[CLASS_ITEM_TYPE]) -> Iterator[CLASS_ITEM_TYPE]:
+        """
+        Потоковое сложение периодов.
+
+        period1 и period2 должны быть отсортированы по begin (иначе вызывается ValueError).
+        В отличие от circle_add, который возвращает результаты сложения всех пар периодов,
+        возвращается объединение: пересекающиеся периоды обоих наборов склеиваются
+        (атрибут data берется у самого раннего из них), остальные возвращаются как есть.
+        """
+        merged = heapq.merge(cls._iter_sorted(period1), cls._iter_sorted(period2), key=lambda x: x._begin)
+        current = next(merged, None)
+
+        for p in merged:
+            if p._begin <= current._end:
+                if p._end > current._end:
+                    current = cls._new(current._begin, p._end, current.data)
+            else:
+                yield current
+                current = p
+
+        if current is not None:
+            yield current
+
+
+# Прямая запись в слоты DatePeriod в обход __setattr__ у FrozenDatePeriod
+_set_begin = DatePeriod._begin.__set__
+_set_end = DatePeriod._end.__set__
+_set_data = DatePeriod.data.__set__
+_set_protect_data = DatePeriod.protect_data.__set__
+
+
+class FrozenDatePeriod(DatePeriod):
+    """
+    Неизменяемый период дат.
+
+    После создания атрибуты периода изменить нельзя (вызывается AttributeError),
+    поэтому его можно безопасно использовать в качестве ключа словаря или элемента множества.
+    Результаты операций над таким периодом также являются FrozenDatePeriod.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, begin: PERIOD_TYPE, end: PERIOD_TYPE,
+                 data: Any = None, protect_data: bool = False):
+        self._check_periods(begin, end)
+
+        _set_begin(self, begin.toordinal())
+        _set_end(self, end.toordinal())
+        _set_data(self, data)
+        _set_protect_data(self, protect_data)
+
+    @classmethod
+    def _new(cls, begin: int, end: int, data: Any = None, protect_data: bool = False) -> 'FrozenDatePeriod':
+        self = cls.__new__(cls)
+        _set_begin(self, begin)
+        _set_end(self, end)
+        _set_data(self, data)
+        _set_protect_data(self, protect_data)
+        return self
+
+    def __setattr__(self, key, value):
+        raise AttributeError('FrozenDatePeriod is immutable')
+
+    def __delattr__(self, item):
+        raise AttributeError('FrozenDatePeriod is immutable')
+
+    def __reduce__(self):
+        return type(self), (self.begin, self.end, self.data, self.protect_data)
+
+    def __copy__(self) -> 'FrozenDatePeriod':
+        return self
+
+
+def sort_periods(periods: Iterable[CLASS_ITEM_TYPE], reverse: bool = False) -> List[CLASS_ITEM_TYPE]:
+    """Новый список периодов, отсортированный по (begin, end). Сортировка устойчивая"""
+    items = list(periods)
+    for p in items:
+        if not isinstance(p, DatePeriod):
+            raise TypeError
+
+    items.sort(key=DatePeriod.sort_key, reverse=reverse)
+    return items
@@ -0,0 +1,169 @@
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional
+
+from periods.date.periods import DatePeriod
+
+# Операции DatePeriod, которые учитываются при профилировании
+OPERATIONS = (
+    '__contains__', '__lt__', '__le__', '__eq__', '__ne__', '__gt__', '__ge__',
+    '__add__', '__sub__', 'split', 'is_crossing', 'crossing', 'must_crossing', 'relation',
+    'merge', 'circle_sub', 'circle_crossing', 'circle_add', 'crossing_pairs',
+    'iter_circle_sub', 'iter_circle_crossing', 'iter_circle_add',
+    'from_records', 'from_iso_strings', 'from_ordinals',
+)
+
+
+class OperationStats(NamedTuple):
+    calls: int
+    time: float
+
+
+class Profiler:
+    """
+    Счетчики вызовов и суммарное время операций DatePeriod.
+
+    Пока профилировщик включен (enable или блок with), операции из operations
+    заменяются на уровне класса DatePeriod обертками, которые считают вызовы и время
+    (time.perf_counter). После выключения исходные методы возвращаются на место,
+    поэтому без профилировщика накладных расходов нет.
+
+    Время операции включает время вложенных вызовов: например, вызовы __add__
+    внутри circle_add учитываются и в __add__, и в circle_add. Для потоковых операций
+    (iter_circle_*) вызовом считается создание генератора, а время суммируется по всем
+    получениям элементов результата, без времени обработки элементов вызывающим кодом.
+
+    Замена методов действует на весь процесс, поэтому одновременно может быть
+    включен только один профилировщик (иначе RuntimeError). Включение и выключение
+    защищены блокировкой, но пока профилировщик включен, учитываются вызовы из всех потоков,
+    а счетчики обновляются без блокировки: при одновременных вызовах из нескольких потоков
+    часть вызовов и времени может быть не учтена. Для точных результатов профилировщик
+    нужно использовать в одном потоке.
+    """
+
+    _active = None
+    _lock = threading.Lock()
+
+    def __init__(self, operations: Iterable[str] = OPERATIONS):
+        self.operations = tuple(operations)
+        for name in self.operations:
+            if name not in OPERATIONS:
+                raise ValueError('Unknown operation: {}'.format(name))
+
+        self._calls = dict.fromkeys(self.operations, 0)
+        self._time = dict.fromkeys(self.operations, 0.0)
+        self._originals = {}
+
+    @property
+    def enabled(self) -> bool:
+        return Profiler._active is self
+
+    def _wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        calls = self._calls
+        spent = self._time
+        perf_counter = time.perf_counter
+
+        if inspect.isgeneratorfunction(func):
+            def measure(generator):
+                while True:
+                    start = perf_counter()
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        return
+                    finally:
+                        spent[name] += perf_counter() - start
+                    yield item
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                calls[name] += 1
+                return measure(func(*args, **kwargs))
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                calls[name] += 1
+                start = perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    spent[name] += perf_counter() - start
+
+        return wrapper
+
+    def enable(self):
+        """Включение профилировщика"""
+        with Profiler._lock:
+            if Profiler._active is not None:
+                raise RuntimeError('Profiler is already enabled')
+
+            Profiler._active = self
+            for name in self.operations:
+                # Берется атрибут из словаря класса, чтобы сохранить classmethod/staticmethod
+                original = DatePeriod.__dict__[name]
+                self._originals[name] = original
+
+                if isinstance(original, classmethod):
+                    wrapped = classmethod(self._wrap(name, original.__func__))
+                elif isinstance(original, staticmethod):
+                    wrapped = staticmethod(self._wrap(name, original.__func__))
+                else:
+                    wrapped = self._wrap(name, original)
+
+                setattr(DatePeriod, name, wrapped)
+
+    def disable(self):
+        """Выключение профилировщика с возвратом исходных методов"""
+        with Profiler._lock:
+            if not self.enabled:
+                return
+
+            for name, original in self._originals.items():
+                setattr(DatePeriod, name, original)
+
+            self._originals = {}
+            Profiler._active = None
+
+    def __enter__(self) -> 'Profiler':
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disable()
+
+    def reset(self):
+        """Обнуление счетчиков"""
+        for name in self.operations:
+            self._calls[name] = 0
+            self._time[name] = 0.0
+
+    def stats(self) -> Dict[str, OperationStats]:
+        """Статистика по операциям, которые вызывались хотя бы раз"""
+        return {name: OperationStats(self._calls[name], self._time[name])
+                for name in self.operations if self._calls[name]}
+
+    def as_dict(self, prefix: Optional[str] = None) -> Dict[str, float]:
+        """
+        Статистика в виде плоского словаря для систем сбора метрик:
+        {'<операция>.calls': количество вызовов, '<операция>.time': время в секундах}.
+        Если передан prefix, то он добавляется к ключам через точку.
+        """
+        prefix = '' if prefix is None else prefix + '.'
+        res = {}
+        for name, item in self.stats().items():
+            res['{}{}.calls'.format(prefix, name)] = item.calls
+            res['{}{}.time'.format(prefix, name)] = item.time
+        return res
+
+
+def profile(operations: Iterable[str] = OPERATIONS) -> Profiler:
+    """
+    Профилировщик операций DatePeriod для использования в блоке with:
+
+        with profile() as profiler:
+            DatePeriod.circle_sub(period1, period2)
+        profiler.as_dict()
+    """
+    return Profiler(operations)
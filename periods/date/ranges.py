@@ -0,0 +1,110 @@
+import calendar
+import datetime
+from collections.abc import Sequence
+from typing import Callable, Iterator, Optional, Union
+
+
+def add_months(date: datetime.date, months: int) -> datetime.date:
+    """
+    Сдвиг даты на переданное количество месяцев.
+
+    Если в получившемся месяце нет такого дня, то берется последний день месяца
+    (31.01.2020 + 1 месяц = 29.02.2020).
+    """
+    year, month = divmod(date.month - 1 + months, 12)
+    year += date.year
+    month += 1
+    return datetime.date(year, month, min(date.day, calendar.monthrange(year, month)[1]))
+
+
+class DateRange(Sequence):
+    """
+    Ленивое представление последовательности дат периода (аналог range).
+
+    Даты не хранятся, а вычисляются по номеру элемента, поэтому len, получение
+    элемента по индексу, срезы, reversed и проверка вхождения (in) выполняются за O(1)
+    и не зависят от длины периода.
+
+    Создается методами DatePeriod.days, DatePeriod.weeks и DatePeriod.months.
+    """
+
+    __slots__ = ('_range', '_to_date', '_from_date')
+
+    def __init__(self, numbers: range, to_date: Callable[[int], datetime.date],
+                 from_date: Callable[[datetime.date], Optional[int]]):
+        self._range = numbers
+        self._to_date = to_date
+        self._from_date = from_date
+
+    @classmethod
+    def days(cls, begin: datetime.date, end: datetime.date, step: int = 1) -> 'DateRange':
+        """Даты с begin по end включительно с шагом step дней"""
+        cls._check_step(step)
+        return cls(range(begin.toordinal(), end.toordinal() + 1, step),
+                   datetime.date.fromordinal, datetime.date.toordinal)
+
+    @classmethod
+    def months(cls, begin: datetime.date, end: datetime.date, step: int = 1) -> 'DateRange':
+        """Даты с begin по end включительно с шагом step месяцев, считая от begin"""
+        cls._check_step(step)
+
+        count = (end.year - begin.year) * 12 + end.month - begin.month
+        if add_months(begin, count) > end:
+            count -= 1
+
+        def to_date(number: int) -> datetime.date:
+            return add_months(begin, number)
+
+        def from_date(date: datetime.date) -> Optional[int]:
+            number = (date.year - begin.year) * 12 + date.month - begin.month
+            if number < 0 or add_months(begin, number) != date:
+                return None
+            return number
+
+        return cls(range(0, count + 1, step), to_date, from_date)
+
+    @staticmethod
+    def _check_step(step: int):
+        if not isinstance(step, int):
+            raise TypeError
+
+        if step < 1:
+            raise ValueError('Wrong step')
+
+    def __len__(self):
+        return len(self._range)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[datetime.date, 'DateRange']:
+        if isinstance(item, slice):
+            return DateRange(self._range[item], self._to_date, self._from_date)
+
+        return self._to_date(self._range[item])
+
+    def __iter__(self) -> Iterator[datetime.date]:
+        return map(self._to_date, self._range)
+
+    def __reversed__(self) -> Iterator[datetime.date]:
+        return map(self._to_date, reversed(self._range))
+
+    def _number(self, item: datetime.date) -> Optional[int]:
+        # Как и в DatePeriod.__contains__, datetime не приводится к дате
+        if isinstance(item, datetime.datetime):
+            raise TypeError
+        elif not isinstance(item, datetime.date):
+            return None
+
+        return self._from_date(item)
+
+    def __contains__(self, item: datetime.date) -> bool:
+        number = self._number(item)
+        return number is not None and number in self._range
+
+    def index(self, item: datetime.date) -> int:
+        number = self._number(item)
+        if number is None or number not in self._range:
+            raise ValueError('{} is not in range'.format(item))
+
+        return self._range.index(number)
+
+    def count(self, item: datetime.date) -> int:
+        return int(item in self)
@@ -0,0 +1,329 @@
+import bisect
+import datetime
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Union
+
+from periods.date.periods import DatePeriod, FULL_ITEM_TYPE, CLASS_ITEM_TYPE
+
+SET_ITEM_TYPE = Union['PeriodSet', CLASS_ITEM_TYPE, Iterable[CLASS_ITEM_TYPE]]
+
+
+class PeriodSet:
+    """
+    Нормализованный набор периодов дат.
+
+    Периоды набора всегда отсортированы, не пересекаются и не являются смежными:
+    пересекающиеся и смежные периоды при создании набора склеиваются в один.
+    При склеивании атрибут data берется у самого раннего периода.
+
+    Операции объединения (|), пересечения (&), разности (-) и симметричной
+    разности (^) выполняются одним проходом по обоим наборам за O(n + m).
+    """
+
+    def __init__(self, periods: Iterable[CLASS_ITEM_TYPE] = ()):
+        periods = list(periods)
+        for p in periods:
+            if not isinstance(p, DatePeriod):
+                raise TypeError
+
+        periods.sort(key=DatePeriod.sort_key)
+        self._periods = self._coalesce(periods)
+        self._ends = None
+
+    @classmethod
+    def _from_sorted(cls, periods: List[CLASS_ITEM_TYPE]) -> 'PeriodSet':
+        """Создание набора из уже нормализованного списка периодов без проверок"""
+        res = cls.__new__(cls)
+        res._periods = periods
+        res._ends = None
+        return res
+
+    @staticmethod
+    def _coalesce(periods: Iterable[CLASS_ITEM_TYPE]) -> List[CLASS_ITEM_TYPE]:
+        """Склеивание пересекающихся и смежных периодов из отсортированной по begin последовательности"""
+        res = []
+        for p in periods:
+            if res and p._begin - res[-1]._end <= 1:
+                last = res[-1]
+                if p._end > last._end:
+                    res[-1] = last._new(last._begin, p._end, last.data)
+            else:
+                res.append(p)
+        return res
+
+    @classmethod
+    def _coerce(cls, other: SET_ITEM_TYPE) -> 'PeriodSet':
+        if isinstance(other, PeriodSet):
+            return other
+        elif isinstance(other, DatePeriod):
+            return cls._from_sorted([other, ])
+        elif isinstance(other, (datetime.date, datetime.datetime)):
+            raise TypeError
+        else:
+            return cls(other)
+
+    def __iter__(self) -> Iterator[CLASS_ITEM_TYPE]:
+        return iter(self._periods)
+
+    def __len__(self):
+        """Количество периодов в наборе"""
+        return len(self._periods)
+
+    def __bool__(self):
+        return bool(self._periods)
+
+    def __getitem__(self, item: int) -> CLASS_ITEM_TYPE:
+        return self._periods[item]
+
+    def __str__(self) -> str:
+        return '[{}]'.format(', '.join(str(p) for p in self._periods))
+
+    def __eq__(self, other: 'PeriodSet') -> bool:
+        if not isinstance(other, PeriodSet):
+            return NotImplemented
+
+        return len(self._periods) == len(other._periods) and \
+            all(a == b for a, b in zip(self._periods, other._periods))
+
+    def days(self) -> int:
+        """Общее количество дней во всех периодах набора"""
+        return sum(len(p) for p in self._periods)
+
+    def __contains__(self, item: FULL_ITEM_TYPE) -> bool:
+        """Проверка того, что дата/период полностью покрывается набором. Поиск бинарный"""
+        if isinstance(item, DatePeriod):
+            begin, end = item._begin, item._end
+        elif isinstance(item, datetime.datetime):
+            raise TypeError
+        elif isinstance(item, datetime.date):
+            begin = end = item.toordinal()
+        else:
+            raise TypeError
+
+        if self._ends is None:
+            self._ends = [p._end for p in self._periods]
+
+        i = bisect.bisect_left(self._ends, begin)
+        if i == len(self._periods):
+            return False
+
+        return self._periods[i]._begin <= begin and end <= self._periods[i]._end
+
+    def union(self, other: SET_ITEM_TYPE) -> 'PeriodSet':
+        """Объединение наборов"""
+        a = self._periods
+        b = self._coerce(other)._periods
+
+        merged = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if (b[j]._begin, b[j]._end) < (a[i]._begin, a[i]._end):
+                merged.append(b[j])
+                j += 1
+            else:
+                merged.append(a[i])
+                i += 1
+        merged.extend(a[i:])
+        merged.extend(b[j:])
+
+        return self._from_sorted(self._coalesce(merged))
+
+    def intersection(self, other: SET_ITEM_TYPE) -> 'PeriodSet':
+        """Пересечение наборов. Атрибут data берется из периодов данного набора"""
+        a = self._periods
+        b = self._coerce(other)._periods
+
+        res = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            p1, p2 = a[i], b[j]
+            begin = p1._begin if p1._begin > p2._begin else p2._begin
+            end = p1._end if p1._end < p2._end else p2._end
+
+            if begin <= end:
+                if begin == p1._begin and end == p1._end:
+                    res.append(p1)
+                else:
+                    res.append(p1._new(begin, end, p1.data))
+
+            if p1._end < p2._end:
+                i += 1
+            else:
+                j += 1
+
+        return self._from_sorted(res)
+
+    def difference(self, other: SET_ITEM_TYPE) -> 'PeriodSet':
+        """Разность наборов. Атрибут data берется из периодов данного набора"""
+        a = self._periods
+        b = self._coerce(other)._periods
+
+        res = []
+        j = 0
+        for p1 in a:
+            while j < len(b) and b[j]._end < p1._begin:
+                j += 1
+
+            if j == len(b) or b[j]._begin > p1._end:
+                res.append(p1)
+                continue
+
+            cursor = p1._begin
+            k = j
+            while k < len(b) and b[k]._begin <= p1._end:
+                if b[k]._begin > cursor:
+                    res.append(p1._new(cursor, b[k]._begin - 1, p1.data))
+
+                if b[k]._end >= p1._end:
+                    cursor = None
+                    break
+
+                cursor = b[k]._end + 1
+                k += 1
+
+            if cursor is not None:
+                res.append(p1._new(cursor, p1._end, p1.data))
+
+        return self._from_sorted(res)
+
+    def symmetric_difference(self, other: SET_ITEM_TYPE) -> 'PeriodSet':
+        """Симметричная разность наборов"""
+        other = self._coerce(other)
+        return self.difference(other).union(other.difference(self))
+
+    def __or__(self, other: SET_ITEM_TYPE) -> 'PeriodSet':
+        return self.union(other)
+
+    def __and__(self, other: SET_ITEM_TYPE) -> 'PeriodSet':
+        return self.intersection(other)
+
+    def __sub__(self, other: SET_ITEM_TYPE) -> 'PeriodSet':
+        return self.difference(other)
+
+    def __xor__(self, other: SET_ITEM_TYPE) -> 'PeriodSet':
+        return self.symmetric_difference(other)
+
+
+class PeriodSetChange(NamedTuple):
+    """Изменение набора: added — периоды, добавленные в набор, removed — удаленные из него периоды"""
+    added: List[CLASS_ITEM_TYPE]
+    removed: List[CLASS_ITEM_TYPE]
+
+
+class MutablePeriodSet(PeriodSet):
+    """
+    Изменяемый нормализованный набор периодов дат.
+
+    Наряду с границами периодов хранятся отсортированные списки их начал и окончаний,
+    поэтому add и discard находят затронутые периоды бинарным поиском за O(log n)
+    и заменяют только их: при добавлении склеиваются соседние пересекающиеся и смежные
+    периоды, при удалении крайние периоды обрезаются.
+
+    Замена выполняется присваиванием срезу трех списков, т.е. изменение набора занимает
+    O(n) с малой константой (сдвиг элементов списка выполняется на C). Это значительно
+    быстрее пересчета всего набора, но не O(log n).
+
+    Каждое изменение возвращается как PeriodSetChange и передается подписчикам (subscribe).
+    Если набор не изменился, подписчики не вызываются.
+    """
+
+    def __init__(self, periods: Iterable[CLASS_ITEM_TYPE] = ()):
+        super().__init__(periods)
+        self._index()
+
+    @classmethod
+    def _from_sorted(cls, periods: List[CLASS_ITEM_TYPE]) -> 'MutablePeriodSet':
+        res = super()._from_sorted(periods)
+        res._index()
+        return res
+
+    def _index(self):
+        self._begins = [p._begin for p in self._periods]
+        self._ends = [p._end for p in self._periods]
+        self._listeners = []
+
+    def subscribe(self, callback: Callable[[PeriodSetChange], None]):
+        """Подписка на изменения набора. callback вызывается с PeriodSetChange после каждого изменения"""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[PeriodSetChange], None]):
+        """Отмена подписки. Если подписки нет, то вызывается ValueError"""
+        self._listeners.remove(callback)
+
+    def _replace(self, i: int, j: int, periods: List[CLASS_ITEM_TYPE]) -> PeriodSetChange:
+        """Замена периодов набора с индексами i..j-1 на periods"""
+        change = PeriodSetChange(periods, self._periods[i:j])
+
+        self._periods[i:j] = periods
+        self._begins[i:j] = [p._begin for p in periods]
+        self._ends[i:j] = [p._end for p in periods]
+
+        for callback in list(self._listeners):
+            callback(change)
+
+        return change
+
+    def add(self, period: CLASS_ITEM_TYPE) -> PeriodSetChange:
+        """
+        Добавление периода в набор.
+
+        Пересекающиеся и смежные с ним периоды набора склеиваются с ним в один,
+        атрибут data берется у самого раннего из них (при равных началах — у периода набора).
+        """
+        if not isinstance(period, DatePeriod):
+            raise TypeError
+
+        begin, end = period._begin, period._end
+        # Периоды набора с индексами i..j-1 пересекаются с period или являются смежными
+        i = bisect.bisect_left(self._ends, begin - 1)
+        j = bisect.bisect_right(self._begins, end + 1)
+
+        if i == j:
+            return self._replace(i, i, [period, ])
+
+        first, last = self._periods[i], self._periods[j - 1]
+        if j - i == 1 and first._begin <= begin and end <= first._end:
+            return PeriodSetChange([], [])
+
+        if first._begin <= begin:
+            begin, data, make = first._begin, first.data, first._new
+        else:
+            data, make = period.data, period._new
+
+        if last._end > end:
+            end = last._end
+
+        return self._replace(i, j, [make(begin, end, data), ])
+
+    def update(self, periods: Iterable[CLASS_ITEM_TYPE]):
+        """Добавление нескольких периодов в набор"""
+        for period in periods:
+            self.add(period)
+
+    def discard(self, period: CLASS_ITEM_TYPE) -> PeriodSetChange:
+        """Удаление дней периода из набора. Периоды набора, частично входящие в period, обрезаются"""
+        if not isinstance(period, DatePeriod):
+            raise TypeError
+
+        begin, end = period._begin, period._end
+        # Периоды набора с индексами i..j-1 пересекаются с period
+        i = bisect.bisect_left(self._ends, begin)
+        j = bisect.bisect_right(self._begins, end)
+
+        if i >= j:
+            return PeriodSetChange([], [])
+
+        pieces = []
+        first, last = self._periods[i], self._periods[j - 1]
+        if first._begin < begin:
+            pieces.append(first._new(first._begin, begin - 1, first.data))
+        if last._end > end:
+            pieces.append(last._new(end + 1, last._end, last.data))
+
+        return self._replace(i, j, pieces)
+
+    def remove(self, period: CLASS_ITEM_TYPE) -> PeriodSetChange:
+        """Удаление дней периода из набора. Если период не входит в набор полностью, то вызывается ValueError"""
+        if period not in self:
+            raise ValueError('Period not found')
+
+        return self.discard(period)
@@ -0,0 +1,64 @@
+import heapq
+import operator
+from typing import Iterable, Iterator, Optional
+
+from periods.date.periods import DatePeriod, CLASS_ITEM_TYPE
+
+
+def free_slots(calendars: Iterable[Iterable[CLASS_ITEM_TYPE]], within: CLASS_ITEM_TYPE, min_length: int = 1,
+               limit: Optional[int] = None) -> Iterator[CLASS_ITEM_TYPE]:
+    """
+    Поиск общих свободных периодов нескольких календарей.
+
+    calendars — календари занятости, каждый из которых отсортирован по begin (проверяется
+    на лету, при нарушении порядка вызывается ValueError). Календари объединяются
+    слиянием через кучу (heapq.merge) без сортировки и склеивания всех периодов сразу,
+    свободные периоды внутри within длиной не меньше min_length дней возвращаются
+    генератором по возрастанию дат.
+
+    Проход останавливается, как только найдено limit свободных периодов или занятые
+    периоды начинаются после окончания within, поэтому остальные периоды календарей
+    (например, строки из БД) не читаются.
+
+    Аргументы within, min_length и limit проверяются сразу при вызове, порядок и тип
+    периодов календарей — по мере чтения.
+    """
+    if not isinstance(within, DatePeriod):
+        raise TypeError
+
+    if not isinstance(min_length, int) or not isinstance(limit, (int, type(None))):
+        raise TypeError
+
+    if min_length < 1:
+        raise ValueError('Wrong length')
+
+    if limit is not None and limit < 1:
+        return iter(())
+
+    return _free_slots(calendars, within, min_length, limit)
+
+
+def _free_slots(calendars: Iterable[Iterable[CLASS_ITEM_TYPE]], within: CLASS_ITEM_TYPE, min_length: int,
+                limit: Optional[int]) -> Iterator[CLASS_ITEM_TYPE]:
+    found = 0
+    cursor, stop = within._begin, within._end
+    busy = heapq.merge(*(DatePeriod._iter_sorted(calendar) for calendar in calendars),
+                       key=operator.attrgetter('_begin'))
+
+    for p in busy:
+        if p._begin > stop:
+            break
+
+        if p._begin - cursor >= min_length:
+            yield DatePeriod._new(cursor, p._begin - 1)
+            found += 1
+            if found == limit:
+                return
+
+        if p._end >= cursor:
+            cursor = p._end + 1
+            if cursor > stop:
+                return
+
+    if stop - cursor + 1 >= min_length:
+        yield DatePeriod._new(cursor, stop)
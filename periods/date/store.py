@@ -0,0 +1,240 @@
+import array
+import bisect
+import datetime
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, List
+
+from periods.date.binary import _from_le, _to_le
+from periods.date.periods import DatePeriod, PERIOD_TYPE, CLASS_ITEM_TYPE, sort_periods
+
+# Заголовок файла: сигнатура, версия формата, зарезервировано (little-endian)
+_HEADER = struct.Struct('<4sHH')
+_MAGIC = b'PRDT'
+_VERSION = 1
+# Запись: начало и окончание периода (int32, date.toordinal())
+_RECORD_SIZE = 8
+
+
+class PeriodStore:
+    """
+    Хранилище периодов дат в файле, отображаемом в память (mmap).
+
+    Файл состоит из заголовка и записей фиксированной длины (начало и окончание периода
+    как date.toordinal(), int32 little-endian), отсортированных по begin. В памяти хранится
+    только разреженный индекс: для каждого блока из block_size записей — максимальное
+    окончание в блоке и максимальное окончание во всех блоках до него включительно.
+
+    Запросы overlapping и containing находят границы просмотра бинарным поиском и
+    пропускают блоки, в которых нет подходящих периодов. Экземпляры DatePeriod создаются
+    только для найденных записей, атрибут data найденного периода — номер записи в хранилище.
+
+    Новые периоды дописываются в конец файла, поэтому их begin не может быть раньше
+    begin последнего периода хранилища (иначе вызывается ValueError).
+    """
+
+    def __init__(self, path: str, block_size: int = 1024):
+        if not isinstance(block_size, int):
+            raise TypeError
+
+        if block_size < 1:
+            raise ValueError('Wrong block size')
+
+        self.path = path
+        self.block_size = block_size
+
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, 0))
+
+        self._file = open(path, 'r+b')
+        self._mmap = None
+        self._view = None
+        self._records = []
+        self._block_max = []
+        self._prefix_max = []
+
+        try:
+            self._map()
+        except Exception:
+            self.close()
+            raise
+
+        self._build_index()
+
+    @classmethod
+    def create(cls, path: str, periods: Iterable[CLASS_ITEM_TYPE], block_size: int = 1024) -> 'PeriodStore':
+        """Создание хранилища из набора периодов в произвольном порядке. Существующий файл перезаписывается"""
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, 0))
+
+        store = cls(path, block_size)
+        try:
+            store.extend(sort_periods(periods))
+        except Exception:
+            store.close()
+            raise
+
+        return store
+
+    def _map(self):
+        """Отображение файла в память и проверка заголовка"""
+        size = os.fstat(self._file.fileno()).st_size
+        if size < _HEADER.size or (size - _HEADER.size) % _RECORD_SIZE:
+            raise ValueError('Wrong format')
+
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        magic, version, _ = _HEADER.unpack_from(self._view)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('Wrong format')
+
+        # Начала и окончания чередуются: [begin0, end0, begin1, end1, ...]
+        self._records = _from_le(self._view[_HEADER.size:], 'i')
+
+    def _unmap(self):
+        if isinstance(self._records, memoryview):
+            self._records.release()
+        self._records = []
+
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _build_index(self, start_block: int = 0):
+        """Пересчет разреженного индекса начиная с блока start_block"""
+        del self._block_max[start_block:]
+        del self._prefix_max[start_block:]
+
+        records = self._records
+        step = self.block_size * 2
+        for position in range(start_block * step, len(records), step):
+            block_max = max(records[position + 1:position + step:2])
+            self._block_max.append(block_max)
+            if self._prefix_max and self._prefix_max[-1] > block_max:
+                self._prefix_max.append(self._prefix_max[-1])
+            else:
+                self._prefix_max.append(block_max)
+
+    def close(self):
+        """Закрытие файла хранилища"""
+        self._unmap()
+        self._block_max = []
+        self._prefix_max = []
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'PeriodStore':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return len(self._records) // 2
+
+    def _period(self, index: int) -> CLASS_ITEM_TYPE:
+        return DatePeriod._new(self._records[index * 2], self._records[index * 2 + 1], index)
+
+    def __getitem__(self, index: int) -> CLASS_ITEM_TYPE:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('index out of range')
+
+        return self._period(index)
+
+    def __iter__(self) -> Iterator[CLASS_ITEM_TYPE]:
+        for index in range(len(self)):
+            yield self._period(index)
+
+    def append(self, period: CLASS_ITEM_TYPE):
+        """Добавление периода в конец хранилища"""
+        self.extend([period, ])
+
+    def extend(self, periods: Iterable[CLASS_ITEM_TYPE]):
+        """
+        Добавление периодов в конец хранилища одной записью в файл.
+
+        Периоды должны быть отсортированы по begin и начинаться не раньше последнего
+        периода хранилища, иначе вызывается ValueError и хранилище не изменяется.
+        """
+        records = array.array('i')
+        last = self._records[-2] if len(self._records) else None
+
+        for p in periods:
+            if not isinstance(p, DatePeriod):
+                raise TypeError
+
+            if last is not None and p._begin < last:
+                raise ValueError('Periods are not sorted')
+
+            records.append(p._begin)
+            records.append(p._end)
+            last = p._begin
+
+        if not records:
+            return
+
+        start_block = len(self) // self.block_size
+
+        self._unmap()
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(_to_le(records))
+        self._file.flush()
+        self._map()
+
+        self._build_index(start_block)
+
+    def _bisect_begin(self, ordinal: int) -> int:
+        """Количество периодов с begin <= ordinal"""
+        records = self._records
+        lo, hi = 0, len(self)
+        while lo < hi:
+            middle = (lo + hi) // 2
+            if records[middle * 2] <= ordinal:
+                lo = middle + 1
+            else:
+                hi = middle
+        return lo
+
+    def _overlapping(self, begin: int, end: int) -> List[CLASS_ITEM_TYPE]:
+        res = []
+        records = self._records
+
+        stop = self._bisect_begin(end)
+        # В блоках до first_block нет периодов, заканчивающихся не раньше begin
+        first_block = bisect.bisect_left(self._prefix_max, begin)
+
+        for block in range(first_block, -(-stop // self.block_size)):
+            if self._block_max[block] < begin:
+                continue
+
+            for index in range(block * self.block_size, min((block + 1) * self.block_size, stop)):
+                if records[index * 2 + 1] >= begin:
+                    res.append(DatePeriod._new(records[index * 2], records[index * 2 + 1], index))
+
+        return res
+
+    def overlapping(self, period: CLASS_ITEM_TYPE) -> List[CLASS_ITEM_TYPE]:
+        """Периоды, которые пересекаются с переданным периодом, в порядке хранения"""
+        if not isinstance(period, DatePeriod):
+            raise TypeError
+
+        return self._overlapping(period._begin, period._end)
+
+    def containing(self, item: PERIOD_TYPE) -> List[CLASS_ITEM_TYPE]:
+        """Периоды, в которые входит переданная дата, в порядке хранения"""
+        # Как и в DatePeriod.__contains__, datetime не приводится к дате
+        if isinstance(item, datetime.datetime) or not isinstance(item, datetime.date):
+            raise TypeError
+
+        ordinal = item.toordinal()
+        return self._overlapping(ordinal, ordinal)
@@ -0,0 +1 @@
+from .periods import DateTimePeriod
@@ -0,0 +1,79 @@
+import datetime
+from typing import Any, Optional, Union
+
+from periods.granular import GranularPeriod
+
+PERIOD_TYPE = Union[datetime.datetime, datetime.date]
+CLASS_ITEM_TYPE = 'DateTimePeriod'
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+class DateTimePeriod(GranularPeriod):
+    """
+    Класс для работы с периодами даты и времени с заданной дискретностью (granularity).
+
+    Значения границ округляются вниз до начала тика длиной granularity (отсчет от 01.01.1970),
+    обе границы входят в период. Например, при granularity в один час период
+    DateTimePeriod(datetime(2020, 1, 1, 9, 30), datetime(2020, 1, 1, 11, 0))
+    состоит из трех часовых тиков: 09:00, 10:00 и 11:00.
+
+    Операции допускаются только между периодами с одинаковой дискретностью,
+    иначе вызывается ValueError. Поддерживаются только datetime без часового пояса.
+    """
+
+    __slots__ = ('_step', )
+
+    default_granularity = datetime.timedelta(minutes=1)
+
+    def __init__(self, begin: PERIOD_TYPE, end: PERIOD_TYPE, data: Any = None, protect_data: bool = False,
+                 granularity: Optional[datetime.timedelta] = None):
+        if granularity is None:
+            granularity = self.default_granularity
+        elif not isinstance(granularity, datetime.timedelta):
+            raise TypeError
+
+        step = granularity // _MICROSECOND
+        if step <= 0:
+            raise ValueError('Wrong granularity')
+
+        self._step = step
+        super().__init__(begin, end, data, protect_data)
+
+    @property
+    def granularity(self) -> datetime.timedelta:
+        return datetime.timedelta(microseconds=self._step)
+
+    def _new(self, begin: int, end: int, data: Any = None, protect_data: bool = False) -> CLASS_ITEM_TYPE:
+        res = super()._new(begin, end, data, protect_data)
+        res._step = self._step
+        return res
+
+    def _is_value(self, item: Any) -> bool:
+        return isinstance(item, datetime.date)
+
+    def _to_tick(self, value: PERIOD_TYPE) -> int:
+        if isinstance(value, datetime.datetime):
+            if value.tzinfo is not None:
+                raise TypeError('Timezone-aware datetime is not supported')
+        elif isinstance(value, datetime.date):
+            value = datetime.datetime(value.year, value.month, value.day)
+        else:
+            raise TypeError
+
+        return (value - EPOCH) // _MICROSECOND // self._step
+
+    def _from_tick(self, tick: int) -> datetime.datetime:
+        return EPOCH + datetime.timedelta(microseconds=tick * self._step)
+
+    def _check_other(self, other: Any):
+        if not isinstance(other, DateTimePeriod):
+            raise TypeError
+
+        if other._step != self._step:
+            raise ValueError('Different granularity')
+
+    def __str__(self) -> str:
+        return '{} - {}'.format(self.begin.strftime('%d.%m.%Y %H:%M:%S'), self.end.strftime('%d.%m.%Y %H:%M:%S'))
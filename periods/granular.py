@@ -0,0 +1,271 @@
+from abc import abstractmethod
+from typing import Any, Iterator, List, Optional
+
+from periods.base import Period, Relation, PERIOD_TYPE, ITEM_TYPE
+
+CLASS_ITEM_TYPE = 'GranularPeriod'
+
+BEFORE = Relation.BEFORE
+MEETS = Relation.MEETS
+OVERLAPS = Relation.OVERLAPS
+FINISHED_BY = Relation.FINISHED_BY
+CONTAINS = Relation.CONTAINS
+STARTS = Relation.STARTS
+EQUALS = Relation.EQUALS
+STARTED_BY = Relation.STARTED_BY
+DURING = Relation.DURING
+FINISHES = Relation.FINISHES
+OVERLAPPED_BY = Relation.OVERLAPPED_BY
+MET_BY = Relation.MET_BY
+AFTER = Relation.AFTER
+
+# Периоды не пересекаются
+NOT_CROSSING = frozenset((BEFORE, MEETS, MET_BY, AFTER))
+# other входит в self (other in self)
+CONTAINS_OTHER = frozenset((EQUALS, STARTED_BY, FINISHED_BY, CONTAINS))
+# self входит в other (self in other)
+INSIDE_OTHER = frozenset((EQUALS, STARTS, FINISHES, DURING))
+
+
+def tick_relation(s_begin: int, s_end: int, o_begin: int, o_end: int) -> Relation:
+    """Взаимное расположение периодов [s_begin, s_end] и [o_begin, o_end], заданных номерами тиков"""
+    if s_end < o_begin:
+        return MEETS if o_begin - s_end == 1 else BEFORE
+    if o_end < s_begin:
+        return MET_BY if s_begin - o_end == 1 else AFTER
+
+    if s_begin == o_begin:
+        if s_end == o_end:
+            return EQUALS
+        return STARTS if s_end < o_end else STARTED_BY
+
+    if s_end == o_end:
+        return FINISHED_BY if s_begin < o_begin else FINISHES
+
+    if s_begin < o_begin:
+        return CONTAINS if s_end > o_end else OVERLAPS
+
+    return DURING if s_end < o_end else OVERLAPPED_BY
+
+
+class GranularPeriod(Period):
+    """
+    Базовый класс для периодов с произвольной дискретностью (гранулярностью).
+
+    Границы периода хранятся как целые номера тиков (_begin, _end), обе границы входят
+    в период, поэтому все операции сводятся к сравнению целых чисел. Атрибуты begin и end
+    вычисляются из номеров тиков при обращении.
+
+    Подкласс определяет перевод границы в номер тика и обратно (_to_tick, _from_tick),
+    проверку того, что значение является границей (_is_value), и проверку совместимости
+    с другим периодом (_check_other).
+
+    Семантика операций совпадает с DatePeriod, где тиком является день.
+    """
+
+    __slots__ = ('_begin', '_end', 'data', 'protect_data')
+
+    def __init__(self, begin: PERIOD_TYPE, end: PERIOD_TYPE, data: Any = None, protect_data: bool = False):
+        begin_tick = self._to_tick(begin)
+        end_tick = self._to_tick(end)
+
+        if begin_tick > end_tick:
+            raise ValueError('Wrong dates')
+
+        self._begin = begin_tick
+        self._end = end_tick
+        self.data = data
+        self.protect_data = protect_data
+
+    @abstractmethod
+    def _to_tick(self, value: PERIOD_TYPE) -> int:
+        """Номер тика, в который попадает значение. Для значений неподходящего типа вызывается TypeError"""
+
+    @abstractmethod
+    def _from_tick(self, tick: int) -> PERIOD_TYPE:
+        """Значение начала тика с переданным номером"""
+
+    @abstractmethod
+    def _is_value(self, item: Any) -> bool:
+        """Проверка того, что item является значением границы периода (а не периодом)"""
+
+    @abstractmethod
+    def _check_other(self, other: Any):
+        """Проверка того, что с периодом other можно выполнять операции. Иначе вызывается исключение"""
+
+    def _new(self, begin: int, end: int, data: Any = None, protect_data: bool = False) -> CLASS_ITEM_TYPE:
+        """Создание периода того же вида из уже проверенных номеров тиков"""
+        res = self.__class__.__new__(self.__class__)
+        res._begin = begin
+        res._end = end
+        res.data = data
+        res.protect_data = protect_data
+        return res
+
+    @property
+    def begin(self) -> PERIOD_TYPE:
+        return self._from_tick(self._begin)
+
+    @begin.setter
+    def begin(self, value: PERIOD_TYPE):
+        self._begin = self._to_tick(value)
+
+    @property
+    def end(self) -> PERIOD_TYPE:
+        return self._from_tick(self._end)
+
+    @end.setter
+    def end(self, value: PERIOD_TYPE):
+        self._end = self._to_tick(value)
+
+    def __hash__(self):
+        return hash((self._begin, self._end))
+
+    def __iter__(self) -> Iterator[PERIOD_TYPE]:
+        """Ленивый итератор по началам тиков периода"""
+        return map(self._from_tick, range(self._begin, self._end + 1))
+
+    def __len__(self):
+        """Количество тиков в периоде"""
+        return self._end - self._begin + 1
+
+    def relation(self, other: CLASS_ITEM_TYPE) -> Relation:
+        """Взаимное расположение данного периода (self) относительно переданного периода (other)"""
+        self._check_other(other)
+        return tick_relation(self._begin, self._end, other._begin, other._end)
+
+    def __contains__(self, item: ITEM_TYPE) -> bool:
+        """Проверка вхождения значения/периода в данный период"""
+        if self._is_value(item):
+            return self._begin <= self._to_tick(item) <= self._end
+
+        self._check_other(item)
+        return self._begin <= item._begin and item._end <= self._end
+
+    def __lt__(self, other: ITEM_TYPE) -> bool:
+        """Проверка того, что данный период закончился раньше сравниваемого значения/периода и они НЕ ПЕРЕСЕКАЮТСЯ"""
+        if self._is_value(other):
+            return self._end < self._to_tick(other)
+
+        self._check_other(other)
+        return self._end < other._begin
+
+    def __le__(self, other: CLASS_ITEM_TYPE) -> bool:
+        """Проверка того, что данный период закончился раньше переданного периода и они ПЕРЕСЕКАЮТСЯ"""
+        return self.relation(other) is OVERLAPS
+
+    def __eq__(self, other: ITEM_TYPE) -> bool:
+        """Проверка того, что данный период идентичен второму периоду"""
+        if self._is_value(other):
+            return False
+
+        self._check_other(other)
+        return self._begin == other._begin and self._end == other._end
+
+    def __ne__(self, other: ITEM_TYPE) -> bool:
+        """Проверка того, что данный период не является идентичным второму периоду"""
+        return not self.__eq__(other)
+
+    def __gt__(self, other: ITEM_TYPE) -> bool:
+        """Проверка того, что данный период начался позже сравниваемого значения/периода и они НЕ ПЕРЕСЕКАЮТСЯ"""
+        if self._is_value(other):
+            return self._to_tick(other) < self._begin
+
+        self._check_other(other)
+        return other._end < self._begin
+
+    def __ge__(self, other: CLASS_ITEM_TYPE) -> bool:
+        """Проверка того, что данный период закончился позже переданного периода и они ПЕРЕСЕКАЮТСЯ"""
+        return self.relation(other) is OVERLAPPED_BY
+
+    def __add__(self, other: CLASS_ITEM_TYPE) -> List[CLASS_ITEM_TYPE]:
+        """Производит операцию добавления периода"""
+        relation = self.relation(other)
+
+        if relation in NOT_CROSSING:
+            return [self, other]
+        elif relation in CONTAINS_OTHER:
+            return [self, ]
+        elif relation in INSIDE_OTHER:
+            if self.protect_data:
+                return [other._new(other._begin, other._end, self.data, other.protect_data), ]
+            return [other, ]
+        elif relation is OVERLAPS:
+            return [self._new(self._begin, other._end, self.data), ]
+        else:
+            return [self._new(other._begin, self._end, self.data), ]
+
+    def __sub__(self, other: CLASS_ITEM_TYPE) -> List[CLASS_ITEM_TYPE]:
+        """Производит операцию вычитания периода"""
+        relation = self.relation(other)
+
+        if relation in NOT_CROSSING:
+            return [self, ]
+        elif relation in INSIDE_OTHER:
+            return []
+        elif relation is STARTED_BY or relation is OVERLAPPED_BY:
+            return [self._new(other._end + 1, self._end, self.data), ]
+        elif relation is FINISHED_BY or relation is OVERLAPS:
+            return [self._new(self._begin, other._begin - 1, self.data), ]
+        else:
+            return [
+                self._new(self._begin, other._begin - 1, self.data),
+                self._new(other._end + 1, self._end, self.data),
+            ]
+
+    def split(self, other: CLASS_ITEM_TYPE) -> List[CLASS_ITEM_TYPE]:
+        """Разбиение данного периода на периоды по переданному периоду (other)"""
+        relation = self.relation(other)
+
+        if relation in NOT_CROSSING or relation in INSIDE_OTHER:
+            return [self, ]
+        elif relation is OVERLAPS:
+            return [
+                self._new(self._begin, other._begin - 1, self.data),
+                self._new(other._begin, self._end, self.data),
+                self._new(self._end + 1, other._end, self.data),
+            ]
+        elif relation is OVERLAPPED_BY:
+            return [
+                self._new(other._begin, self._begin - 1, self.data),
+                self._new(self._begin, other._end, self.data),
+                self._new(other._end + 1, self._end, self.data),
+            ]
+        elif relation is STARTED_BY:
+            return [
+                self._new(other._begin, other._end, self.data),
+                self._new(other._end + 1, self._end, self.data),
+            ]
+        elif relation is FINISHED_BY:
+            return [
+                self._new(self._begin, other._begin - 1, self.data),
+                self._new(other._begin, other._end, self.data),
+            ]
+        else:
+            return [
+                self._new(self._begin, other._begin - 1, self.data),
+                self._new(other._begin, other._end, self.data),
+                self._new(other._end + 1, self._end, self.data),
+            ]
+
+    def is_crossing(self, other: CLASS_ITEM_TYPE) -> bool:
+        """Проверка того, что текущий период (self) пересекается с переданным периодом (other)"""
+        self._check_other(other)
+        return self._begin <= other._end and other._begin <= self._end
+
+    def crossing(self, other: CLASS_ITEM_TYPE) -> Optional[CLASS_ITEM_TYPE]:
+        """Получение пересечения текущего периода (self) с переданным периодом (other)"""
+        self._check_other(other)
+
+        if self._begin <= other._end and other._begin <= self._end:
+            return self._new(max(self._begin, other._begin), min(self._end, other._end), self.data)
+
+        return
+
+    def must_crossing(self, other: CLASS_ITEM_TYPE) -> CLASS_ITEM_TYPE:
+        """Получение пересечения текущего периода (self) с переданным периодом (other). Иначе ValueError"""
+        result = self.crossing(other)
+        if result is None:
+            raise ValueError
+
+        return result
@@ -12,7 +12,7 @@ setup(
     description='Python application that can operate with periods',
     long_description=codecs.open('README.md', encoding='utf8').read(),
     license='MIT license',
-    packages=find_packages(exclude=('tests', 'tests.*')),
+    packages=find_packages(exclude=('tests', 'tests.*', 'benchmarks', 'benchmarks.*')),
     include_package_data=True,
     classifiers=[
         'Development Status :: 1 - Beta',
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+import random
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+from periods.date.periods import DatePeriod
+
+BEGIN = datetime.date(2020, 1, 1)
+
+
+def random_period(rnd: random.Random, spread: int = 365, length: Union[int, Sequence[int]] = 30,
+                  data: Any = None, begin: datetime.date = BEGIN) -> DatePeriod:
+    """
+    Случайный период для сравнения результатов с полным перебором.
+
+    Начало периода выбирается из begin + [0, spread] дней, длина — из [0, length] дней,
+    либо одно из значений length, если передана последовательность длин.
+    """
+    start = begin + datetime.timedelta(days=rnd.randint(0, spread))
+    days = rnd.choice(length) if isinstance(length, Sequence) else rnd.randint(0, length)
+    return DatePeriod(start, start + datetime.timedelta(days=days), data=data)
+
+
+def random_periods(rnd: random.Random, count: int, spread: int = 365, length: Union[int, Sequence[int]] = 30,
+                   begin: datetime.date = BEGIN, data: Optional[Callable[[int], Any]] = None) -> List[DatePeriod]:
+    """
+    Список из count случайных периодов (см. random_period).
+
+    data — номер периода в списке, либо data(номер), если передана функция data.
+    """
+    return [random_period(rnd, spread, length, data=i if data is None else data(i), begin=begin)
+            for i in range(count)]
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import asyncio
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import unittest
+
+from periods.date.aio import async_circle_add, async_circle_crossing, async_circle_sub
+from periods.date.periods import DatePeriod
+from tests.helpers import random_periods
+
+
+class AsyncCircleTest(unittest.TestCase):
+    """
+    Тестирование асинхронных циклических операций
+
+    Результаты сравниваются с результатами синхронных методов DatePeriod.
+    """
+
+    def setUp(self) -> None:
+        self.loop = asyncio.new_event_loop()
+
+        rnd = random.Random(13)
+        self.period1 = random_periods(rnd, 300)
+        self.period2 = random_periods(rnd, 200)
+
+    def tearDown(self) -> None:
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    @staticmethod
+    def flat(periods):
+        return [(p.begin, p.end, p.data) for p in periods]
+
+    def check(self, func, method, **kwargs):
+        res = self.run_async(func(self.period1, self.period2, **kwargs))
+        self.assertListEqual(self.flat(res), self.flat(method(self.period1, self.period2)))
+
+    def test_cooperative(self):
+        for chunk_size in (1, 7, 1000):
+            self.check(async_circle_sub, DatePeriod.circle_sub, chunk_size=chunk_size)
+            self.check(async_circle_crossing, DatePeriod.circle_crossing, chunk_size=chunk_size)
+            self.check(async_circle_add, DatePeriod.circle_add, chunk_size=chunk_size)
+
+    def test_offload(self):
+        with ThreadPoolExecutor(1) as executor:
+            self.check(async_circle_sub, DatePeriod.circle_sub, offload_threshold=10, executor=executor)
+            self.check(async_circle_crossing, DatePeriod.circle_crossing, offload_threshold=10)
+            self.check(async_circle_add, DatePeriod.circle_add, offload_threshold=10, executor=executor)
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(1) as executor:
+            self.check(async_circle_sub, DatePeriod.circle_sub, offload_threshold=10, executor=executor)
+            self.check(async_circle_crossing, DatePeriod.circle_crossing, offload_threshold=10, executor=executor)
+
+    def test_empty(self):
+        self.assertIs(self.run_async(async_circle_sub(self.period1, [])), self.period1)
+        self.assertListEqual(self.run_async(async_circle_crossing([], self.period2)), [])
+        self.assertIs(self.run_async(async_circle_add(self.period1, [])), self.period1)
+
+        with self.assertRaises(ValueError):
+            self.run_async(async_circle_sub(self.period1, self.period2, chunk_size=0))
+
+    def test_yield(self):
+        """Пока выполняется операция, другие задачи цикла событий продолжают работать"""
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0)
+            before = len(ticks)
+            await async_circle_crossing(self.period1, self.period2, chunk_size=10, offload_threshold=None)
+            res = len(ticks) - before
+
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            return res
+
+        self.assertGreater(self.run_async(main()), 10)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+import random
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from periods.date.batch import batch_circle_add, batch_circle_crossing, batch_circle_sub
+from periods.date.periods import DatePeriod, FrozenDatePeriod
+from tests.helpers import random_periods
+
+
+def _bounds(periods):
+    return [(p.begin, p.end, p.data, p.protect_data) for p in periods]
+
+
+class BatchCircleTest(unittest.TestCase):
+    """Тестирование batch_circle_sub, batch_circle_crossing и batch_circle_add"""
+
+    def setUp(self) -> None:
+        rnd = random.Random(7)
+        self.tasks = {
+            'emp{}'.format(i): (random_periods(rnd, rnd.randrange(6), data='a{}'.format),
+                                random_periods(rnd, rnd.randrange(6), data='b{}'.format))
+            for i in range(40)
+        }
+
+    def check(self, batch, method, **kwargs):
+        res = batch(self.tasks, **kwargs)
+        self.assertEqual(list(res), list(self.tasks))
+        for key, (period1, period2) in self.tasks.items():
+            self.assertEqual(_bounds(res[key]), _bounds(method(period1, period2)))
+
+    def test_process_pool(self):
+        self.check(batch_circle_sub, DatePeriod.circle_sub, max_workers=2, chunk_size=7)
+        self.check(batch_circle_crossing, DatePeriod.circle_crossing, max_workers=2, chunk_size=7)
+        self.check(batch_circle_add, DatePeriod.circle_add, max_workers=2, chunk_size=7)
+
+    def test_serial(self):
+        self.check(batch_circle_sub, DatePeriod.circle_sub, max_workers=1)
+        self.check(batch_circle_crossing, DatePeriod.circle_crossing, chunk_size=100)
+
+        res = batch_circle_sub(self.tasks, max_workers=1)
+        key = next(iter(self.tasks))
+        self.assertEqual(res[key], DatePeriod.circle_sub(*self.tasks[key]))
+
+    def test_executor(self):
+        with ThreadPoolExecutor(2) as executor:
+            self.check(batch_circle_sub, DatePeriod.circle_sub, chunk_size=3, executor=executor)
+
+    def test_packing(self):
+        p1 = FrozenDatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 31), data={'id': 1},
+                              protect_data=True)
+        p2 = FrozenDatePeriod(datetime.date(2020, 1, 10), datetime.date(2020, 1, 20))
+        tasks = {1: ([p1, ], [p2, ]), 2: ([], [p2, ])}
+
+        res = batch_circle_sub(tasks, max_workers=2, chunk_size=1)
+        self.assertEqual(_bounds(res[1]), [
+            (datetime.date(2020, 1, 1), datetime.date(2020, 1, 9), {'id': 1}, False),
+            (datetime.date(2020, 1, 21), datetime.date(2020, 1, 31), {'id': 1}, False),
+        ])
+        self.assertIs(type(res[1][0]), type(DatePeriod.circle_sub([p1, ], [p2, ])[0]))
+        self.assertEqual(res[2], [])
+
+        res = batch_circle_add({1: ([p2, ], [p1, ])}, max_workers=2, chunk_size=1)
+        self.assertEqual(_bounds(res[1]), _bounds(DatePeriod.circle_add([p2, ], [p1, ])))
+
+    def test_mixed_classes(self):
+        periods = [
+            DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 31), data=1),
+            FrozenDatePeriod(datetime.date(2020, 2, 1), datetime.date(2020, 2, 29), data=2, protect_data=True),
+            DatePeriod(datetime.date(2020, 3, 1), datetime.date(2020, 3, 31), data=3),
+        ]
+        other = [FrozenDatePeriod(datetime.date(2020, 1, 10), datetime.date(2020, 3, 10))]
+        tasks = {1: (periods, other), 2: (other, periods)}
+
+        for batch, method in ((batch_circle_sub, DatePeriod.circle_sub),
+                              (batch_circle_crossing, DatePeriod.circle_crossing)):
+            res = batch(tasks, max_workers=2, chunk_size=1)
+            for key, (period1, period2) in tasks.items():
+                expected = method(period1, period2)
+                self.assertEqual(_bounds(res[key]), _bounds(expected))
+                self.assertListEqual([type(p) for p in res[key]], [type(p) for p in expected])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            batch_circle_sub(self.tasks, chunk_size=0)
+
+        with self.assertRaises(TypeError):
+            batch_circle_sub(self.tasks, chunk_size='10')
+
+        with ThreadPoolExecutor(1) as executor, self.assertRaises(TypeError):
+            batch_circle_sub({1: ([datetime.date(2020, 1, 1)], [])}, chunk_size=1, executor=executor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+import random
+
+import unittest
+
+from periods.date.buckets import BucketIndex
+from periods.date.periods import DatePeriod
+from tests.helpers import random_period, random_periods
+
+
+class BucketIndexTest(unittest.TestCase):
+    """
+    Тестирование BucketIndex
+
+    Результаты запросов сравниваются с полным перебором периодов.
+    """
+
+    def setUp(self) -> None:
+        self.begin = datetime.date(2020, 1, 1)
+        self.rnd = random.Random(7)
+        self.periods = random_periods(self.rnd, 300, length=80)
+
+    def day(self) -> datetime.date:
+        return self.begin + datetime.timedelta(days=self.rnd.randint(-10, 460))
+
+    @staticmethod
+    def expected(periods, day):
+        return sorted((x for x in periods if day in x), key=lambda x: (x.begin, x.end))
+
+    def check(self, index, periods):
+        self.assertEqual(len(index), len(periods))
+        self.assertListEqual([(x.begin, x.end) for x in index],
+                             sorted((x.begin, x.end) for x in periods))
+
+        days = [self.day() for _ in range(100)]
+        for day in days:
+            self.assertListEqual([id(x) for x in index.containing(day)],
+                                 [id(x) for x in self.expected(periods, day)])
+
+        self.assertListEqual([[id(x) for x in res] for res in index.lookup_many(days)],
+                             [[id(x) for x in self.expected(periods, day)] for day in days])
+
+    def test_bucket_size(self):
+        for bucket_size in ('month', 'year', 1, 7, 1000):
+            self.check(BucketIndex(self.periods, bucket_size=bucket_size), self.periods)
+
+        self.assertListEqual(BucketIndex().containing(self.begin), [])
+        self.assertListEqual(BucketIndex().lookup_many([self.begin, self.begin]), [[], []])
+
+    def test_add_remove(self):
+        index = BucketIndex(bucket_size=10)
+        periods = []
+
+        for _ in range(200):
+            p = random_period(self.rnd, length=80)
+            index.add(p)
+            periods.append(p)
+
+            if self.rnd.random() < 0.3:
+                p = self.rnd.choice(periods)
+                index.remove(p)
+                periods = [x for x in periods if x is not p]
+
+        self.check(index, periods)
+
+        p = periods[0]
+        index.remove(DatePeriod(p.begin, p.end))
+        self.assertEqual(len(index), len(periods) - 1)
+
+        index.discard(DatePeriod(datetime.date(1990, 1, 1), datetime.date(1990, 1, 1)))
+        with self.assertRaises(ValueError):
+            index.remove(DatePeriod(datetime.date(1990, 1, 1), datetime.date(1990, 1, 1)))
+
+    def test_datetime(self):
+        index = BucketIndex(self.periods)
+        day = datetime.datetime(2020, 3, 1, 15, 30)
+
+        with self.assertRaises(TypeError):
+            index.containing(day)
+
+        with self.assertRaises(TypeError):
+            index.lookup_many([day.date(), day])
+
+        res = index.lookup_many([day.date(), day.date()])
+        self.assertListEqual(res[0], res[1])
+        self.assertIsNot(res[0], res[1])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            BucketIndex(bucket_size=0)
+
+        with self.assertRaises(ValueError):
+            BucketIndex(bucket_size='week')
+
+        with self.assertRaises(TypeError):
+            BucketIndex([datetime.date(2020, 1, 1)])
+
+        with self.assertRaises(TypeError):
+            BucketIndex(self.periods).containing(self.periods[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+import random
+
+import unittest
+
+from periods.date.coverages import coverage
+from periods.date.periods import DatePeriod
+from tests.helpers import random_periods
+
+
+class CoverageTest(unittest.TestCase):
+    """
+    Тестирование coverage
+
+    window (DatePeriod):      |=================|            # 01.01.2020 - 10.01.2020
+    p1 (DatePeriod):     |=========|                         # 30.12.2019 - 03.01.2020
+    p2 (DatePeriod):            |======|                     # 02.01.2020 - 05.01.2020
+    p3 (DatePeriod):                       |======|          # 08.01.2020 - 12.01.2020
+    p4 (DatePeriod):                                 |===|   # 15.01.2020 - 20.01.2020
+
+    counts: [1, 2, 2, 1, 1, 0, 0, 1, 1, 1]
+    """
+
+    def setUp(self) -> None:
+        self.window = DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 10))
+        self.periods = [
+            DatePeriod(datetime.date(2019, 12, 30), datetime.date(2020, 1, 3)),
+            DatePeriod(datetime.date(2020, 1, 2), datetime.date(2020, 1, 5)),
+            DatePeriod(datetime.date(2020, 1, 8), datetime.date(2020, 1, 12)),
+            DatePeriod(datetime.date(2020, 1, 15), datetime.date(2020, 1, 20)),
+        ]
+
+    def test_counts(self):
+        res = coverage(self.periods, self.window)
+        self.assertListEqual(list(res.counts), [1, 2, 2, 1, 1, 0, 0, 1, 1, 1])
+        self.assertEqual(len(res), 10)
+        self.assertEqual(res[datetime.date(2020, 1, 2)], 2)
+        self.assertEqual(res[datetime.date(2020, 1, 6)], 0)
+
+        with self.assertRaises(KeyError):
+            res[datetime.date(2020, 1, 11)]
+
+        with self.assertRaises(TypeError):
+            res[datetime.datetime(2020, 1, 6, 12)]
+
+        with self.assertRaises(TypeError):
+            coverage([datetime.date(2020, 1, 1)], self.window)
+
+    def test_runs(self):
+        res = coverage(self.periods, self.window).runs()
+        self.assertListEqual([(p.begin.day, p.end.day, p.data) for p in res],
+                             [(1, 1, 1), (2, 3, 2), (4, 5, 1), (6, 7, 0), (8, 10, 1)])
+
+    def test_depth(self):
+        res = coverage(self.periods, self.window)
+        self.assertEqual(res.max_concurrency(), 2)
+
+        self.assertListEqual([(p.begin.day, p.end.day, p.data) for p in res.periods_at_depth(1)],
+                             [(1, 5, 2), (8, 10, 1)])
+        self.assertListEqual([(p.begin.day, p.end.day) for p in res.periods_at_depth(2)], [(2, 3)])
+        self.assertListEqual(res.periods_at_depth(3), [])
+
+        self.assertEqual(coverage([], self.window).max_concurrency(), 0)
+
+    def test_random(self):
+        rnd = random.Random(5)
+        periods = random_periods(rnd, 200, 60, 20, begin=datetime.date(2019, 12, 1))
+
+        res = coverage(periods, self.window)
+        for day in self.window:
+            self.assertEqual(res[day], sum(1 for p in periods if day in p))
+
+    def test_module(self):
+        import periods.date.coverages as module
+        import periods.date
+
+        self.assertIs(periods.date.coverage, coverage)
+        self.assertIs(module.coverage, coverage)
+        self.assertIsInstance(coverage([], self.window), module.Coverage)
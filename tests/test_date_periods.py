@@ -3,10 +3,14 @@ from __future__ import unicode_literals
 
 import copy
 import datetime
+import random
 
 import unittest
 
-from periods.date.periods import DatePeriod
+from periods.base import Period, Relation
+from periods.date.periods import DatePeriod, FrozenDatePeriod, InvalidRowsError, sort_periods, _iso_ordinal, \
+    _parse_iso_date
+from tests.helpers import random_periods
 
 
 class DatePeriodTest(unittest.TestCase):
@@ -952,6 +956,90 @@ class DatePeriodTest(unittest.TestCase):
             datetime.date(2020, 1, 3),
         ])
 
+    def test_days(self):
+        """Тестирование метода days"""
+        days = self.p22.days()
+        self.assertEqual(len(days), len(self.p22))
+        self.assertListEqual(list(days), list(self.p22))
+        self.assertListEqual(list(reversed(days)), list(self.p22)[::-1])
+        self.assertEqual(days[0], self.p22.begin)
+        self.assertEqual(days[-1], self.p22.end)
+        self.assertListEqual(list(days[2:5]), list(self.p22)[2:5])
+        self.assertListEqual(list(days[::-10]), list(self.p22)[::-10])
+        self.assertIn(datetime.date(2020, 2, 1), days)
+        self.assertNotIn(datetime.date(2020, 3, 1), days)
+        self.assertNotIn(self.p22, days)
+        self.assertEqual(days.index(datetime.date(2020, 1, 27)), 2)
+
+        with self.assertRaises(IndexError):
+            days[len(self.p22)]
+
+        with self.assertRaises(ValueError):
+            days.index(datetime.date(2020, 3, 1))
+
+        with self.assertRaises(TypeError):
+            datetime.datetime(2020, 2, 1, 12) in days
+
+        with self.assertRaises(ValueError):
+            self.p22.days(0)
+
+        days = self.p22.days(10)
+        self.assertListEqual(list(days), [
+            datetime.date(2020, 1, 25),
+            datetime.date(2020, 2, 4),
+            datetime.date(2020, 2, 14),
+            datetime.date(2020, 2, 24),
+        ])
+        self.assertNotIn(datetime.date(2020, 1, 26), days)
+
+        huge = DatePeriod(datetime.date(1, 1, 1), datetime.date(9999, 12, 31))
+        self.assertEqual(len(huge.days()), 3652059)
+        self.assertEqual(huge.days()[-1], datetime.date(9999, 12, 31))
+
+    def test_weeks(self):
+        """Тестирование метода weeks"""
+        self.assertListEqual(list(self.p11.weeks()), [
+            datetime.date(2020, 1, 1),
+            datetime.date(2020, 1, 8),
+            datetime.date(2020, 1, 15),
+            datetime.date(2020, 1, 22),
+        ])
+        self.assertListEqual(list(self.p11.weeks(2)), [
+            datetime.date(2020, 1, 1),
+            datetime.date(2020, 1, 15),
+        ])
+
+    def test_months(self):
+        """Тестирование метода months"""
+        months = DatePeriod(datetime.date(2020, 1, 31), datetime.date(2020, 6, 30)).months()
+        self.assertListEqual(list(months), [
+            datetime.date(2020, 1, 31),
+            datetime.date(2020, 2, 29),
+            datetime.date(2020, 3, 31),
+            datetime.date(2020, 4, 30),
+            datetime.date(2020, 5, 31),
+            datetime.date(2020, 6, 30),
+        ])
+        self.assertEqual(len(months), 6)
+        self.assertEqual(months[-2], datetime.date(2020, 5, 31))
+        self.assertIn(datetime.date(2020, 2, 29), months)
+        self.assertNotIn(datetime.date(2020, 2, 28), months)
+        self.assertNotIn(datetime.date(2019, 12, 31), months)
+
+        months = DatePeriod(datetime.date(2019, 11, 15), datetime.date(2021, 2, 14)).months(3)
+        self.assertListEqual(list(months), [
+            datetime.date(2019, 11, 15),
+            datetime.date(2020, 2, 15),
+            datetime.date(2020, 5, 15),
+            datetime.date(2020, 8, 15),
+            datetime.date(2020, 11, 15),
+        ])
+        self.assertListEqual(list(reversed(months[1:3])), [
+            datetime.date(2020, 5, 15),
+            datetime.date(2020, 2, 15),
+        ])
+        self.assertNotIn(datetime.date(2019, 12, 15), months)
+
     # ---------------------------------------------Методы------------------------------------
 
     def test_split(self):
@@ -1190,6 +1278,62 @@ class DatePeriodTest(unittest.TestCase):
         # Однодневные периоды равны, len(pC1) = 1
         self.assertTrue(self.pC1.is_crossing(self.pC1))
 
+    def test_relation(self):
+        """Тестирование метода relation"""
+        self.assertIs(self.p11.relation(self.p12), Relation.BEFORE)
+        self.assertIs(self.p12.relation(self.p11), Relation.AFTER)
+        self.assertIs(self.p21.relation(self.p22), Relation.OVERLAPS)
+        self.assertIs(self.p22.relation(self.p21), Relation.OVERLAPPED_BY)
+        self.assertIs(self.p31.relation(self.p32), Relation.OVERLAPS)
+        self.assertIs(self.p41.relation(self.p42), Relation.CONTAINS)
+        self.assertIs(self.p42.relation(self.p41), Relation.DURING)
+        self.assertIs(self.p51.relation(self.p52), Relation.STARTED_BY)
+        self.assertIs(self.p52.relation(self.p51), Relation.STARTS)
+        self.assertIs(self.p61.relation(self.p62), Relation.FINISHED_BY)
+        self.assertIs(self.p62.relation(self.p61), Relation.FINISHES)
+        self.assertIs(self.p11.relation(copy.copy(self.p11)), Relation.EQUALS)
+        self.assertIs(self.pA1.relation(self.p31), Relation.MET_BY)
+        self.assertIs(self.p31.relation(self.pA1), Relation.MEETS)
+
+        with self.assertRaises(TypeError):
+            self.p11.relation(datetime.date(2020, 1, 1))
+
+    def test_begin_end(self):
+        """Тестирование атрибутов begin и end"""
+        p = DatePeriod(datetime.datetime(2020, 1, 1, 12), datetime.datetime(2020, 1, 31, 23, 59))
+        self.assertEqual(type(p.begin), datetime.date)
+        self.assertEqual(p.begin, datetime.date(2020, 1, 1))
+        self.assertEqual(p.end, datetime.date(2020, 1, 31))
+
+        p.begin = datetime.date(2020, 1, 10)
+        p.end = datetime.datetime(2020, 2, 10, 8)
+        self.assertEqual(p.begin, datetime.date(2020, 1, 10))
+        self.assertEqual(p.end, datetime.date(2020, 2, 10))
+        self.assertEqual(len(p), 32)
+        self.assertIn(datetime.date(2020, 2, 10), p)
+        self.assertEqual(hash(p), hash(DatePeriod(datetime.date(2020, 1, 10), datetime.date(2020, 2, 10))))
+
+        with self.assertRaises(TypeError):
+            datetime.datetime(2020, 1, 15) in p
+
+    def test_sort_key(self):
+        """Тестирование sort_key и sort_periods"""
+        periods = random_periods(random.Random(7), 200, 50, 10)
+        periods.append(DatePeriod(datetime.date.min, datetime.date.max))
+        periods.append(DatePeriod(datetime.date.max, datetime.date.max))
+
+        expected = sorted(periods, key=lambda x: (x.begin, x.end))
+        self.assertListEqual([x.data for x in sort_periods(periods)], [x.data for x in expected])
+        self.assertListEqual([x.data for x in sorted(periods, key=DatePeriod.sort_key)], [x.data for x in expected])
+        self.assertListEqual([x.data for x in sort_periods(periods, reverse=True)],
+                             [x.data for x in sorted(periods, key=lambda x: (x.begin, x.end), reverse=True)])
+
+        self.assertLess(self.p11.sort_key(), self.p12.sort_key())
+        self.assertEqual(self.p11.sort_key(), copy.copy(self.p11).sort_key())
+
+        with self.assertRaises(TypeError):
+            sort_periods([self.p11, datetime.date(2020, 1, 1)])
+
     def test_crossing(self):
         """Тестирование метода crossing"""
 
@@ -1433,6 +1577,35 @@ class CircleSubTest(unittest.TestCase):
         deb.sort(key=lambda x: x.begin)
         self.assertListEqual(deb, [self.p13, self.p11, self.p12, self.p15, self.p14, self.p16])
 
+    def test_data(self):
+        """Атрибут data берется из уменьшаемого периода"""
+        res = DatePeriod.circle_sub([self.p11, self.p16], [self.p12, self.p14])
+        self.assertListEqual([x.data for x in res], ['p11', 'p11', 'p11', 'p16'])
+        self.assertIs(res[-1], self.p16)
+
+    def test_many_periods(self):
+        """Большое количество вычитаемых периодов не приводит к переполнению стека"""
+        begin = datetime.date(2000, 1, 1)
+        whole = DatePeriod(begin, begin + datetime.timedelta(days=20000))
+        holes = [DatePeriod(begin + datetime.timedelta(days=d), begin + datetime.timedelta(days=d))
+                 for d in range(1, 20000, 2)]
+
+        res = DatePeriod.circle_sub([whole], holes)
+        self.assertEqual(len(res), 10001)
+        self.assertTrue(all(len(x) == 1 for x in res))
+
+    def test_days(self):
+        """Сравнение результата с поэлементным вычитанием дней"""
+        rnd = random.Random(1)
+
+        for _ in range(50):
+            period1, period2 = random_periods(rnd, 5, 200), random_periods(rnd, 5, 200)
+            excluded = {d for p in period2 for d in p}
+
+            res = DatePeriod.circle_sub(period1, period2)
+            self.assertListEqual([d for p in res for d in p],
+                                 [d for p in period1 for d in p if d not in excluded])
+
 
 class CircleCrossingTest(unittest.TestCase):
     """
@@ -1474,6 +1647,41 @@ class CircleCrossingTest(unittest.TestCase):
             DatePeriod(datetime.date(2020, 4, 1), datetime.date(2020, 4, 20)),
                              ])
 
+    @staticmethod
+    def brute_force(period1, period2):
+        return [p1.crossing(p2) for p1 in period1 for p2 in period2 if p1.is_crossing(p2)]
+
+    def test_order(self):
+        period1 = [self.p11, self.p15]
+        period2 = [self.p16, self.p14, self.p12, self.p13, self.p15]
+
+        res = DatePeriod.circle_crossing(period1, period2)
+        self.assertListEqual([(p.begin, p.end, p.data) for p in res],
+                             [(p.begin, p.end, p.data) for p in self.brute_force(period1, period2)])
+        self.assertListEqual(DatePeriod.crossing_pairs(period1, period2),
+                             [(0, 1), (0, 2), (0, 3), (0, 4), (1, 1), (1, 4)])
+
+        self.assertIs(DatePeriod.circle_crossing(period1, []), period1)
+        self.assertListEqual(DatePeriod.crossing_pairs(period1, []), [])
+
+        with self.assertRaises(TypeError):
+            DatePeriod.circle_crossing(period1, [datetime.date(2020, 1, 1)])
+
+    def test_random(self):
+        rnd = random.Random(3)
+
+        def make(count):
+            return random_periods(rnd, count, 60, (0, 1, 3, 30), data=lambda i: rnd.random())
+
+        for _ in range(100):
+            period1, period2 = make(rnd.randint(1, 20)), make(rnd.randint(1, 20))
+            res = DatePeriod.circle_crossing(period1, period2)
+            self.assertListEqual([(p.begin, p.end, p.data) for p in res],
+                                 [(p.begin, p.end, p.data) for p in self.brute_force(period1, period2)])
+            self.assertListEqual(DatePeriod.crossing_pairs(period1, period2),
+                                 [(i, j) for i, p1 in enumerate(period1) for j, p2 in enumerate(period2)
+                                  if p1.is_crossing(p2)])
+
 
 class CircleAddTest(unittest.TestCase):
     """
@@ -1518,3 +1726,258 @@ class CircleAddTest(unittest.TestCase):
             DatePeriod(datetime.date(2020, 2, 1), datetime.date(2020, 3, 31)),
             DatePeriod(datetime.date(2020, 7, 25), datetime.date(2020, 8, 20)),
         ])
+
+
+class FrozenDatePeriodTest(unittest.TestCase):
+    """
+    Тестирование FrozenDatePeriod и __slots__ у DatePeriod
+    """
+
+    def setUp(self) -> None:
+        self.p1 = FrozenDatePeriod(datetime.datetime(2020, 1, 1, 10), datetime.datetime(2020, 1, 31), data='p1')
+        self.p2 = FrozenDatePeriod(datetime.date(2020, 1, 10), datetime.date(2020, 1, 20), data='p2')
+
+    def test_slots(self):
+        p = DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 31))
+        self.assertFalse(hasattr(p, '__dict__'))
+        self.assertFalse(p.protect_data)
+
+        with self.assertRaises(AttributeError):
+            p.other = 1
+
+    def test_frozen(self):
+        self.assertEqual(self.p1.begin, datetime.date(2020, 1, 1))
+
+        with self.assertRaises(AttributeError):
+            self.p1.begin = datetime.date(2020, 1, 2)
+
+        with self.assertRaises(AttributeError):
+            self.p1.data = 'p'
+
+        with self.assertRaises(AttributeError):
+            del self.p1.data
+
+        self.assertIs(copy.copy(self.p1), self.p1)
+        self.assertEqual(copy.deepcopy(self.p1), self.p1)
+        self.assertEqual(copy.deepcopy(self.p1).data, 'p1')
+
+        with self.assertRaises(ValueError):
+            FrozenDatePeriod(datetime.date(2020, 1, 2), datetime.date(2020, 1, 1))
+
+    def test_operations(self):
+        res = self.p1 - self.p2
+        self.assertListEqual(res, [
+            DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 9)),
+            DatePeriod(datetime.date(2020, 1, 21), datetime.date(2020, 1, 31)),
+        ])
+        self.assertTrue(all(isinstance(x, FrozenDatePeriod) for x in res))
+        self.assertTrue(all(x.data == 'p1' for x in res))
+
+        self.assertIsInstance(self.p1.crossing(self.p2), FrozenDatePeriod)
+        self.assertEqual(len({self.p1, self.p2, FrozenDatePeriod(self.p2.begin, self.p2.end)}), 2)
+
+        protected = FrozenDatePeriod(self.p2.begin, self.p2.end, data='protected', protect_data=True)
+        self.assertEqual((protected + self.p1)[0].data, 'protected')
+        self.assertEqual(self.p1.data, 'p1')
+
+
+class MergeTest(unittest.TestCase):
+    """
+    Тестирование склеивания периодов
+
+    p1 (DatePeriod):        |=======|                   # 01.01.2020 - 10.01.2020
+    p2 (DatePeriod):            |=======|               # 05.01.2020 - 15.01.2020
+    p3 (DatePeriod):                     |====|         # 16.01.2020 - 20.01.2020
+    p4 (DatePeriod):                              |==|  # 01.02.2020 - 05.02.2020
+    """
+
+    def setUp(self):
+        self.p1 = DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 10), data='p1')
+        self.p2 = DatePeriod(datetime.date(2020, 1, 5), datetime.date(2020, 1, 15), data='p2')
+        self.p3 = DatePeriod(datetime.date(2020, 1, 16), datetime.date(2020, 1, 20), data='p3')
+        self.p4 = DatePeriod(datetime.date(2020, 2, 1), datetime.date(2020, 2, 5), data='p4')
+        self.periods = [self.p4, self.p3, self.p2, self.p1]
+
+    def test_main(self):
+        res = DatePeriod.merge(self.periods)
+        self.assertNotIsInstance(res, list)
+        res = list(res)
+        self.assertListEqual(res, [
+            DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 20)),
+            DatePeriod(datetime.date(2020, 2, 1), datetime.date(2020, 2, 5)),
+        ])
+        self.assertListEqual([x.data for x in res], ['p1', 'p4'])
+
+        self.assertListEqual(list(DatePeriod.merge(self.periods, adjacent=False)), [
+            DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 15)),
+            DatePeriod(datetime.date(2020, 1, 16), datetime.date(2020, 1, 20)),
+            DatePeriod(datetime.date(2020, 2, 1), datetime.date(2020, 2, 5)),
+        ])
+
+        self.assertListEqual(list(DatePeriod.merge([])), [])
+
+    def test_data_policy(self):
+        self.assertListEqual([x.data for x in DatePeriod.merge(self.periods, data_policy='last')], ['p3', 'p4'])
+        self.assertListEqual([x.data for x in DatePeriod.merge(self.periods, data_policy='list')],
+                             [['p1', 'p2', 'p3'], ['p4']])
+        self.assertListEqual([x.data for x in DatePeriod.merge(self.periods, data_policy=lambda a, b: a + b)],
+                             ['p1p2p3', 'p4'])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            DatePeriod.merge(self.periods, data_policy='unknown')
+
+        with self.assertRaises(TypeError):
+            DatePeriod.merge([self.p1, datetime.date(2020, 1, 1)])
+
+
+class IterCircleTest(unittest.TestCase):
+    """
+    Тестирование потоковых циклических операций
+
+    Результаты сравниваются с circle_sub / circle_crossing на отсортированных периодах.
+    """
+
+    def setUp(self):
+        rnd = random.Random(5)
+
+        def make(count):
+            return sorted(random_periods(rnd, count, 300, 40), key=lambda x: x.begin)
+
+        self.samples = [(make(rnd.randint(0, 15)), make(rnd.randint(0, 15))) for _ in range(50)]
+
+    @staticmethod
+    def flat(periods):
+        return [(p.begin, p.end, p.data) for p in periods]
+
+    def test_sub(self):
+        for period1, period2 in self.samples:
+            self.assertListEqual(self.flat(DatePeriod.iter_circle_sub(iter(period1), iter(period2))),
+                                 self.flat(DatePeriod.circle_sub(period1, period2)))
+
+    def test_crossing(self):
+        for period1, period2 in self.samples:
+            self.assertListEqual(self.flat(DatePeriod.iter_circle_crossing(iter(period1), iter(period2))),
+                                 self.flat(DatePeriod.circle_crossing(period1, period2)))
+
+    def test_add(self):
+        for period1, period2 in self.samples:
+            res = list(DatePeriod.iter_circle_add(iter(period1), iter(period2)))
+            self.assertListEqual(sorted(d for p in res for d in p),
+                                 sorted({d for p in period1 + period2 for d in p}))
+            for prev, cur in zip(res, res[1:]):
+                self.assertLess(prev.end, cur.begin)
+
+    def test_not_sorted(self):
+        p1 = DatePeriod(datetime.date(2020, 1, 10), datetime.date(2020, 1, 20))
+        p2 = DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 5))
+
+        res = DatePeriod.iter_circle_sub([p1, p2], [])
+        self.assertIs(next(res), p1)
+        with self.assertRaises(ValueError):
+            next(res)
+
+        with self.assertRaises(ValueError):
+            list(DatePeriod.iter_circle_crossing([p1], [p1, p2]))
+
+        with self.assertRaises(TypeError):
+            list(DatePeriod.iter_circle_add([p1], [datetime.date(2020, 1, 1)]))
+
+
+class BulkConstructorsTest(unittest.TestCase):
+    """Тестирование массового создания периодов"""
+
+    def setUp(self):
+        self.rnd = random.Random(0)
+        self.expected = random_periods(self.rnd, 200, 10000, 100, begin=datetime.date(2000, 1, 1),
+                                       data=lambda i: self.rnd.random())
+        self.rows = [(p.begin, p.end, p.data) for p in self.expected]
+
+    def assertPeriodsEqual(self, res, expected):
+        self.assertListEqual([(p.begin, p.end, p.data) for p in res], [(p.begin, p.end, p.data) for p in expected])
+
+    def test_from_records(self):
+        res = DatePeriod.from_records(self.rows)
+        self.assertPeriodsEqual(res, self.expected)
+
+        res = DatePeriod.from_records([(datetime.datetime(2020, 1, 1, 12), datetime.date(2020, 1, 2))])
+        self.assertEqual(res[0].begin, datetime.date(2020, 1, 1))
+        self.assertIsNone(res[0].data)
+
+        res = FrozenDatePeriod.from_records(self.rows[:3], protect_data=True)
+        self.assertIsInstance(res[0], FrozenDatePeriod)
+        self.assertTrue(res[0].protect_data)
+
+    def test_from_iso_strings(self):
+        rows = [(b.isoformat(), e.isoformat(), d) for b, e, d in self.rows]
+        self.assertPeriodsEqual(DatePeriod.from_iso_strings(rows), self.expected)
+
+        res = DatePeriod.from_iso_strings([('2020-01-01T10:00:00', '2020-01-02 23:59'),
+                                           ('2020-01-01T10', '2020-01-02T23:59:59.123456')])
+        self.assertListEqual([(p.begin, p.end) for p in res],
+                             [(datetime.date(2020, 1, 1), datetime.date(2020, 1, 2))] * 2)
+
+    def test_iso_strict_format(self):
+        """Принимается только 'YYYY-MM-DD' с необязательным проверяемым временем, независимо от версии python"""
+        for value in ('2020-W01-1', '20200101', '2020-001', '+020-01-01', '2_20-01-01', '2020-01-0١',
+                      '2020-01-01Tjunk', '2020-01-01T', '2020-01-01T24:00', '2020-01-01T10:60',
+                      '2020-01-01T10:00:00+03:00', '2020-01-01x10:00'):
+            with self.assertRaises(InvalidRowsError, msg=value):
+                DatePeriod.from_iso_strings([(value, '2020-02-01')])
+
+            for parse in (_iso_ordinal, _parse_iso_date):
+                with self.assertRaises(ValueError, msg=value):
+                    parse(value)
+
+    def test_from_ordinals(self):
+        begins = [b.toordinal() for b, _, _ in self.rows]
+        ends = [e.toordinal() for _, e, _ in self.rows]
+        data = [d for _, _, d in self.rows]
+        self.assertPeriodsEqual(DatePeriod.from_ordinals(begins, ends, data), self.expected)
+        self.assertTrue(all(p.data is None for p in DatePeriod.from_ordinals(begins, ends)))
+
+        with self.assertRaises(ValueError):
+            DatePeriod.from_ordinals([1, 2], [3])
+
+        with self.assertRaises(InvalidRowsError) as e:
+            DatePeriod.from_ordinals([1, 5, 0, True], [2, 4, 1, 3])
+        self.assertListEqual(e.exception.errors, [(1, 'Wrong dates'), (2, 'Wrong format'), (3, 'Wrong format')])
+
+    def test_invalid_rows(self):
+        rows = [('2020-01-01', '2020-01-31'), ('2020-13-01', '2020-01-31'), ('2020-02-01', '2020-01-01'),
+                (None, '2020-01-01'), ('2020-01-01',), ('2020-02-30', '2020-03-01')]
+
+        with self.assertRaises(InvalidRowsError) as e:
+            DatePeriod.from_iso_strings(rows)
+        self.assertIsInstance(e.exception, ValueError)
+        self.assertListEqual(e.exception.errors, [(1, 'Wrong format'), (2, 'Wrong dates'), (3, 'Wrong format'),
+                                                  (4, 'Wrong format'), (5, 'Wrong format')])
+
+        with self.assertRaises(InvalidRowsError) as e:
+            DatePeriod.from_records([(datetime.date(2020, 1, 2), datetime.date(2020, 1, 1)), ('2020-01-01', None)])
+        self.assertListEqual(e.exception.errors, [(0, 'Wrong dates'), (1, 'Wrong format')])
+
+    def test_parse_iso_date(self):
+        for _ in range(1000):
+            value = datetime.date.fromordinal(self.rnd.randint(1, datetime.date.max.toordinal()))
+            self.assertEqual(_parse_iso_date(value.isoformat()), value.toordinal())
+
+        for value in ('2020-1-01', '2020/01/01', '2019-02-29', '2020-00-10', '0000-01-01', '2020-04-31'):
+            with self.assertRaises(ValueError):
+                _parse_iso_date(value)
+
+        self.assertEqual(_parse_iso_date('2020-02-29'), datetime.date(2020, 2, 29).toordinal())
+
+
+class PeriodBaseTest(unittest.TestCase):
+    """Тестирование базового класса Period"""
+
+    def test_relation_not_abstract(self):
+        names = ('__str__', '__iter__', '__contains__', '__lt__', '__le__', '__eq__', '__ne__', '__gt__', '__ge__',
+                 '__len__', '__add__', '__sub__', '__hash__')
+        # Подкласс, реализующий только прежний набор абстрактных методов
+        LegacyPeriod = type('LegacyPeriod', (Period, ), {name: lambda self, *args: None for name in names})
+
+        period = LegacyPeriod()
+        with self.assertRaises(NotImplementedError):
+            period.relation(period)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+import itertools
+
+import unittest
+
+from periods.base import Relation
+from periods.date.periods import DatePeriod
+from periods.datetime.periods import DateTimePeriod
+
+DAY = datetime.timedelta(days=1)
+HOUR = datetime.timedelta(hours=1)
+
+
+class DateTimePeriodTest(unittest.TestCase):
+    """
+    Тестирование DateTimePeriod
+
+    При дискретности в один день результаты операций должны совпадать с DatePeriod.
+    """
+
+    def setUp(self) -> None:
+        self.begin = datetime.date(2020, 1, 1)
+
+    def date(self, days: int) -> datetime.date:
+        return self.begin + datetime.timedelta(days=days)
+
+    @staticmethod
+    def bounds(res):
+        if isinstance(res, list):
+            return [(x.begin.date(), x.end.date(), x.data) if isinstance(x.begin, datetime.datetime)
+                    else (x.begin, x.end, x.data) for x in res]
+        if isinstance(res, (DatePeriod, DateTimePeriod)):
+            return DateTimePeriodTest.bounds([res])
+        return res
+
+    def test_same_as_date_period(self):
+        intervals = [(a, b) for a in range(6) for b in range(a, 6)]
+
+        for (a, b), (c, d) in itertools.product(intervals, intervals):
+            for protect_data in (False, True):
+                dp1 = DatePeriod(self.date(a), self.date(b), 'x', protect_data)
+                dp2 = DatePeriod(self.date(c), self.date(d), 'y')
+                tp1 = DateTimePeriod(self.date(a), self.date(b), 'x', protect_data, granularity=DAY)
+                tp2 = DateTimePeriod(self.date(c), self.date(d), 'y', granularity=DAY)
+
+                for op in ('__contains__', '__lt__', '__le__', '__eq__', '__ne__', '__gt__', '__ge__',
+                           '__add__', '__sub__', 'split', 'is_crossing', 'crossing', 'relation'):
+                    self.assertEqual(self.bounds(getattr(tp1, op)(tp2)), self.bounds(getattr(dp1, op)(dp2)),
+                                     msg='{} {} {}'.format(op, (a, b), (c, d)))
+
+                self.assertEqual(len(tp1), len(dp1))
+
+    def test_granularity(self):
+        p1 = DateTimePeriod(datetime.datetime(2020, 1, 1, 9, 30), datetime.datetime(2020, 1, 1, 11), granularity=HOUR)
+        p2 = DateTimePeriod(datetime.datetime(2020, 1, 1, 10), datetime.datetime(2020, 1, 1, 10, 59),
+                            data='p2', granularity=HOUR)
+
+        self.assertEqual(p1.begin, datetime.datetime(2020, 1, 1, 9))
+        self.assertEqual(p1.granularity, HOUR)
+        self.assertEqual(len(p1), 3)
+        self.assertListEqual(list(p1), [
+            datetime.datetime(2020, 1, 1, 9),
+            datetime.datetime(2020, 1, 1, 10),
+            datetime.datetime(2020, 1, 1, 11),
+        ])
+        self.assertEqual(str(p2), '01.01.2020 10:00:00 - 01.01.2020 10:00:00')
+
+        self.assertIs(p1.relation(p2), Relation.CONTAINS)
+        self.assertIn(p2, p1)
+        self.assertIn(datetime.datetime(2020, 1, 1, 11, 59), p1)
+        self.assertNotIn(datetime.datetime(2020, 1, 1, 12), p1)
+        self.assertListEqual([(x.begin, x.end) for x in p1 - p2], [
+            (datetime.datetime(2020, 1, 1, 9), datetime.datetime(2020, 1, 1, 9)),
+            (datetime.datetime(2020, 1, 1, 11), datetime.datetime(2020, 1, 1, 11)),
+        ])
+        self.assertEqual(p2.crossing(p1).data, 'p2')
+        self.assertEqual(p2.crossing(p1).granularity, HOUR)
+
+        minutes = DateTimePeriod(datetime.datetime(2020, 1, 1, 9, 30), datetime.datetime(2020, 1, 1, 11))
+        self.assertEqual(len(minutes), 91)
+
+        with self.assertRaises(ValueError):
+            minutes.is_crossing(p1)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            DateTimePeriod(datetime.datetime(2020, 1, 2), datetime.datetime(2020, 1, 1))
+
+        with self.assertRaises(ValueError):
+            DateTimePeriod(datetime.datetime(2020, 1, 1), datetime.datetime(2020, 1, 2),
+                           granularity=datetime.timedelta(0))
+
+        with self.assertRaises(TypeError):
+            DateTimePeriod('2020-01-01', datetime.datetime(2020, 1, 2))
+
+        with self.assertRaises(TypeError):
+            DateTimePeriod(datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+                           datetime.datetime(2020, 1, 2, tzinfo=datetime.timezone.utc))
+
+        p = DateTimePeriod(datetime.datetime(2020, 1, 1), datetime.datetime(2020, 1, 2))
+        with self.assertRaises(TypeError):
+            p.is_crossing(DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 2)))
+
+        with self.assertRaises(ValueError):
+            p.must_crossing(DateTimePeriod(datetime.datetime(2020, 2, 1), datetime.datetime(2020, 2, 2)))
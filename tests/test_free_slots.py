@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+import random
+
+import unittest
+
+from periods.date.periods import DatePeriod
+from periods.date.slots import free_slots
+from tests.helpers import random_periods
+
+
+class FreeSlotsTest(unittest.TestCase):
+    """
+    Тестирование free_slots
+
+    within (DatePeriod):  |==================================|   # 01.01.2020 - 31.01.2020
+    c1 (calendar):      |=====|         |====|                  # 30.12.2019 - 05.01.2020, 15.01.2020 - 20.01.2020
+    c2 (calendar):               |==|                  |===|    # 08.01.2020 - 09.01.2020, 28.01.2020 - 05.02.2020
+
+    res: 06.01.2020 - 07.01.2020, 10.01.2020 - 14.01.2020, 21.01.2020 - 27.01.2020
+    """
+
+    def setUp(self) -> None:
+        self.within = DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 31))
+        self.c1 = [DatePeriod(datetime.date(2019, 12, 30), datetime.date(2020, 1, 5)),
+                   DatePeriod(datetime.date(2020, 1, 15), datetime.date(2020, 1, 20))]
+        self.c2 = [DatePeriod(datetime.date(2020, 1, 8), datetime.date(2020, 1, 9)),
+                   DatePeriod(datetime.date(2020, 1, 28), datetime.date(2020, 2, 5))]
+
+    @staticmethod
+    def days(periods):
+        return [(p.begin.day, p.end.day) for p in periods]
+
+    def test_main(self):
+        self.assertListEqual(self.days(free_slots([self.c1, self.c2], self.within)),
+                             [(6, 7), (10, 14), (21, 27)])
+        self.assertListEqual(self.days(free_slots([self.c1, self.c2], self.within, min_length=5)),
+                             [(10, 14), (21, 27)])
+        self.assertListEqual(self.days(free_slots([self.c1, self.c2], self.within, min_length=6)), [(21, 27)])
+        self.assertListEqual(self.days(free_slots([], self.within)), [(1, 31)])
+        self.assertListEqual(self.days(free_slots([self.c1], self.within)), [(6, 14), (21, 31)])
+
+    def test_limit(self):
+        def calendar():
+            yield self.c1[0]
+            yield self.c1[1]
+            raise AssertionError('Calendar must not be read after the limit')
+
+        self.assertListEqual(self.days(free_slots([calendar(), self.c2], self.within, limit=1)), [(6, 7)])
+        self.assertListEqual(list(free_slots([self.c1], self.within, limit=0)), [])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            list(free_slots([self.c1[::-1]], self.within))
+
+        with self.assertRaises(TypeError):
+            list(free_slots([[datetime.date(2020, 1, 1)]], self.within))
+
+        # Неверные аргументы приводят к ошибке сразу при вызове, а не при чтении результата
+        with self.assertRaises(ValueError):
+            free_slots([self.c1], self.within, min_length=0)
+
+        with self.assertRaises(TypeError):
+            free_slots([self.c1], datetime.date(2020, 1, 1))
+
+        with self.assertRaises(TypeError):
+            free_slots([self.c1], self.within, limit='1')
+
+    def test_random(self):
+        rnd = random.Random(11)
+        for _ in range(50):
+            calendars = [sorted(random_periods(rnd, rnd.randint(0, 8), 50, 5, begin=datetime.date(2019, 12, 20)),
+                                key=DatePeriod.sort_key)
+                         for _ in range(rnd.randint(1, 6))]
+
+            min_length = rnd.randint(1, 4)
+            expected = [p for p in DatePeriod.circle_sub([self.within], [p for c in calendars for p in c])
+                        if len(p) >= min_length]
+            res = list(free_slots(calendars, self.within, min_length=min_length))
+            self.assertListEqual([(p.begin, p.end) for p in res], [(p.begin, p.end) for p in expected])
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+import random
+
+import unittest
+
+from periods.date.index import IntervalIndex
+from periods.date.periods import DatePeriod
+from tests.helpers import random_period, random_periods
+
+
+class IntervalIndexTest(unittest.TestCase):
+    """
+    Тестирование IntervalIndex
+
+    Результаты запросов сравниваются с полным перебором периодов.
+    """
+
+    def setUp(self) -> None:
+        self.rnd = random.Random(7)
+        self.periods = random_periods(self.rnd, 300, length=40)
+        self.index = IntervalIndex(self.periods, seed=1)
+
+    @staticmethod
+    def ids(periods):
+        return sorted(id(x) for x in periods)
+
+    def check(self, periods):
+        self.assertEqual(len(self.index), len(periods))
+        self.assertListEqual([(x.begin, x.end) for x in self.index],
+                             sorted((x.begin, x.end) for x in periods))
+
+        for _ in range(50):
+            query = random_period(self.rnd, length=40)
+            self.assertListEqual(self.ids(self.index.overlapping(query)),
+                                 self.ids(x for x in periods if x.is_crossing(query)))
+            self.assertListEqual(self.ids(self.index.contained_in(query)),
+                                 self.ids(x for x in periods if x in query))
+
+            day = query.begin
+            self.assertListEqual(self.ids(self.index.containing(day)),
+                                 self.ids(x for x in periods if day in x))
+
+    def test_build(self):
+        self.check(self.periods)
+        self.assertListEqual(IntervalIndex().overlapping(self.periods[0]), [])
+
+    def test_add_remove(self):
+        periods = list(self.periods)
+
+        for _ in range(100):
+            p = random_period(self.rnd, length=40)
+            self.index.add(p)
+            periods.append(p)
+
+        for p in self.rnd.sample(periods, 150):
+            self.index.remove(p)
+            periods = [x for x in periods if x is not p]
+
+        self.check(periods)
+
+    def test_remove_same_bounds(self):
+        p1 = DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 5), data=1)
+        p2 = DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 5), data=2)
+        index = IntervalIndex([p1, p2])
+
+        index.remove(p2)
+        self.assertListEqual([x.data for x in index], [1])
+
+        index.remove(DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 5)))
+        self.assertEqual(len(index), 0)
+
+        with self.assertRaises(ValueError):
+            index.remove(p1)
+
+        index.discard(p1)
+
+    def test_types(self):
+        with self.assertRaises(TypeError):
+            self.index.add(datetime.date(2020, 1, 1))
+
+        with self.assertRaises(TypeError):
+            self.index.overlapping(datetime.date(2020, 1, 1))
+
+        with self.assertRaises(TypeError):
+            self.index.containing(self.periods[0])
+
+        with self.assertRaises(TypeError):
+            self.index.containing(datetime.datetime(2020, 3, 1, 12))
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+
+import unittest
+
+from periods.date import arrays
+from periods.date.arrays import PeriodArray
+from periods.date.periods import DatePeriod, sort_periods
+
+
+class PeriodArrayTest(unittest.TestCase):
+    """
+    Тестирование PeriodArray
+
+    Результаты сравниваются с одноименными операциями DatePeriod.
+    """
+
+    use_numpy = False
+
+    def setUp(self) -> None:
+        self.periods = [
+            DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 25), data='p1'),
+            DatePeriod(datetime.date(2020, 2, 5), datetime.date(2020, 2, 29), data='p2'),
+            DatePeriod(datetime.date(2020, 1, 20), datetime.date(2020, 3, 10), data='p3'),
+            DatePeriod(datetime.date(2020, 3, 10), datetime.date(2020, 3, 10), data='p4'),
+        ]
+        self.query = DatePeriod(datetime.date(2020, 1, 25), datetime.date(2020, 2, 10))
+        self.array = PeriodArray.from_periods(self.periods, use_numpy=self.use_numpy)
+
+    def test_convert(self):
+        self.assertEqual(len(self.array), 4)
+        self.assertListEqual(self.array.to_periods(), self.periods)
+        self.assertListEqual([x.data for x in self.array], [x.data for x in self.periods])
+        self.assertEqual(self.array[2], self.periods[2])
+        self.assertEqual(self.array[2].data, 'p3')
+        self.assertListEqual(list(self.array[1:3]), self.periods[1:3])
+
+    def test_is_crossing(self):
+        self.assertListEqual([bool(x) for x in self.array.is_crossing(self.query)],
+                             [x.is_crossing(self.query) for x in self.periods])
+
+    def test_crossing(self):
+        res = self.array.crossing(self.query)
+        expected = [x.crossing(self.query) for x in self.periods if x.is_crossing(self.query)]
+
+        self.assertListEqual(res.to_periods(), expected)
+        self.assertListEqual([x.data for x in res], [x.data for x in expected])
+
+    def test_contains(self):
+        day = datetime.date(2020, 3, 10)
+        self.assertListEqual([bool(x) for x in self.array.contains(day)], [day in x for x in self.periods])
+        self.assertListEqual([bool(x) for x in self.array.contains(self.query)],
+                             [self.query in x for x in self.periods])
+
+        self.assertIn(day, self.array)
+        self.assertNotIn(datetime.date(2020, 3, 11), self.array)
+        self.assertNotIn(DatePeriod(datetime.date(2019, 12, 1), datetime.date(2020, 1, 2)), self.array)
+
+    def test_sorted(self):
+        self.assertListEqual([int(x) for x in self.array.argsort()], [0, 2, 1, 3])
+
+        res = self.array.sorted()
+        self.assertListEqual(res.to_periods(), sort_periods(self.periods))
+        self.assertListEqual([x.data for x in res], ['p1', 'p3', 'p2', 'p4'])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            PeriodArray([10], [9], use_numpy=self.use_numpy)
+
+        with self.assertRaises(ValueError):
+            PeriodArray([0], [10], use_numpy=self.use_numpy)
+
+        with self.assertRaises(ValueError):
+            PeriodArray([1], [datetime.date.max.toordinal() + 1], use_numpy=self.use_numpy)
+
+        with self.assertRaises(TypeError):
+            self.array.contains(datetime.datetime(2020, 3, 10, 12))
+
+        with self.assertRaises(ValueError):
+            PeriodArray([1, 2], [3], use_numpy=self.use_numpy)
+
+        with self.assertRaises(TypeError):
+            PeriodArray.from_periods([datetime.date(2020, 1, 1)], use_numpy=self.use_numpy)
+
+        with self.assertRaises(TypeError):
+            self.array.is_crossing(datetime.date(2020, 1, 1))
+
+
+@unittest.skipIf(arrays.numpy is None, 'numpy is not installed')
+class NumpyPeriodArrayTest(PeriodArrayTest):
+    use_numpy = True
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+import json
+import mmap
+import tempfile
+
+import unittest
+
+from periods.date.binary import PeriodBuffer
+from periods.date.periods import DatePeriod
+
+
+class PeriodBufferTest(unittest.TestCase):
+    """Тестирование PeriodBuffer"""
+
+    def setUp(self) -> None:
+        self.periods = [
+            DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 25), data={'id': 1}),
+            DatePeriod(datetime.date(2020, 2, 5), datetime.date(2020, 2, 29), data=None),
+            DatePeriod(datetime.date.min, datetime.date.max, data={'id': 3}),
+        ]
+
+    @staticmethod
+    def bounds(periods):
+        return [(x.begin, x.end) for x in periods]
+
+    def test_without_data(self):
+        buffer = PeriodBuffer.from_buffer(PeriodBuffer.to_bytes(self.periods))
+
+        self.assertEqual(len(buffer), 3)
+        self.assertListEqual(self.bounds(buffer), self.bounds(self.periods))
+        self.assertListEqual([x.data for x in buffer], [None, None, None])
+        self.assertEqual(buffer[-1], self.periods[-1])
+        self.assertListEqual(self.bounds(buffer[1:]), self.bounds(self.periods[1:]))
+        self.assertIn(self.periods[1], buffer)
+
+        with self.assertRaises(IndexError):
+            buffer[3]
+
+    def test_data(self):
+        data = PeriodBuffer.to_bytes(self.periods, data_encoder=lambda x: json.dumps(x).encode())
+
+        buffer = PeriodBuffer.from_buffer(data, data_decoder=json.loads)
+        self.assertListEqual([x.data for x in buffer], [x.data for x in self.periods])
+        self.assertListEqual([x.data for x in buffer.to_periods()], [x.data for x in self.periods])
+        self.assertEqual(buffer[2].data, {'id': 3})
+
+        buffer = PeriodBuffer.from_buffer(bytearray(data))
+        self.assertEqual(buffer[1].data, b'null')
+
+    def test_mmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(PeriodBuffer.to_bytes(self.periods * 100, data_encoder=lambda x: json.dumps(x).encode()))
+            f.flush()
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m, \
+                    PeriodBuffer.from_buffer(m, data_decoder=json.loads) as buffer:
+                self.assertEqual(len(buffer), 300)
+                self.assertEqual(buffer[151], self.periods[1])
+                self.assertEqual(buffer[152].data, {'id': 3})
+
+            # После release буфер пуст, а mmap закрыт без BufferError
+            self.assertTrue(m.closed)
+            self.assertEqual(len(buffer), 0)
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                buffer = PeriodBuffer.from_buffer(m)
+                self.assertEqual(len(buffer), 300)
+                buffer.release()
+                buffer.release()
+
+    def test_empty(self):
+        self.assertListEqual(list(PeriodBuffer.from_buffer(PeriodBuffer.to_bytes([]))), [])
+        self.assertListEqual(list(PeriodBuffer.from_buffer(PeriodBuffer.to_bytes([], data_encoder=bytes))), [])
+
+    def test_errors(self):
+        data = PeriodBuffer.to_bytes(self.periods, data_encoder=lambda x: json.dumps(x).encode())
+
+        with self.assertRaises(ValueError):
+            PeriodBuffer.from_buffer(b'XXXX' + data[4:])
+
+        with self.assertRaises(ValueError):
+            PeriodBuffer.from_buffer(data[:20])
+
+        with self.assertRaises(ValueError):
+            PeriodBuffer.from_buffer(data[:-1])
+
+        with self.assertRaises(TypeError):
+            PeriodBuffer.to_bytes([datetime.date(2020, 1, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
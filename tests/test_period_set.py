@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+import random
+
+import unittest
+
+from periods.date.periods import DatePeriod
+from periods.date.sets import MutablePeriodSet, PeriodSet
+from tests.helpers import random_periods
+
+
+class PeriodSetTest(unittest.TestCase):
+    """
+    Тестирование PeriodSet
+
+    p1 (DatePeriod): |=====|                          # 01.01.2020 - 10.01.2020
+    p2 (DatePeriod):     |=====|                      # 05.01.2020 - 15.01.2020
+    p3 (DatePeriod):            |====|                # 16.01.2020 - 20.01.2020
+    p4 (DatePeriod):                      |====|      # 01.02.2020 - 10.02.2020
+
+    PeriodSet([p4, p3, p2, p1]) = [01.01.2020 - 20.01.2020, 01.02.2020 - 10.02.2020]
+    """
+
+    def setUp(self) -> None:
+        self.p1 = DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 10), data='p1')
+        self.p2 = DatePeriod(datetime.date(2020, 1, 5), datetime.date(2020, 1, 15), data='p2')
+        self.p3 = DatePeriod(datetime.date(2020, 1, 16), datetime.date(2020, 1, 20), data='p3')
+        self.p4 = DatePeriod(datetime.date(2020, 2, 1), datetime.date(2020, 2, 10), data='p4')
+
+    def test_normalize(self):
+        res = PeriodSet([self.p4, self.p3, self.p2, self.p1])
+        self.assertListEqual(list(res), [
+            DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 20)),
+            DatePeriod(datetime.date(2020, 2, 1), datetime.date(2020, 2, 10)),
+        ])
+        self.assertListEqual([x.data for x in res], ['p1', 'p4'])
+        self.assertIs(res[1], self.p4)
+        self.assertEqual(len(res), 2)
+        self.assertEqual(res.days(), 30)
+
+        with self.assertRaises(TypeError):
+            PeriodSet([datetime.date(2020, 1, 1)])
+
+    def test_contains(self):
+        res = PeriodSet([self.p1, self.p4])
+        self.assertIn(datetime.date(2020, 1, 10), res)
+        self.assertNotIn(datetime.date(2020, 1, 11), res)
+        self.assertIn(self.p4, res)
+        self.assertNotIn(self.p2, res)
+
+        with self.assertRaises(TypeError):
+            self.assertIn('2020-01-01', res)
+
+        with self.assertRaises(TypeError):
+            self.assertIn(datetime.datetime(2020, 2, 1, 10), res)
+
+    def test_operators(self):
+        s1 = PeriodSet([self.p1, self.p4])
+        s2 = PeriodSet([self.p2])
+
+        self.assertListEqual(list(s1 | s2), [
+            DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 15)),
+            DatePeriod(datetime.date(2020, 2, 1), datetime.date(2020, 2, 10)),
+        ])
+        self.assertListEqual(list(s1 & s2), [
+            DatePeriod(datetime.date(2020, 1, 5), datetime.date(2020, 1, 10)),
+        ])
+        self.assertEqual((s1 & s2)[0].data, 'p1')
+        self.assertListEqual(list(s1 - s2), [
+            DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 4)),
+            DatePeriod(datetime.date(2020, 2, 1), datetime.date(2020, 2, 10)),
+        ])
+        self.assertListEqual(list(s1 ^ s2), [
+            DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 4)),
+            DatePeriod(datetime.date(2020, 1, 11), datetime.date(2020, 1, 15)),
+            DatePeriod(datetime.date(2020, 2, 1), datetime.date(2020, 2, 10)),
+        ])
+
+        self.assertEqual(s1 | self.p3, PeriodSet([self.p1, self.p3, self.p4]))
+        self.assertEqual(s1 - [self.p4], PeriodSet([self.p1]))
+
+        with self.assertRaises(TypeError):
+            s1 | datetime.date(2020, 1, 1)
+
+    def test_days(self):
+        """Сравнение результатов с операциями над множествами дней"""
+        rnd = random.Random(3)
+
+        def days(periods):
+            return {d for p in periods for d in p}
+
+        def check(res, expected):
+            self.assertSetEqual(days(res), expected)
+            for prev, cur in zip(res, list(res)[1:]):
+                self.assertGreater((cur.begin - prev.end).days, 1)
+
+        for _ in range(50):
+            a, b = random_periods(rnd, 8, 200, 20), random_periods(rnd, 8, 200, 20)
+            s1, s2 = PeriodSet(a), PeriodSet(b)
+
+            check(s1, days(a))
+            check(s1 | s2, days(a) | days(b))
+            check(s1 & s2, days(a) & days(b))
+            check(s1 - s2, days(a) - days(b))
+            check(s1 ^ s2, days(a) ^ days(b))
+
+
+class MutablePeriodSetTest(unittest.TestCase):
+    """
+    Тестирование MutablePeriodSet
+
+    s (MutablePeriodSet): |=====|    |=====|     |=====|     # 01.01 - 10.01, 16.01 - 20.01, 01.02 - 10.02
+    add(p):                   |==========|                   # 05.01 - 17.01
+    res:                  |================|     |=====|     # 01.01 - 20.01, 01.02 - 10.02
+    """
+
+    def setUp(self) -> None:
+        self.p1 = DatePeriod(datetime.date(2020, 1, 1), datetime.date(2020, 1, 10), data='p1')
+        self.p2 = DatePeriod(datetime.date(2020, 1, 16), datetime.date(2020, 1, 20), data='p2')
+        self.p3 = DatePeriod(datetime.date(2020, 2, 1), datetime.date(2020, 2, 10), data='p3')
+        self.changes = []
+        self.s = MutablePeriodSet([self.p3, self.p1, self.p2])
+        self.s.subscribe(self.changes.append)
+
+    @staticmethod
+    def bounds(periods):
+        return [(p.begin, p.end) for p in periods]
+
+    def test_add(self):
+        p = DatePeriod(datetime.date(2020, 1, 5), datetime.date(2020, 1, 17), data='p')
+        change = self.s.add(p)
+
+        self.assertListEqual(self.bounds(self.s), [(datetime.date(2020, 1, 1), datetime.date(2020, 1, 20)),
+                                                   (datetime.date(2020, 2, 1), datetime.date(2020, 2, 10))])
+        self.assertEqual(self.s[0].data, 'p1')
+        self.assertListEqual(change.removed, [self.p1, self.p2])
+        self.assertListEqual(change.added, [self.s[0]])
+        self.assertListEqual(self.changes, [change])
+
+        # Смежный период склеивается, вложенный не изменяет набор
+        self.s.add(DatePeriod(datetime.date(2020, 1, 21), datetime.date(2020, 1, 31)))
+        self.assertEqual(len(self.s), 1)
+        self.assertEqual(self.s.add(DatePeriod(datetime.date(2020, 1, 3), datetime.date(2020, 1, 4))), ([], []))
+        self.assertEqual(len(self.changes), 2)
+
+        p = DatePeriod(datetime.date(2020, 3, 1), datetime.date(2020, 3, 1))
+        self.assertEqual(self.s.add(p), ([p], []))
+        self.assertIs(self.s[-1], p)
+
+        with self.assertRaises(TypeError):
+            self.s.add(datetime.date(2020, 1, 1))
+
+    def test_discard(self):
+        change = self.s.discard(DatePeriod(datetime.date(2020, 1, 5), datetime.date(2020, 2, 1)))
+        self.assertListEqual(self.bounds(self.s), [(datetime.date(2020, 1, 1), datetime.date(2020, 1, 4)),
+                                                   (datetime.date(2020, 2, 2), datetime.date(2020, 2, 10))])
+        self.assertListEqual([p.data for p in self.s], ['p1', 'p3'])
+        self.assertListEqual(change.removed, [self.p1, self.p2, self.p3])
+        self.assertListEqual(change.added, list(self.s))
+
+        self.assertEqual(self.s.discard(DatePeriod(datetime.date(2020, 1, 10), datetime.date(2020, 1, 20))),
+                         ([], []))
+        self.assertEqual(len(self.changes), 1)
+
+    def test_remove(self):
+        self.s.remove(DatePeriod(datetime.date(2020, 1, 3), datetime.date(2020, 1, 4)))
+        self.assertEqual(len(self.s), 4)
+
+        with self.assertRaises(ValueError):
+            self.s.remove(DatePeriod(datetime.date(2020, 1, 10), datetime.date(2020, 1, 16)))
+
+        self.s.unsubscribe(self.changes.append)
+        self.s.remove(self.p3)
+        self.assertEqual(len(self.changes), 1)
+
+    def test_operations(self):
+        res = self.s | [DatePeriod(datetime.date(2020, 1, 11), datetime.date(2020, 1, 15))]
+        self.assertIsInstance(res, MutablePeriodSet)
+        res.add(DatePeriod(datetime.date(2020, 1, 21), datetime.date(2020, 1, 31)))
+        self.assertListEqual(self.bounds(res), [(datetime.date(2020, 1, 1), datetime.date(2020, 2, 10))])
+        self.assertEqual(len(self.s), 3)
+
+    def test_random(self):
+        rnd = random.Random(17)
+        begin = datetime.date(2020, 1, 1)
+        s = MutablePeriodSet()
+        days = set()
+
+        for _ in range(500):
+            b = begin + datetime.timedelta(days=rnd.randint(0, 100))
+            p = DatePeriod(b, b + datetime.timedelta(days=rnd.randint(0, 10)))
+            if rnd.random() < 0.6:
+                s.add(p)
+                days.update(p)
+            else:
+                s.discard(p)
+                days.difference_update(p)
+
+            self.assertEqual(s, PeriodSet([DatePeriod(d, d) for d in days]))
+            self.assertListEqual(s._begins, [p._begin for p in s])
+            self.assertListEqual(s._ends, [p._end for p in s])
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+import os
+import random
+import shutil
+import tempfile
+
+import unittest
+
+from periods.date.periods import DatePeriod, sort_periods
+from periods.date.store import PeriodStore
+from tests.helpers import random_period
+
+
+class PeriodStoreTest(unittest.TestCase):
+    """
+    Тестирование PeriodStore
+
+    Результаты запросов сравниваются с полным перебором периодов.
+    """
+
+    def setUp(self) -> None:
+        self.begin = datetime.date(2020, 1, 1)
+        self.rnd = random.Random(7)
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'periods.bin')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.dir)
+
+    def make(self) -> DatePeriod:
+        return random_period(self.rnd, length=(0, 3, 10, 40, 200))
+
+    @staticmethod
+    def bounds(periods):
+        return [(x.begin, x.end) for x in periods]
+
+    def check(self, store, periods):
+        periods = sort_periods(periods)
+
+        self.assertEqual(len(store), len(periods))
+        self.assertListEqual(self.bounds(store), self.bounds(periods))
+        self.assertListEqual([x.data for x in store], list(range(len(periods))))
+
+        for _ in range(50):
+            query = self.make()
+            self.assertListEqual(self.bounds(store.overlapping(query)),
+                                 self.bounds(x for x in periods if x.is_crossing(query)))
+
+            day = query.begin
+            self.assertListEqual(self.bounds(store.containing(day)), self.bounds(x for x in periods if day in x))
+
+    def test_create(self):
+        periods = [self.make() for _ in range(500)]
+
+        with PeriodStore.create(self.path, periods, block_size=16) as store:
+            self.check(store, periods)
+            self.assertEqual(store[-1].data, 499)
+
+        # Повторное открытие с другим размером блока
+        with PeriodStore(self.path, block_size=7) as store:
+            self.check(store, periods)
+            self.assertListEqual(store.containing(datetime.date(2030, 1, 1)), [])
+
+            with self.assertRaises(TypeError):
+                store.containing(datetime.datetime(2030, 1, 1, 12))
+
+    def test_append(self):
+        periods = sort_periods(self.make() for _ in range(300))
+
+        with PeriodStore(self.path, block_size=10) as store:
+            self.assertEqual(len(store), 0)
+            self.assertListEqual(store.overlapping(periods[0]), [])
+
+            store.extend(periods[:95])
+            for p in periods[95:200]:
+                store.append(p)
+            self.check(store, periods[:200])
+
+        with PeriodStore(self.path, block_size=10) as store:
+            store.extend(iter(periods[200:]))
+            self.check(store, periods)
+
+            with self.assertRaises(ValueError):
+                store.append(DatePeriod(self.begin, self.begin))
+            self.assertEqual(len(store), 300)
+
+    def test_errors(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'XXXX\x01\x00\x00\x00')
+
+        with self.assertRaises(ValueError):
+            PeriodStore(self.path)
+
+        with open(self.path, 'wb') as f:
+            f.write(b'PRDT\x01\x00\x00\x00\x01')
+
+        with self.assertRaises(ValueError):
+            PeriodStore(self.path)
+
+        with self.assertRaises(ValueError):
+            PeriodStore(self.path, block_size=0)
+
+        with PeriodStore.create(self.path, []) as store:
+            with self.assertRaises(TypeError):
+                store.append(datetime.date(2020, 1, 1))
+
+            with self.assertRaises(TypeError):
+                store.overlapping(datetime.date(2020, 1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import datetime
+
+import unittest
+
+from periods.date.periods import DatePeriod, FrozenDatePeriod
+from periods.date.profiling import OPERATIONS, Profiler, profile
+
+
+class ProfilerTest(unittest.TestCase):
+    """Тестирование Profiler"""
+
+    def setUp(self) -> None:
+        d = datetime.date(2020, 1, 1)
+        self.p1 = DatePeriod(d, d + datetime.timedelta(days=10))
+        self.p2 = DatePeriod(d + datetime.timedelta(days=5), d + datetime.timedelta(days=20))
+
+    def tearDown(self) -> None:
+        self.assertIsNone(Profiler._active)
+
+    def test_counts(self):
+        with profile() as profiler:
+            self.p1 - self.p2
+            self.p1.split(self.p2)
+            self.p1.split(self.p2)
+            DatePeriod.circle_add([self.p1, self.p2], [self.p2])
+
+        stats = profiler.stats()
+        self.assertEqual(stats['__sub__'].calls, 1)
+        self.assertEqual(stats['split'].calls, 2)
+        self.assertEqual(stats['circle_add'].calls, 1)
+        # Вложенные вызовы тоже учитываются
+        self.assertEqual(stats['__add__'].calls, 2)
+        self.assertNotIn('circle_sub', stats)
+        self.assertGreaterEqual(stats['circle_add'].time, 0)
+
+        # После выключения вызовы не учитываются
+        self.p1.split(self.p2)
+        self.assertEqual(profiler.stats()['split'].calls, 2)
+
+    def test_restore(self):
+        originals = {name: DatePeriod.__dict__[name] for name in OPERATIONS}
+
+        with profile():
+            self.assertIsNot(DatePeriod.__dict__['split'], originals['split'])
+            frozen = FrozenDatePeriod(self.p1.begin, self.p1.end)
+            self.assertEqual(len(DatePeriod.circle_sub([frozen], [self.p2])), 1)
+
+        for name in OPERATIONS:
+            self.assertIs(DatePeriod.__dict__[name], originals[name])
+
+        with self.assertRaises(ZeroDivisionError):
+            with profile():
+                1 / 0
+        self.assertIs(DatePeriod.__dict__['split'], originals['split'])
+
+    def test_streaming_and_constructors(self):
+        with profile() as profiler:
+            res = DatePeriod.iter_circle_sub([self.p1], [self.p2])
+            self.assertEqual(profiler.stats()['iter_circle_sub'].calls, 1)
+            self.assertListEqual(list(res), DatePeriod.circle_sub([self.p1], [self.p2]))
+
+            list(DatePeriod.iter_circle_add([self.p1], [self.p2]))
+            DatePeriod.crossing_pairs([self.p1], [self.p2])
+            periods = FrozenDatePeriod.from_iso_strings([('2020-01-01', '2020-01-05')])
+            DatePeriod.from_records([(self.p1.begin, self.p1.end)])
+            DatePeriod.from_ordinals([self.p1._begin], [self.p1._end])
+
+        stats = profiler.stats()
+        for name in ('iter_circle_sub', 'iter_circle_add', 'crossing_pairs',
+                     'from_iso_strings', 'from_records', 'from_ordinals'):
+            self.assertEqual(stats[name].calls, 1, name)
+        self.assertIs(type(periods[0]), FrozenDatePeriod)
+        self.assertGreater(stats['iter_circle_sub'].time, 0)
+
+    def test_operations(self):
+        with profile(['is_crossing']) as profiler:
+            self.p1.is_crossing(self.p2)
+            self.p1.crossing(self.p2)
+        self.assertListEqual(list(profiler.stats()), ['is_crossing'])
+
+        with self.assertRaises(ValueError):
+            Profiler(['days'])
+
+    def test_single_active(self):
+        with profile():
+            with self.assertRaises(RuntimeError):
+                profile().enable()
+
+    def test_as_dict(self):
+        with profile() as profiler:
+            self.p1.crossing(self.p2)
+            self.p1 in self.p2
+
+        res = profiler.as_dict(prefix='periods')
+        self.assertSetEqual(set(res), {'periods.crossing.calls', 'periods.crossing.time',
+                                       'periods.__contains__.calls', 'periods.__contains__.time'})
+        self.assertEqual(res['periods.crossing.calls'], 1)
+
+        profiler.reset()
+        self.assertDictEqual(profiler.as_dict(), {})